@@ -0,0 +1,78 @@
+"""Compare blit throughput of raw and premultiplied particle images.
+
+The scenes mimic the particles of the demos.  For every scene, the same
+images are blitted
+
+    raw:            SRCALPHA surfaces with a surface alpha, as returned by the
+                    image factories in `swirlyswirls.particles`
+    premultiplied:  converted by `swirlyswirls.images.to_display_premultiplied`
+                    and blitted with `BLEND_PREMULTIPLIED`
+
+Run with
+
+    python benchmarks/blit_formats.py [--blits N] [--visible]
+
+By default, the SDL dummy video driver is used, so no window opens.
+
+"""
+import argparse
+import os
+import sys
+import time
+
+from random import random, seed
+
+
+def scene_images(particles):
+    """Images as the demos create them, (size, alpha) spread over lifetime."""
+    lifetime = [i / 31 for i in range(32)]
+    return {
+        'explosions': [particles.firesquabble_image_factory(max(1, 64 * (1 / 4 + 3 / 4 * t)), 255 * (1 - t))
+                       for t in lifetime],
+        'pond': [particles.waterbubble_image_factory(max(2, 10 * (1 / 2 + t / 2)), 255 * (1 - t))
+                 for t in lifetime],
+        'beam': [particles.watersquabble_image_factory(max(1, 16 * (1 - 7 / 8 * t)), 255 * (1 - t))
+                 for t in lifetime],
+    }
+
+
+def bench(screen, images, blits, special_flags=0):
+    w, h = screen.get_size()
+    n = len(images)
+    positions = [(random() * w, random() * h) for _ in range(blits)]
+
+    t0 = time.perf_counter()
+    for i, pos in enumerate(positions):
+        screen.blit(images[i % n], pos, special_flags=special_flags)
+    return blits / (time.perf_counter() - t0)
+
+
+def main():
+    cmdline = argparse.ArgumentParser(description='Particle blit benchmark')
+    cmdline.add_argument('--blits', type=int, default=200_000, help='Blits per run')
+    cmdline.add_argument('--visible', action='store_true', help='Use the real video driver')
+    opts = cmdline.parse_args(sys.argv[1:])
+
+    if not opts.visible:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+    import pygame
+    import swirlyswirls.particles
+    from swirlyswirls.images import to_display_premultiplied
+
+    pygame.init()
+    screen = pygame.display.set_mode((1024, 768))
+    seed(42)
+
+    print(f'{"scene":<12} {"raw/s":>12} {"premul/s":>12} {"speedup":>8}')
+    for name, raw in scene_images(swirlyswirls.particles).items():
+        premul = [to_display_premultiplied(image) for image in raw]
+
+        raw_rate = bench(screen, raw, opts.blits)
+        premul_rate = bench(screen, premul, opts.blits, pygame.BLEND_PREMULTIPLIED)
+
+        print(f'{name:<12} {raw_rate:>12.0f} {premul_rate:>12.0f} {premul_rate / raw_rate:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
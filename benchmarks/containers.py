@@ -0,0 +1,81 @@
+"""Compare the per-entity `container_system` with `Containment.run`.
+
+A scene of bouncing sprites in one container is created in tinyecs.  Every
+frame, the sprites are moved outside of the timing, then the full path is
+timed: `tinyecs.run_system` with `container_system`, and `Containment.run`,
+including its collection of the entities.
+
+Run with
+
+    python benchmarks/containers.py [--bodies N] [--frames N]
+
+"""
+import argparse
+import os
+import sys
+import time
+
+from random import random, seed
+
+
+def scene(ecs, pygame, container, n):
+    for _ in range(n):
+        sprite = pygame.sprite.Sprite()
+        sprite.rect = pygame.FRect(0, 0, 8, 8)
+        e = ecs.create_entity()
+        ecs.add_component(e, 'container', container)
+        ecs.add_component(e, 'position', pygame.Vector2(random() * container.width,
+                                                        random() * container.height))
+        ecs.add_component(e, 'momentum', pygame.Vector2(random() * 400 - 200, random() * 400 - 200))
+        ecs.add_component(e, 'sprite', sprite)
+
+
+def step(dt, eid, momentum, position, sprite):
+    position += momentum * dt
+    sprite.rect.center = position
+
+
+def bench(ecs, run, frames, dt):
+    t = 0
+    for _ in range(frames):
+        ecs.run_system(dt, step, 'momentum', 'position', 'sprite')
+        t0 = time.perf_counter()
+        run(dt)
+        t += time.perf_counter() - t0
+    return t / frames
+
+
+def main():
+    cmdline = argparse.ArgumentParser(description='Container collision benchmark')
+    cmdline.add_argument('--bodies', type=int, default=10_000, help='Number of entities')
+    cmdline.add_argument('--frames', type=int, default=100, help='Frames to simulate')
+    opts = cmdline.parse_args(sys.argv[1:])
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+    import pygame
+    import tinyecs as ecs
+    import swirlyswirls.compsys as compsys
+
+    container = pygame.Rect(0, 0, 1024, 768)
+    dt = 1 / 60
+
+    def per_entity(dt):
+        ecs.run_system(dt, compsys.container_system, 'container', 'position', 'momentum', 'sprite')
+
+    seed(42)
+    scene(ecs, pygame, container, opts.bodies)
+    direct = bench(ecs, per_entity, opts.frames, dt)
+
+    ecs.reset()
+    seed(42)
+    scene(ecs, pygame, container, opts.bodies)
+    batched = bench(ecs, compsys.Containment().run, opts.frames, dt)
+
+    print(f'{"system":<12} {"ms/frame":>10}')
+    print(f'{"per-entity":<12} {direct * 1000:>10.2f}')
+    print(f'{"Containment":<12} {batched * 1000:>10.2f}   {direct / batched:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
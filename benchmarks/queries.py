@@ -0,0 +1,71 @@
+"""Compare `tinyecs.run_system` with the cached queries of `QueryCache`.
+
+A scene of particles and a few emitters is created, then a momentum system
+(matching most entities) and an emitter-like system (matching very few) are
+run over it, once through tinyecs and once through the cache.
+
+Run with
+
+    python benchmarks/queries.py [--particles N] [--frames N]
+
+"""
+import argparse
+import sys
+import time
+
+
+def momentum_system(dt, eid, momentum, position):
+    position += momentum * dt
+
+
+def emitter_system(dt, eid, emitter, position):
+    pass
+
+
+def scene(cache, pygame, particles, emitters):
+    for i in range(particles):
+        cache.create_entity({
+            'position': pygame.Vector2(i, 0),
+            'momentum': pygame.Vector2(1, 1),
+            'lifetime': i,
+            'particle': i,
+        })
+    for i in range(emitters):
+        cache.create_entity({
+            'position': pygame.Vector2(i, 0),
+            'emitter': i,
+        })
+
+
+def bench(run, frames):
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        run(1 / 60, momentum_system, 'momentum', 'position')
+        run(1 / 60, emitter_system, 'emitter', 'position')
+    return (time.perf_counter() - t0) / frames
+
+
+def main():
+    cmdline = argparse.ArgumentParser(description='Query cache benchmark')
+    cmdline.add_argument('--particles', type=int, default=10_000, help='Number of particles')
+    cmdline.add_argument('--emitters', type=int, default=10, help='Number of emitters')
+    cmdline.add_argument('--frames', type=int, default=100, help='Frames to run')
+    opts = cmdline.parse_args(sys.argv[1:])
+
+    import pygame
+    import tinyecs as ecs
+    from swirlyswirls.queries import QueryCache
+
+    cache = QueryCache()
+    scene(cache, pygame, opts.particles, opts.emitters)
+
+    direct = bench(ecs.run_system, opts.frames)
+    cached = bench(cache.run_system, opts.frames)
+
+    print(f'{"dispatch":<10} {"ms/frame":>10}')
+    print(f'{"tinyecs":<10} {direct * 1000:>10.2f}')
+    print(f'{"cached":<10} {cached * 1000:>10.2f}   {direct / cached:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,9 @@ swirly-demo beam
 swirly-demo bullet
 swirly-demo drops
 swirly-demo explosions
+swirly-demo instanced
 swirly-demo point
 swirly-demo pond
 swirly-demo rain
 swirly-demo rsai
+swirly-demo spiral
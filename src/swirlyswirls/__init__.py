@@ -136,5 +136,12 @@ run `swirlyswirl-demo`, and inspect the `swirlyswirls.bubbles` module.
 
 """
 # flake8: noqa
-from .compsys import Emitter, Particle, emitter_system, particle_system
-from .spritegroup import ReversedGroup
+from .compsys import Emitter, Particle, Dormancy, Ballistic, Visibility, Containment, emitter_system, particle_system
+from .family import Family
+from .patterns import Pattern, PatternEmitter, pattern_system
+from .pool import EmitterPool, ParticlePool
+from .queries import QueryCache
+from .simulation import Simulation
+from .snapshot import Snapshot
+from .spritegroup import ReversedGroup, PremultipliedGroup, InstancedGroup, BallisticGroup
+from .subemitter import SubEmitter, sub_emitter_system
@@ -1,16 +1,26 @@
+import pygame
 import tinyecs as ecs
 import swirlyswirls.zones
 
-from dataclasses import dataclass, InitVar
-from itertools import cycle
+from dataclasses import dataclass, field
+from itertools import count, cycle
+from time import perf_counter
 
 from pgcooldown import Cooldown, LerpThing
 from pygame import Vector2
 
+from swirlyswirls.family import Family
+
 _lerp     = lambda a, b, t: (1 - t) * a + b * t
 
+# Spreads the particles over the shards of `particle_rsai_system`
+_shard_phase = count()
 
-@dataclass(kw_only=True)
+# Default of `Emitter.reset`, to tell "keep it" from `None`
+KEEP = object()
+
+
+@dataclass(kw_only=True, slots=True)
 class Emitter:
     """Data for the `emitter_system`.
 
@@ -43,14 +53,16 @@ class Emitter:
                 down for the remainder of the time.
 
     tick : float = 0.1
-        The heartbeat of the emitter.
+        The heartbeat of the emitter.  Turned into a `Cooldown` on init.
 
-    ticklist: list[float]
+    ticklist: list[float] = None
         Change the heartbeat every time it fires.  This list cycles.  Use it
         for bullet stacking in patterns, e.g.
 
             [5/60, 5/60, 5/60, 1]
 
+        See `swirlyswirls.patterns` for more complex patterns.
+
 
     total_emits: int = None
         if set, limit the total number of emits.  If the emitter is exhausted,
@@ -82,19 +94,104 @@ class Emitter:
             2: zone only
             3: emitter + zone (default)
 
+    catchup: int = 1
+        The maximum number of overdue heartbeats to fire at once.
+
+        If the `emitter_system` runs less often than `tick` (e.g. on a frame
+        spike, or with a short `tick` in a `Simulation` with a low rate), the
+        overdue heartbeats are fired in a single batch, up to this limit.
+        Anything beyond is dropped.
+
+    dormant: bool = False
+        A dormant emitter doesn't emit.  See `Dormancy`.
+
+    family: swirlyswirls.family.Family = None
+        If set, every particle is registered as a child of the emitter
+        entity.  The particle factory needs to return the EID of the particle
+        for this.
+
+    phase: int
+        The position in `ticklist` of the next heartbeat.  Advanced by
+        `next_tick`.
+
+    Emitters are slotted, so they stay small.  To launch the same emitter
+    again, re-arm it with `reset` instead of building a new one, or use a
+    `swirlyswirls.pool.EmitterPool`.
+
     """
     ept: LerpThing
-    tick: InitVar[float] = 0.1
-    ticklist: InitVar[list[float]]
-    total_emits: InitVar[int] = None
+    tick: float | Cooldown = 0.1
+    ticklist: list[float] = None
+    total_emits: int = None
     zone: swirlyswirls.zones.Zone
     particle_factory: callable
     inherit_momentum: int = 3
-
-    def __post_init__(self, tick, ticklist, total_emits):
+    catchup: int = 1
+    dormant: bool = False
+    family: Family = None
+    ticker: cycle = field(init=False, repr=False)
+    phase: int = field(init=False, repr=False)
+    _ept_values: tuple = field(init=False, repr=False)
+    remaining: int = field(init=False)
+
+    def __post_init__(self):
+        tick = self.tick
         self.tick = Cooldown(tick, cold=True)
-        self.ticker = cycle(ticklist) if ticklist else cycle([tick])
-        self.remaining = total_emits if total_emits is not None else -1
+        self.ticker = cycle(self.ticklist) if self.ticklist else cycle([tick])
+        self.phase = 0
+        self._ept_values = (self.ept.vt0, self.ept.vt1)
+        self.remaining = self.total_emits if self.total_emits is not None else -1
+
+    def reset(self, ept=None, total_emits=KEEP):
+        """Re-arm the emitter, as if it was just created.
+
+        The emit duration and the ticklist start over, and the first heartbeat
+        fires right away.
+
+        Parameters
+        ----------
+        ept: LerpThing = None
+            A new `ept`.  If `None`, the current one is restarted, including
+            its repeats, and a bouncing lerp is turned back to its original
+            direction.
+
+        total_emits: int = KEEP
+            A new `total_emits`, `None` for unlimited emits.  By default, the
+            current one is used again.
+
+        """
+        if ept is None:
+            ept = self.ept
+            ept.vt0, ept.vt1 = self._ept_values
+            if hasattr(ept, 'reset'):
+                ept.reset()
+            else:
+                ept.duration.reset()
+        else:
+            self.ept = ept
+            self._ept_values = (ept.vt0, ept.vt1)
+
+        if total_emits is not KEEP:
+            self.total_emits = total_emits
+        self.remaining = self.total_emits if self.total_emits is not None else -1
+
+        if self.ticklist:
+            self.ticker = cycle(self.ticklist)
+        self.phase = 0
+        self.tick.remaining = 0
+        self.dormant = False
+
+    def next_tick(self):
+        """The next heartbeat from the ticker."""
+        if self.ticklist:
+            self.phase = (self.phase + 1) % len(self.ticklist)
+        return next(self.ticker)
+
+    def seek_tick(self, phase):
+        """Continue the ticklist at position `phase`, e.g. after a restore."""
+        if self.ticklist:
+            self.phase = phase % len(self.ticklist)
+            self.ticker = cycle(self.ticklist[self.phase:] + self.ticklist[:self.phase])
 
 
 def emitter_system(dt, eid, emitter, position):
@@ -105,10 +202,12 @@ def emitter_system(dt, eid, emitter, position):
     It's center configuration is the emitter object:
 
     On each `tick`, a number of entities are launched until `total_emits` is
-    reached or `duration` has passed.
+    reached or `duration` has passed.  If several ticks have passed since the
+    last call, up to `emitter.catchup` of them are launched in one batch.
 
-    For every entity, the `emiter.zone` function is called without parameters.
-    It is expected to return
+    All entities of a tick are requested at once by calling
+    `emiter.zone.emit_many` (see `swirlyswirls.zones.Zone`).  For every
+    entity, it is expected to return
 
         1. a `position` Vector2,
         2. a `momentum` Vector2.
@@ -144,14 +243,30 @@ def emitter_system(dt, eid, emitter, position):
 
     """
 
-    if emitter.tick.hot:
+    if emitter.dormant or emitter.tick.hot:
         return
 
-    emitter.tick.reset(next(emitter.ticker))
+    # Fire all overdue heartbeats, keeping the phase of the ticker.  If there
+    # are more than `catchup`, the remainder is dropped.
+    due = 0
+    while emitter.tick.cold and due < emitter.catchup:
+        emitter.tick.reset(emitter.next_tick(), wrap=True)
+        due += 1
+    if emitter.tick.cold:
+        emitter.tick.reset()
 
     if emitter.remaining == 0:
         return
 
+    t = _emitter_t(eid, emitter)
+    if t is None:
+        return
+
+    _launch(eid, emitter, position, t, int(emitter.ept()) * due)
+
+
+def _emitter_t(eid, emitter):
+    """The normalized emit time of the emitter, or None if it's done."""
     ept = emitter.ept
     # If we have a valid duration and it's cold, simply return
     # If we have a valid duration that's hot, get t from it
@@ -159,17 +274,54 @@ def emitter_system(dt, eid, emitter, position):
     # Finally, if all fails, default t to 0
     if ept.duration.duration:
         if ept.duration.cold:
-            return
+            return None
         else:
-            t = ept.duration.normalized
+            return ept.duration.normalized
     else:
         if ecs.eid_has(eid, 'lifetime'):
-            t = ecs.comp_of_eid(eid, 'lifetime').normalized
+            return ecs.comp_of_eid(eid, 'lifetime').normalized
         else:
-            t = 0
+            return 0
+
+
+def _age_cooldown(cooldown, age):
+    cooldown.remaining = max(0, cooldown.remaining - age)
+
+
+def age_particle(eid, age):
+    """Make a freshly created particle `age` seconds old.
 
-    emits = int(ept())
+    Its `lifetime` and the lerps of its `particle` component are advanced by
+    `age`.  Used to place particles that were due between two frames, see
+    `emitter_system`.
 
+    Parameters
+    ----------
+    eid: EID
+        The particle entity.
+
+    age: float
+        The age in seconds.
+
+    """
+    if ecs.eid_has(eid, 'lifetime'):
+        _age_cooldown(ecs.comp_of_eid(eid, 'lifetime'), age)
+    if ecs.eid_has(eid, 'particle'):
+        particle = ecs.comp_of_eid(eid, 'particle')
+        for lerp in (particle.rotate, particle.scale, particle.alpha):
+            if lerp is not None:
+                _age_cooldown(lerp.duration, age)
+
+
+def _launch(eid, emitter, position, t, emits, age=0):
+    """Launch `emits` particles from the emitter.
+
+    With an `age` > 0, the particles are placed where they would be, had they
+    been launched `age` seconds ago, moving in a straight line.  If the
+    particle factory returns the EID of the particle, its `lifetime` and the
+    lerps of its `particle` are aged too.
+
+    """
     if emitter.remaining > 0:
         emits = min(emits, emitter.remaining)
         emitter.remaining -= emits
@@ -179,16 +331,159 @@ def emitter_system(dt, eid, emitter, position):
     else:
         e_momentum = Vector2(0, 0)
 
-    for i in range(emits):
-        z_position, z_momentum = emitter.zone.emit(t)
+    if age:
+        # The emitter itself was somewhere else back then
+        position = position - e_momentum * age
 
+    family = emitter.family
+    for z_position, z_momentum in emitter.zone.emit_many(emits, t):
         momentum = Vector2()
         if emitter.inherit_momentum & 1:
             momentum += e_momentum
         if emitter.inherit_momentum & 2:
             momentum += z_momentum
 
-        emitter.particle_factory(t=t, position=position + z_position, momentum=momentum)
+        if not age:
+            p_eid = emitter.particle_factory(t=t, position=position + z_position, momentum=momentum)
+        else:
+            p_eid = emitter.particle_factory(t=t, position=position + z_position + momentum * age,
+                                             momentum=momentum)
+            if p_eid is not None:
+                age_particle(p_eid, age)
+
+        if family is not None and p_eid is not None:
+            family.adopt(eid, p_eid)
+
+
+@dataclass(kw_only=True)
+class Dormancy:
+    """Put an emitter to sleep while it's outside the viewport.
+
+    Emitters outside the camera still spawn particles nobody sees.  Add this
+    as `dormancy` component to an emitter entity, and the
+    `emitter_dormancy_system` stops the emitter while its zone and the reach
+    of its particles are outside the viewport.
+
+    On re-entry, the emitter is repopulated as if it had been running all the
+    time:  For every heartbeat within the last particle `lifetime`, particles
+    are launched with the `t` and emits per tick the emitter had back then,
+    and moved along their momentum by their age.  For this to
+    also age their `lifetime` and `particle` components, the particle factory
+    needs to return the EID of the particle, like `swirlyswirls.ParticlePool`
+    and `swirlyswirls.utils.particle_entity_factory` do.
+
+    This is an approximation.  Particles that don't move in a straight line
+    with exactly the momentum they were created with will end up elsewhere.
+
+    Parameters
+    ----------
+    viewport: pygame.Rect
+        The visible area in world coordinates.  This is only referenced, so
+        move the rect of your camera and all emitters follow.
+
+    reach: float
+        The maximum distance a particle travels over its lifetime.
+
+    lifetime: float
+        The lifetime of the particles.  Particles older than this are not
+        repopulated.
+
+    Attributes
+    ----------
+    asleep: bool
+        The current state.
+
+    slept: float
+        The time the emitter has been asleep, if it is.
+
+    """
+    viewport: pygame.Rect
+    reach: float = 0
+    lifetime: float = 0
+    asleep: bool = False
+    slept: float = 0
+
+
+def emitter_dormancy_system(dt, eid, emitter, position, dormancy):
+    """Put emitters outside the viewport to sleep, and wake them up again.
+
+    See `Dormancy`.  Run this before the `emitter_system`.
+
+    Emitters with zones that don't know their `bounds` never sleep.
+
+    Parameters
+    ----------
+    emitter: swirlyswirls.Emitter
+        The emitter to put to sleep.
+
+    position: Vector2
+        Position of the emitter
+
+    dormancy: Dormancy
+        Sleep configuration and state
+
+    """
+    bounds = emitter.zone.bounds(0)
+    if bounds is None:
+        return
+
+    reach = dormancy.reach
+    bounds = bounds.move(position).inflate(2 * reach, 2 * reach)
+    outside = not dormancy.viewport.colliderect(bounds)
+
+    if outside:
+        if not dormancy.asleep:
+            dormancy.asleep = emitter.dormant = True
+            dormancy.slept = 0
+        dormancy.slept += dt
+        return
+
+    if not dormancy.asleep:
+        return
+
+    dormancy.asleep = emitter.dormant = False
+    emitter.tick.reset(emitter.next_tick())
+
+    t = _emitter_t(eid, emitter)
+    if t is None or emitter.remaining == 0:
+        return
+
+    # Repopulate, oldest particles first.  The heartbeats are spread over the
+    # window backwards from now, each with the `t` and emits it had back then.
+    window = min(dormancy.slept, dormancy.lifetime)
+    ages = []
+    age = 0
+    while age < window:
+        ages.append(age)
+        tick = emitter.next_tick()
+        if tick <= 0:
+            break
+        age += tick
+
+    for age in reversed(ages):
+        t = _emitter_t_ago(eid, emitter, age)
+        _launch(eid, emitter, position, t, int(_ept_at(emitter.ept, t)), age)
+
+
+def _emitter_t_ago(eid, emitter, age):
+    """The normalized emit time of the emitter `age` seconds ago."""
+    cooldown = emitter.ept.duration
+    if not cooldown.duration:
+        if not ecs.eid_has(eid, 'lifetime'):
+            return 0
+        cooldown = ecs.comp_of_eid(eid, 'lifetime')
+        if not cooldown.duration:
+            return 0
+
+    elapsed = cooldown.duration - cooldown.remaining - age
+    return min(1, max(0, elapsed / cooldown.duration))
+
+
+def _ept_at(ept, t):
+    """The emits per tick of `ept` at `t`."""
+    if not ept.duration.duration:
+        return ept.vt0
+    return _lerp(ept.vt0, ept.vt1, ept.ease(t))
 
 
 @dataclass(kw_only=True)
@@ -209,10 +504,102 @@ class Particle:
     alpha: LerpThing
         Management of alpha
 
+    eager: bool = False
+        Update the image on every frame, even if the `particle_rsai_system`
+        is sharded.  Use this for particles with fast changing curves.
+
     """
     rotate: LerpThing = None
     scale: LerpThing = None
     alpha: LerpThing = None
+    eager: bool = False
+    _countdown: int = field(default=-1, init=False, repr=False)
+    _pushed: tuple = field(default=None, init=False, repr=False)
+    _fade: list = field(default=None, init=False, repr=False)
+
+    def reset(self):
+        """Restart all lerps, e.g. when recycling the particle."""
+        for lerp in (self.rotate, self.scale, self.alpha):
+            if lerp is not None:
+                lerp.duration.reset()
+        self._countdown = -1
+        self._pushed = None
+        self._fade = None
+
+
+class Ballistic:
+    """Closed form straight line or parabolic motion.
+
+    Most particles just fly in a straight line with a constant momentum.
+    Integrating their position on every frame is wasted work, and the
+    accumulated `dt` steps drift.  A ballistic particle only stores where and
+    when it was launched, and computes its position on demand:
+
+        position = origin + velocity * age + acceleration * age**2 / 2
+
+    Use it instead of the `momentum` and `position` components, together
+    with `swirlyswirls.BallisticGroup`, which computes positions only for the
+    sprites it actually draws.  If other systems need a `position`, run the
+    `ballistic_system` on them.
+
+    The clock is `Ballistic.clock`, `time.perf_counter` by default.  Replace
+    it on the class, e.g. with the time of a fixed step simulation.
+
+    Parameters
+    ----------
+    origin: Vector2
+        Launch position
+
+    velocity: Vector2
+        Launch momentum
+
+    acceleration: Vector2 = None
+        An optional constant acceleration, e.g. gravity
+
+    born: float = None
+        Launch time.  If `None`, now.
+
+    """
+    __slots__ = ('x0', 'y0', 'vx', 'vy', 'ax', 'ay', 'born')
+
+    clock = staticmethod(perf_counter)
+
+    def __init__(self, origin, velocity, acceleration=None, born=None):
+        self.launch(origin, velocity, acceleration, born)
+
+    def launch(self, origin, velocity, acceleration=None, born=None):
+        """Restart from a new origin, e.g. when recycling the particle."""
+        self.x0, self.y0 = origin
+        self.vx, self.vy = velocity
+        self.ax, self.ay = acceleration if acceleration is not None else (0, 0)
+        self.born = self.clock() if born is None else born
+
+    def at(self, now):
+        """The position at time `now`, as tuple."""
+        age = now - self.born
+        h = age * age / 2
+        return (self.x0 + self.vx * age + self.ax * h,
+                self.y0 + self.vy * age + self.ay * h)
+
+    @property
+    def position(self):
+        """The current position, as tuple."""
+        return self.at(self.clock())
+
+    @property
+    def momentum(self):
+        """The current momentum, as tuple."""
+        age = self.clock() - self.born
+        return (self.vx + self.ax * age, self.vy + self.ay * age)
+
+
+def ballistic_system(dt, eid, ballistic, position):
+    """Write the closed form position of a `Ballistic` into `position`.
+
+    Only needed if other systems depend on the `position` component.
+
+    """
+    position.update(ballistic.position)
 
 
 def particle_system(dt, eid, particle):
@@ -220,7 +607,69 @@ def particle_system(dt, eid, particle):
     pass
 
 
-def particle_rsai_system(dt, eid, particle, rsai):
+class RSAQuantizer:
+    """Quantize particle values before they are pushed into an `RSAImage`.
+
+    Every change of an `RSAImage` regenerates its image.  Most of these changes
+    are invisible, a fraction of a degree of rotation or a single step of
+    alpha.  Snapping the values to a grid makes consecutive frames identical,
+    so the `particle_rsai_system` can skip them.
+
+    Pass an instance to the system via `partial`:
+
+        q = RSAQuantizer(rotate=1, scale=1 / 64, alpha=4)
+        ecs.add_system(partial(particle_rsai_system, quantize=q), 'particle', 'rsai')
+
+    Parameters
+    ----------
+    rotate: float = 1
+        Rotation step in degrees
+
+    scale: float = 1 / 64
+        Scale step
+
+    alpha: float = 4
+        Alpha step, on the range 0 - 255
+
+    A step of 0 disables quantization for that value.
+
+    Attributes
+    ----------
+    rotate, scale, alpha
+        See Parameters
+
+    pushed: int
+        Number of updates that were pushed into an `RSAImage`.
+
+    skipped: int
+        Number of updates that were skipped, since nothing visibly changed.
+
+    """
+    def __init__(self, rotate=1, scale=1 / 64, alpha=4):
+        self.rotate = rotate
+        self.scale = scale
+        self.alpha = alpha
+        self.pushed = 0
+        self.skipped = 0
+
+    def __call__(self, rotate, scale, alpha):
+        """Return the quantized `(rotate, scale, alpha)` tuple.
+
+        `None` values are passed through unchanged.
+
+        """
+        return (self._snap(rotate, self.rotate),
+                self._snap(scale, self.scale),
+                self._snap(alpha, self.alpha))
+
+    @staticmethod
+    def _snap(v, step):
+        if v is None or not step:
+            return v
+        return round(v / step) * step
+
+
+def particle_rsai_system(dt, eid, particle, rsai, shards=1, quantize=None):
     """Bind particle information to an rsai.
 
     An `RSAImage` manages rotation, scaling, alpha of a (optionally dynamically
@@ -231,6 +680,15 @@ def particle_rsai_system(dt, eid, particle, rsai):
     `particle_rsai_system` glues these two together, pushing the `particle`
     information into the `rsai`
 
+    Most particles change imperceptibly from one frame to the next.  With
+    `shards` > 1, every particle is only updated on every n-th frame, round
+    robin, so only 1 / `shards` of all particles regenerate their image per
+    frame.  New particles are always updated on their first frame, and
+    particles marked as `eager` on every frame.  Use a `partial` to register
+    the sharded system:
+
+        ecs.add_system(partial(particle_rsai_system, shards=4), 'particle', 'rsai')
+
     Parameters
     ----------
     particle: swirlyswirls.Particle
@@ -239,12 +697,201 @@ def particle_rsai_system(dt, eid, particle, rsai):
     rsai: tinyecs.compsys.RSAImage
         The image component
 
+    shards: int = 1
+        Update every particle only every `shards` frames.
+
+    quantize: RSAQuantizer = None
+        Snap the values to a grid before pushing them.
+
+        In any case, values are only pushed if they differ from the ones
+        pushed last, so the image is only regenerated on an actual change.
+
+    """
+    if shards > 1 and not particle.eager:
+        if particle._countdown > 0:
+            particle._countdown -= 1
+            return
+        elif particle._countdown == 0:
+            particle._countdown = shards - 1
+        else:
+            particle._countdown = next(_shard_phase) % shards
+
+    state = (particle.rotate.v if particle.rotate is not None else None,
+             particle.scale.v if particle.scale is not None else None,
+             particle.alpha.v if particle.alpha is not None else None)
+    if quantize is not None:
+        state = quantize(*state)
+
+    pushed = particle._pushed
+    if state == pushed:
+        if quantize is not None: quantize.skipped += 1
+        return
+
+    if pushed is None:
+        pushed = (None, None, None)
+    rotate, scale, alpha = state
+
+    rsai.locked = True
+    if rotate is not None and rotate != pushed[0]: rsai.rotate = rotate
+    if scale is not None and scale != pushed[1]: rsai.scale = scale
+    if alpha is not None and alpha != pushed[2]: rsai.alpha = alpha
+    rsai.locked = False
+
+    particle._pushed = state
+    if quantize is not None: quantize.pushed += 1
+
+
+def particle_palette_system(dt, eid, palette):
+    """Swap the palette of a palette image over time.
+
+    See `swirlyswirls.images.PaletteImage`.
+
+    Parameters
+    ----------
+    palette: swirlyswirls.images.PaletteImage
+        The palette image, also used as image factory of the `rsai`.
+
     """
-    rsai.lock = True
-    if particle.rotate is not None: rsai.rotate = particle.rotate.v
-    if particle.scale is not None: rsai.scale = particle.scale.v
-    if particle.alpha is not None: rsai.alpha = particle.alpha.v
-    rsai.lock = False
+    palette.update()
+
+
+class Visibility:
+    """Retire particles that can't be seen anymore.
+
+    Particles often fade out or shrink to nothing long before their lifetime
+    ends, especially with eased curves.  The `particle_visibility_system`
+    analyzes the `alpha` and `scale` curves of a particle once, to find the
+    point in time after which it stays invisible, and removes the particle
+    from then on.
+
+    Particles leaving the `world` rect are removed too, like the
+    `tinyecs.compsys.deadzone_system` does.
+
+        v = Visibility(world=SCREEN.scale_by(1.25))
+        ecs.add_system(partial(particle_visibility_system, visibility=v),
+                       'particle', 'position')
+
+    Curves are sampled, so very short spikes of visibility between samples
+    might be missed.  Repeating curves are never considered to end.
+
+    Parameters
+    ----------
+    alpha: float = 1
+        Particles with an alpha below this are invisible.
+
+    scale: float = 1 / 64
+        Particles with a scale below this are invisible.
+
+    world: pygame.Rect = None
+        Particles outside are removed.  Optional.
+
+    samples: int = 64
+        Resolution of the curve analysis.
+
+    Attributes
+    ----------
+    invisible: int
+        Number of particles retired for being invisible.
+
+    offscreen: int
+        Number of particles retired for leaving `world`.
+
+    saved: float
+        Sum of the `lifetime` the retired particles had left.
+
+    """
+    def __init__(self, alpha=1, scale=1 / 64, world=None, samples=64):
+        self.alpha = alpha
+        self.scale = scale
+        self.world = world
+        self.samples = samples
+        self.invisible = 0
+        self.offscreen = 0
+        self.saved = 0
+        self.cache = {}
+
+    def fade_point(self, lerp, threshold):
+        """The normalized time after which `lerp` stays below `threshold`.
+
+        Returns
+        -------
+        float | None
+            `None`, if the curve never stays below.
+
+        """
+        if lerp.repeat:
+            return None
+
+        key = (lerp.vt0, lerp.vt1, lerp.ease, threshold)
+        try:
+            return self.cache[key]
+        except KeyError:
+            pass
+
+        vt0, vt1, ease = lerp.vt0, lerp.vt1, lerp.ease
+        samples = self.samples
+        t_fade = None
+        if vt1 < threshold:
+            t_fade = 0
+            for i in range(samples, -1, -1):
+                t = i / samples
+                if ease(t) * (vt1 - vt0) + vt0 >= threshold:
+                    t_fade = min(1, (i + 1) / samples)
+                    break
+
+        self.cache[key] = t_fade
+        return t_fade
+
+    def analyze(self, particle):
+        """List the `(cooldown, t)` pairs after which `particle` is invisible."""
+        fade = []
+        for lerp, threshold in ((particle.alpha, self.alpha), (particle.scale, self.scale)):
+            if lerp is None:
+                continue
+            t_fade = self.fade_point(lerp, threshold)
+            if t_fade is not None:
+                fade.append((lerp.duration, t_fade))
+
+        return fade
+
+
+def particle_visibility_system(dt, eid, particle, position, visibility):
+    """Remove particles that are invisible for the rest of their life.
+
+    See `Visibility`.
+
+    Parameters
+    ----------
+    particle: swirlyswirls.Particle
+        The particle component.
+
+    position: Vector2
+        Position of the particle
+
+    visibility: Visibility
+        Configuration and counters
+
+    """
+    world = visibility.world
+    if world is not None and not world.collidepoint(position):
+        visibility.offscreen += 1
+        _retire(eid, visibility)
+        return
+
+    if particle._fade is None:
+        particle._fade = visibility.analyze(particle)
+
+    for cooldown, t_fade in particle._fade:
+        if cooldown.normalized >= t_fade:
+            visibility.invisible += 1
+            _retire(eid, visibility)
+            return
+
+
+def _retire(eid, visibility):
+    if ecs.eid_has(eid, 'lifetime'):
+        visibility.saved += ecs.comp_of_eid(eid, 'lifetime').remaining
+    ecs.remove_entity(eid)
 
 
 def container_system(dt, eid, container, position, momentum, sprite):
@@ -279,9 +926,158 @@ def container_system(dt, eid, container, position, momentum, sprite):
         momentum.x = -momentum.x
         position.x += 2 * (container.width - sprite.rect.right)
 
-    if sprite.rect.top < container.top and momentum.x < 0:
+    if sprite.rect.top < container.top and momentum.y < 0:
         momentum.y = -momentum.y
         position.y += -2 * sprite.rect.top
     elif sprite.rect.bottom > container.bottom and momentum.y > 0:
         momentum.y = -momentum.y
         position.y += 2 * (container.height - sprite.rect.bottom)
+
+
+class Containment:
+    """Keep entities inside their container rects, in one pass.
+
+    A replacement for `container_system` with more modes.  Instead of
+    running a system per entity, `run` takes the entities with a container
+    component in one list, from the tinyecs archetype or a
+    `swirlyswirls.QueryCache`, and resolves them in a single loop.  Any
+    number of different container rects can be used, e.g. per room or per
+    emitter.
+
+        containment = Containment(mode='bounce', restitution=0.8, friction=0.1)
+
+        def update(self, dt):
+            containment.run(dt)
+            ecs.run_system(dt, tinyecs.components.momentum_system, 'momentum', 'position')
+
+    The size of the entity is taken from its sprite, the position is its
+    center.
+
+    Parameters
+    ----------
+    mode: str = 'bounce'
+        What happens when an entity leaves its container:
+
+            'bounce':   mirror it back in, reverse the momentum on that axis
+            'clamp':    put it back on the edge, stop it on that axis
+            'kill':     remove the entity
+
+    restitution: float = 1
+        Fraction of the momentum kept on the collision axis when bouncing.
+
+    friction: float = 0
+        Fraction of the momentum lost along the wall on bounce or clamp.
+
+    cid: hashable = 'container'
+        The component holding the container rect.
+
+    query_cache: swirlyswirls.queries.QueryCache = None
+        Take the entities from this cache instead of the tinyecs archetype.
+
+    Attributes
+    ----------
+    hits: int
+        Number of wall hits resolved.
+
+    killed: int
+        Number of entities removed in 'kill' mode.
+
+    """
+    MODES = ('bounce', 'clamp', 'kill')
+
+    def __init__(self, mode='bounce', restitution=1, friction=0, cid='container', query_cache=None):
+        if mode not in self.MODES:
+            raise ValueError(f'mode must be one of {self.MODES}, not {mode!r}')
+
+        self.mode = mode
+        self.restitution = restitution
+        self.friction = friction
+        self.cid = cid
+        self.query_cache = query_cache
+        self.hits = 0
+        self.killed = 0
+
+    def run(self, dt):
+        """Resolve all entities with `cid`, `position`, `momentum` and `sprite`."""
+        cids = (self.cid, 'position', 'momentum', 'sprite')
+        if self.query_cache is not None:
+            rows = self.query_cache.query(*cids).rows()
+        else:
+            ecs.create_archetype(*cids)
+            rows = ecs.comps_of_archetype(*cids)
+
+        for eid in self.resolve(rows):
+            ecs.remove_entity(eid)
+
+    def resolve(self, rows):
+        """Resolve entities against their container rects.
+
+        Parameters
+        ----------
+        rows: list[tuple[EID, tuple[Rect, Vector2, Vector2, Sprite]]]
+            The entities as `(eid, (container, position, momentum, sprite))`,
+            as returned by `tinyecs.comps_of_archetype` or `Query.rows`.
+
+        Returns
+        -------
+        list[EID]
+            The entities to remove in 'kill' mode, empty otherwise.
+
+        """
+        bounce = self.mode == 'bounce'
+        kill = self.mode == 'kill'
+        restitution = self.restitution
+        keep = 1 - self.friction
+        hits = 0
+        dead = []
+        current = None
+
+        for eid, (container, position, momentum, sprite) in rows:
+            if container is not current:
+                current = container
+                left, top, right, bottom = container.left, container.top, container.right, container.bottom
+
+            x, y = position
+            w, h = sprite.rect.size
+            w *= 0.5
+            h *= 0.5
+            if left + w <= x <= right - w and top + h <= y <= bottom - h:
+                continue
+
+            if kill:
+                dead.append(eid)
+                continue
+
+            x0 = left + w
+            x1 = right - w
+            y0 = top + h
+            y1 = bottom - h
+            mx, my = momentum
+            if x < x0 and mx <= 0 or x > x1 and mx >= 0:
+                edge = x0 if x < x0 else x1
+                hits += 1
+                if bounce:
+                    x = 2 * edge - x
+                    mx = -mx * restitution
+                else:
+                    x = edge
+                    mx = 0
+                my *= keep
+
+            if y < y0 and my <= 0 or y > y1 and my >= 0:
+                edge = y0 if y < y0 else y1
+                hits += 1
+                if bounce:
+                    y = 2 * edge - y
+                    my = -my * restitution
+                else:
+                    y = edge
+                    my = 0
+                mx *= keep
+
+            position[:] = x, y
+            momentum[:] = mx, my
+
+        self.hits += hits
+        self.killed += len(dead)
+        return dead
@@ -22,16 +22,18 @@ class Demo(GameState):
         self.cache = {}
         self.group = sw.ReversedGroup()
         self.cooldown = Cooldown(3, cold=True)
+        self.visibility = swcs.Visibility(world=self.app.rect.scale_by(1.25))
 
         self.ecs_register_systems()
 
-        self.emitter = partial(
-            swcs.Emitter,
-            inherit_momentum=2,
-            zone=swirlyswirls.zones.ZoneBeam(v=(self.app.rect.width, 100), width=32),
-            particle_factory=partial(self.beam_particle_factory,
-                                     group=self.group, cache=self.cache)
-        )
+        self.emitters = sw.EmitterPool(
+            partial(self.beam_emitter,
+                    zone=swirlyswirls.zones.ZoneTemplate(
+                        zone=swirlyswirls.zones.ZoneBeam(v=(self.app.rect.width, 100), width=32),
+                        rotate=False, mirror=False),
+                    particle_factory=partial(self.beam_particle_factory,
+                                             group=self.group, cache=self.cache)),
+            lifetime=0.5)
 
     def reset(self, persist=None):
         """Reset settings when re-running."""
@@ -48,7 +50,7 @@ class Demo(GameState):
 
         if self.cooldown.cold:
             self.cooldown.reset()
-            self.launch_emitter((0, 100), self.emitter)
+            self.emitters.launch((0, 100))
 
         ecs.run_all_systems(dt)
 
@@ -56,7 +58,8 @@ class Demo(GameState):
 
         sprites = len(self.group.sprites())
         c = len(list(self.cache.keys()))
-        pygame.display.set_caption(f'{self.title} - time={pygame.time.get_ticks()/1000:.2f}  fps={self.app.clock.get_fps():.2f}  {sprites=}  {c=}')
+        retired = self.visibility.invisible + self.visibility.offscreen
+        pygame.display.set_caption(f'{self.title} - time={pygame.time.get_ticks()/1000:.2f}  fps={self.app.clock.get_fps():.2f}  {sprites=}  {c=}  {retired=}')
 
     def draw(self, screen):
         """Draw current frame to surface screen."""
@@ -65,27 +68,26 @@ class Demo(GameState):
 
         def draw_system(dt, eid, position, emitter, screen=screen):
             pygame.draw.line(screen, 'grey20', position, position +
-                             emitter.zone.v, width=5)
+                             emitter.zone.zone.v, width=5)
 
         ecs.run_system(1, draw_system, 'position', 'emitter', screen=self.app.screen)
         self.group.draw(screen)
 
         pygame.display.flip()
 
-    @staticmethod
-    def ecs_register_systems():
+    def ecs_register_systems(self):
         ecs.add_system(ecsc.lifetime_system, 'lifetime')
         ecs.add_system(swcs.emitter_system, 'emitter', 'position')
+        ecs.add_system(partial(swcs.particle_visibility_system, visibility=self.visibility),
+                       'particle', 'position')
         ecs.add_system(swcs.particle_rsai_system, 'particle', 'rsai')
         ecs.add_system(ecsc.momentum_system, 'momentum', 'position')
         ecs.add_system(ecsc.sprite_system, 'sprite', 'position')
 
     @staticmethod
-    def launch_emitter(position, emitter):
-        e = ecs.create_entity()
-        ecs.add_component(e, 'emitter', emitter(ept=LerpThing(100, 10, 0.5)))
-        ecs.add_component(e, 'position', Vector2(position))
-        ecs.add_component(e, 'lifetime', Cooldown(0.5))
+    def beam_emitter(zone, particle_factory):
+        return swcs.Emitter(ept=LerpThing(100, 10, 0.5), inherit_momentum=2,
+                            zone=zone, particle_factory=particle_factory)
 
     @staticmethod
     def beam_particle_factory(t, position, momentum, group, cache):
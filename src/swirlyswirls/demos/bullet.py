@@ -25,10 +25,15 @@ class Demo(GameState):
 
         self.ecs_register_systems()
 
-        self.particle_factory = partial(self.bullet_particle_factory,
-                                        group=self.group)
-        self.zone_factory = partial(swirlyswirls.zones.ZoneCircle, r0=0)
-        self.emitter = partial(sw.Emitter, ept=LerpThing(1, 1, 5), inherit_momentum=3)
+        self.emitters = [
+            sw.EmitterPool(partial(self.bullet_emitter,
+                                   zone=swirlyswirls.zones.ZoneCircle(r0=0, r1=5 * i),
+                                   particle_factory=partial(self.bullet_particle_factory,
+                                                            group=self.group,
+                                                            max_size=10 * (i + 1))),
+                           lifetime=5)
+            for i in range(5)
+        ]
 
     def reset(self, persist=None):
         """Reset settings when re-running."""
@@ -48,14 +53,10 @@ class Demo(GameState):
             momentum = Vector2(100, 0)
 
             step = self.app.rect.height // 5
-            for i in range(5):
+            for i, emitters in enumerate(self.emitters):
                 y = i * step + 0.5 * step
                 dy = 50 * triangular(-0.5, 0.5, mode=0)
-                pf = partial(self.particle_factory, max_size=10 * (i + 1))
-                zone = self.zone_factory(r1=5 * i)
-                self.emitter_factory(position=(50, y + dy),
-                                     momentum=momentum,
-                                     emitter=self.emitter(zone=zone, particle_factory=pf))
+                emitters.launch((50, y + dy), momentum)
 
         ecs.run_all_systems(dt)
 
@@ -95,12 +96,9 @@ class Demo(GameState):
         ecs.add_system(ecsc.sprite_system, 'sprite', 'position')
 
     @staticmethod
-    def emitter_factory(position, momentum, emitter):
-        e = ecs.create_entity()
-        ecs.add_component(e, 'emitter', emitter)
-        ecs.add_component(e, 'momentum', momentum)
-        ecs.add_component(e, 'position', Vector2(position))
-        ecs.add_component(e, 'lifetime', Cooldown(5))
+    def bullet_emitter(zone, particle_factory):
+        return sw.Emitter(ept=LerpThing(1, 1, 5), inherit_momentum=3,
+                          zone=zone, particle_factory=particle_factory)
 
     @staticmethod
     def bullet_particle_factory(*, t, position, momentum, group, max_size):
@@ -3,7 +3,9 @@ import tinyecs as ecs
 import tinyecs.components as ecsc
 import swirlyswirls as sw
 import swirlyswirls.compsys as swcs
+import swirlyswirls.images
 import swirlyswirls.particles
+import swirlyswirls.pool
 import swirlyswirls.zones
 
 from functools import partial
@@ -20,6 +22,7 @@ class Demo(GameState):
 
         self.title = 'Bubble Explosions'
         self.cache = {}
+        self.surface_pool = swirlyswirls.images.SurfacePool()
         self.group = sw.ReversedGroup()
         self.momentum = False
         self.cooldown = Cooldown(5, cold=True)
@@ -29,27 +32,18 @@ class Demo(GameState):
         self.ecs_register_systems()
 
         self.emitters = [
-            partial(
-                sw.Emitter,
-                zone=swirlyswirls.zones.ZoneCircle(r0=0, r1=16),
-                particle_factory=partial(self.explosion_particle_factory,
-                                         group=self.group, cache=self.cache,
-                                         max_size=16)
-            ),
-            partial(
-                sw.Emitter,
-                zone=swirlyswirls.zones.ZoneCircle(r0=0, r1=32),
-                particle_factory=partial(self.explosion_particle_factory,
-                                         group=self.group, cache=self.cache,
-                                         max_size=32)
-            ),
-            partial(
-                sw.Emitter,
-                zone=swirlyswirls.zones.ZoneCircle(r0=0, r1=64),
-                particle_factory=partial(self.explosion_particle_factory,
-                                         group=self.group, cache=self.cache,
-                                         max_size=64)
-            ),
+            sw.EmitterPool(
+                partial(self.explosion_emitter,
+                        zone=swirlyswirls.zones.ZoneTemplate(
+                            zone=swirlyswirls.zones.ZoneCircle(r0=0, r1=r1)),
+                        particle_factory=sw.ParticlePool(
+                            partial(self.explosion_particle_factory,
+                                    group=self.group, cache=self.cache,
+                                    surface_pool=self.surface_pool,
+                                    max_size=r1),
+                            recycle=self.explosion_particle_recycle)),
+                lifetime=1)
+            for r1 in (16, 32, 64)
         ]
 
     def reset(self, persist=None):
@@ -78,7 +72,7 @@ class Demo(GameState):
             for i in range(3):
                 x = step + i * 2 * step
                 pos = (x, self.app.rect.centery)
-                self.launch_emitter(pos, self.emitters[i])
+                self.emitters[i].launch(pos)
 
         ecs.run_all_systems(dt)
 
@@ -86,7 +80,8 @@ class Demo(GameState):
 
         sprites = len(self.group.sprites())
         c = len(list(self.cache.keys()))
-        pygame.display.set_caption(f'{self.title} - time={pygame.time.get_ticks()/1000:.2f}  fps={self.app.clock.get_fps():.2f}  {sprites=}  {c=}')
+        surfaces = self.surface_pool.allocated
+        pygame.display.set_caption(f'{self.title} - time={pygame.time.get_ticks()/1000:.2f}  fps={self.app.clock.get_fps():.2f}  {sprites=}  {c=}  {surfaces=}')
 
     def draw(self, screen):
         """Draw current frame to surface screen."""
@@ -115,29 +110,32 @@ class Demo(GameState):
         ecs.add_system(ecsc.sprite_system, 'sprite', 'position')
 
     @staticmethod
-    def launch_emitter(pos, emitter):
-        e = ecs.create_entity()
-        ecs.add_component(e, 'emitter', emitter(ept=LerpThing(2, 5, 1)))
-        ecs.add_component(e, 'position', Vector2(pos))
-        ecs.add_component(e, 'lifetime', Cooldown(1))
+    def explosion_emitter(zone, particle_factory):
+        return sw.Emitter(ept=LerpThing(2, 5, 1), zone=zone, particle_factory=particle_factory)
 
     @staticmethod
-    def explosion_particle_factory(t, position, momentum, group, cache, max_size):
-        e = ecs.create_entity()
-
-        def image_factory(rotate, scale, alpha):
+    def explosion_particle_factory(t, position, momentum, group, cache, surface_pool, max_size):
+        def image_factory(rotate, scale, alpha, pool=None):
             size = max_size * scale
-            return swirlyswirls.particles.firesquabble_image_factory(size, alpha)
+            return swirlyswirls.particles.firesquabble_image_factory(size, alpha, pool=pool)
 
-        rsai = ecsc.RSAImage(None, image_factory=image_factory)
+        image = swirlyswirls.images.PooledImage(surface_pool, image_factory)
+        rsai = ecsc.RSAImage(None, image_factory=image)
 
         p = swcs.Particle(scale=LerpThing(1 / 4, 1, 0.75, ease=out_quint),
                           alpha=LerpThing(255, 0, 0.75, ease=out_quint))
 
-        ecs.add_component(e, 'rsai', rsai)
-        ecs.add_component(e, 'particle', p)
-        ecs.add_component(e, 'lifetime', Cooldown(0.75))
-        ecs.add_component(e, 'sprite', ecsc.EVSprite(rsai, group))
-        ecs.add_component(e, 'position', Vector2(position))
-        ecs.add_component(e, 'momentum', momentum * 3)
-        ecs.add_component(e, 'cache', cache)
+        return {
+            'rsai': rsai,
+            'particle': p,
+            'lifetime': Cooldown(0.75),
+            'sprite': ecsc.EVSprite(rsai, group),
+            'position': Vector2(position),
+            'momentum': momentum * 3,
+            'cache': cache,
+            'pooled-image': image,
+        }
+
+    @staticmethod
+    def explosion_particle_recycle(components, t, position, momentum):
+        swirlyswirls.pool.recycle_particle(components, t, position, momentum * 3)
@@ -3,6 +3,7 @@ import tinyecs as ecs
 import tinyecs.components as ecsc
 import swirlyswirls as sw
 import swirlyswirls.compsys as swcs
+import swirlyswirls.images
 import swirlyswirls.particles
 import swirlyswirls.zones
 
@@ -22,6 +23,8 @@ class Demo(GameState):
         self.title = 'Bubble Explosions'
         self.group = sw.ReversedGroup()
         self.cooldown = Cooldown(1, cold=True)
+        # Drawn once, every particle colors it by swapping its palette
+        self.shape = swirlyswirls.particles.bubble_index_factory(16)
 
         self.ecs_register_systems()
 
@@ -66,6 +69,7 @@ class Demo(GameState):
         ecs.add_system(swcs.emitter_system, 'emitter', 'position')
         ecs.add_system(ecsc.momentum_system, 'momentum', 'position')
         ecs.add_system(swcs.particle_rsai_system, 'particle', 'rsai')
+        ecs.add_system(swcs.particle_palette_system, 'palette')
         ecs.add_system(ecsc.sprite_system, 'sprite', 'position')
 
     def launch_emitter(self):
@@ -84,17 +88,17 @@ class Demo(GameState):
 
     def launch_particle(self, *, t=None, position, momentum, group):
 
-        def image_factory(rotate, scale, alpha):
-            size = 16 * scale
-            return swirlyswirls.particles.firebubble_image_factory(size, alpha)
-
-        rsai = ecsc.RSAImage(None, image_factory=image_factory)
+        # White hot to smoke over the lifetime of the particle
+        image = swirlyswirls.images.PaletteImage(self.shape, swirlyswirls.particles.fire_gradient,
+                                                 LerpThing(0, 1, 1))
+        rsai = ecsc.RSAImage(None, image_factory=image)
 
         p = swcs.Particle(scale=LerpThing(1 / 8, 1, 1, ease=out_quint), # noqa: 405
                           alpha=LerpThing(255, 0, 1, ease=out_quint)) # noqa: 405
 
         e = ecs.create_entity()
         ecs.add_component(e, 'rsai', rsai)
+        ecs.add_component(e, 'palette', image)
         ecs.add_component(e, 'particle', p)
         ecs.add_component(e, 'lifetime', Cooldown(1))
         ecs.add_component(e, 'sprite', ecsc.EVSprite(rsai, group))
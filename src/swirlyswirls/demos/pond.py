@@ -21,6 +21,7 @@ class Demo(GameState):
         self.title = 'Pond Demo'
         self.group = sw.ReversedGroup()
         self.momentum = False
+        self.quantizer = swcs.RSAQuantizer()
 
         self.label = self.persist.font.render('Press space to toggle momentum', True, 'white')
 
@@ -52,7 +53,8 @@ class Demo(GameState):
         self.group.update(dt)
 
         sprites = len(self.group.sprites())
-        pygame.display.set_caption(f'{self.title} - time={pygame.time.get_ticks()/1000:.2f}  fps={self.app.clock.get_fps():.2f}  {sprites=}')
+        skipped = self.quantizer.skipped
+        pygame.display.set_caption(f'{self.title} - time={pygame.time.get_ticks()/1000:.2f}  fps={self.app.clock.get_fps():.2f}  {sprites=}  {skipped=}')
 
     def draw(self, screen):
         """Draw current frame to surface screen."""
@@ -67,12 +69,14 @@ class Demo(GameState):
     def ecs_register_systems(self):
         ecs.add_system(ecsc.lifetime_system, 'lifetime')
         ecs.add_system(swcs.emitter_system, 'emitter', 'position')
-        ecs.add_system(swcs.particle_rsai_system, 'particle', 'rsai')
+        ecs.add_system(partial(swcs.particle_rsai_system, quantize=self.quantizer),
+                       'particle', 'rsai')
         ecs.add_system(ecsc.sprite_system, 'sprite', 'position')
 
     def launch_emitter(self):
         emitter = sw.Emitter(ept=LerpThing(3, 3, 0),
-                             zone=swirlyswirls.zones.ZoneCircle(r0=0, r1=128),
+                             zone=swirlyswirls.zones.ZoneCircle(r0=0, r1=128,
+                                                                rnd_p=swirlyswirls.zones.Halton(dims=2)),
                              particle_factory=partial(self.pond_particle_factory,
                                                       group=self.group),
                              inherit_momentum=3)
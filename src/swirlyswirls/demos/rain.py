@@ -91,7 +91,7 @@ class Demo(GameState):
     def ecs_register_systems(self):
         ecs.add_system(ecsc.lifetime_system, 'lifetime')
         ecs.add_system(swcs.emitter_system, 'emitter', 'position')
-        ecs.add_system(swcs.particle_rsai_system, 'particle', 'rsai')
+        ecs.add_system(partial(swcs.particle_rsai_system, shards=3), 'particle', 'rsai')
         ecs.add_system(ecsc.sprite_system, 'sprite', 'position')
 
     def launch_emitter(self):
@@ -99,7 +99,7 @@ class Demo(GameState):
         r.center = (0, 0)
         emitter = sw.Emitter(
             ept=LerpThing(3, 1, 0),
-            zone=swirlyswirls.zones.ZoneRect(r=r),
+            zone=swirlyswirls.zones.ZoneRect(r=r, rnd_p=swirlyswirls.zones.Halton(dims=2)),
             particle_factory=partial(pond_particle_factory,
                                      group=self.group))
 
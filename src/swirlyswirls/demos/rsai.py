@@ -3,6 +3,7 @@ import tinyecs as ecs
 import tinyecs.compsys as ecsc
 import swirlyswirls as sw
 import swirlyswirls.compsys as swcs
+import swirlyswirls.images
 import swirlyswirls.particles
 import swirlyswirls.zones
 
@@ -67,6 +68,8 @@ class Demo(GameState):
 
         self.title = 'RSAI/LerpThing Demo'
         self.group = pygame.sprite.Group()
+        self.rotation_cache = swirlyswirls.images.RotationCache()
+        self.containment = swcs.Containment(cid='world')
         self.emitter_factory()
         self.emitting = False
         self.label = self.persist.font.render('Press space to toggle emitter', True, 'white')
@@ -83,7 +86,7 @@ class Demo(GameState):
         momentum = Vector2(37, 42)
 
         # image_factory = partial(image_factory_wrapper, size=32)
-        image_factory = partial(_image_factory, size=8)
+        image_factory = self.rotation_cache.wrap(partial(_image_factory, size=8))
 
         particle_entity_factory = partial(
             _particle_entity_factory,
@@ -131,7 +134,7 @@ class Demo(GameState):
     def update(self, dt):
         """Update frame by delta time dt."""
 
-        ecs.run_system(dt, swcs.container_system, 'world', 'position', 'momentum', 'sprite')
+        self.containment.run(dt)
         ecs.run_system(dt, ecsc.momentum_system, 'momentum', 'position')
         if self.emitting and self.app.clock.get_fps() >= 60:
             ecs.run_system(dt, sw.emitter_system, 'emitter', 'position')
@@ -143,7 +146,8 @@ class Demo(GameState):
         self.group.update(dt)
 
         sprites = len(self.group.sprites())
-        pygame.display.set_caption(f'{self.title} - time={pygame.time.get_ticks()/1000:.2f}  fps={self.app.clock.get_fps():.2f}  {sprites=}')
+        rotations = len(self.rotation_cache.bases)
+        pygame.display.set_caption(f'{self.title} - time={pygame.time.get_ticks()/1000:.2f}  fps={self.app.clock.get_fps():.2f}  {sprites=}  {rotations=}')
 
     def draw(self, screen):
         """Draw current frame to surface screen."""
@@ -0,0 +1,100 @@
+import pygame
+import tinyecs as ecs
+import tinyecs.components as ecsc
+import swirlyswirls as sw
+import swirlyswirls.compsys as swcs
+import swirlyswirls.particles
+
+from functools import partial
+
+from pgcooldown import Cooldown, LerpThing
+from pygame import Vector2
+from pygamehelpers.framework import GameState
+
+
+class Demo(GameState):
+    def __init__(self, app, persist, parent=None):
+        super().__init__(app, persist, parent=parent)
+
+        self.title = 'Bullet Patterns'
+        self.group = sw.BallisticGroup()
+        self.label = self.persist.font.render('The outer fans aim at the mouse, bullets move in closed form',
+                                              True, 'white')
+
+        self.ecs_register_systems()
+
+        factory = partial(self.bullet_particle_factory, group=self.group)
+        center = Vector2(self.app.rect.center)
+
+        self.launch_pattern(center, factory, sw.Pattern(arms=5, spread=360, speed=150,
+                                                        spin=57, rhythm=[0.02]))
+        self.launch_pattern(center, factory, sw.Pattern(arms=5, spread=360, speed=150,
+                                                        spin=-57, angle=36, rhythm=[0.02]))
+
+        aim = pygame.mouse.get_pos
+        for x in (self.app.rect.width / 4, self.app.rect.width * 3 / 4):
+            self.launch_pattern(Vector2(x, self.app.rect.height / 4), factory,
+                                sw.Pattern(arms=7, spread=60, bullets=3, speed=200, speed_step=40,
+                                           rhythm=[0.1, 0.1, 0.1, 1], aim=aim))
+
+    def reset(self, persist=None):
+        """Reset settings when re-running."""
+        super().reset(persist=persist)
+        ...
+
+    def dispatch_event(self, e):
+        """Handle user events"""
+        super().dispatch_event(e)
+
+    def update(self, dt):
+        """Update frame by delta time dt."""
+        ecs.run_all_systems(dt)
+
+        self.group.update(dt)
+
+        sprites = len(self.group.sprites())
+        pygame.display.set_caption(f'{self.title} - time={pygame.time.get_ticks()/1000:.2f}  fps={self.app.clock.get_fps():.2f}  {sprites=}')
+
+    def draw(self, screen):
+        """Draw current frame to surface screen."""
+
+        screen.fill('black')
+        screen.blit(self.label, (5, 5))
+
+        self.group.draw(screen)
+
+        pygame.display.flip()
+
+    @staticmethod
+    def ecs_register_systems():
+        ecs.add_system(ecsc.lifetime_system, 'lifetime')
+        ecs.add_system(sw.pattern_system, 'pattern', 'position')
+        ecs.add_system(swcs.particle_rsai_system, 'particle', 'rsai')
+
+    @staticmethod
+    def launch_pattern(position, particle_factory, pattern):
+        e = ecs.create_entity()
+        ecs.add_component(e, 'pattern', sw.PatternEmitter(pattern=pattern,
+                                                          particle_factory=particle_factory))
+        ecs.add_component(e, 'position', Vector2(position))
+
+    @staticmethod
+    def bullet_particle_factory(*, t, position, momentum, group):
+        def image_factory(rotate, scale, alpha):
+            return swirlyswirls.particles.firebubble_image_factory(8 * scale, alpha)
+
+        rsai = ecsc.RSAImage(None, image_factory=image_factory)
+
+        p = swcs.Particle(alpha=LerpThing(255, 64, 4))
+
+        # No position or momentum, the group places the bullet when drawing it
+        sprite = ecsc.EVSprite(rsai)
+        group.add_ballistic(sprite, swcs.Ballistic(position, momentum))
+
+        e = ecs.create_entity()
+        ecs.add_component(e, 'rsai', rsai)
+        ecs.add_component(e, 'particle', p)
+        ecs.add_component(e, 'lifetime', Cooldown(4))
+        ecs.add_component(e, 'sprite', sprite)
+
+        return e
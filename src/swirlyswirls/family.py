@@ -0,0 +1,169 @@
+"""An index from emitters to the particles they launched.
+
+Finding the particles of an emitter otherwise means checking every entity
+with an `'emitted-by'` component.  A `Family` keeps the live particles of
+every emitter in a set, updated when a particle is launched and when it is
+removed, so operations on the particles of one emitter only cost as much as
+that emitter has particles.
+
+    family = Family()
+    emitter = Emitter(..., family=family)
+
+    family.count(emitter_eid)
+    family.kill(emitter_eid)
+
+The particle factory needs to return the EID of the particle, otherwise the
+`emitter_system` can't register it.
+
+Note, that an `EmitterPool` revives emitters with their old EID, so the
+particles of an earlier launch still count as children of the emitter.
+
+If the particles are run through a `swirlyswirls.queries.QueryCache`, pass
+it as `query_cache`, so `pause` and `resume` keep its queries up to date.
+
+"""
+import tinyecs as ecs
+
+__all__ = ['Family', 'FamilyTicket']
+
+
+class FamilyTicket:
+    """The component that removes a particle from its `Family`.
+
+    Added by `Family.adopt` as the `family-ticket` component.  When the
+    particle entity is removed, tinyecs calls `shutdown_`, which unregisters
+    it.
+
+    """
+    __slots__ = ('family', 'parent', 'eid')
+
+    def __init__(self, family, parent, eid):
+        self.family = family
+        self.parent = parent
+        self.eid = eid
+
+    def shutdown_(self):
+        self.family.orphan(self)
+
+
+class Family:
+    """The live particles per emitter.
+
+    Parameters
+    ----------
+    query_cache: swirlyswirls.queries.QueryCache = None
+        Add and remove components through this cache.
+
+    Attributes
+    ----------
+    query_cache
+        See Parameters
+
+    children: dict[EID, set[EID]]
+        The EIDs of the live particles, per emitter EID.
+
+    paused: dict[EID, dict[EID, Vector2]]
+        The momentums of paused particles.  See `pause`.
+
+    """
+    def __init__(self, query_cache=None):
+        self.query_cache = query_cache
+        self.children = {}
+        self.paused = {}
+        self._free = []
+
+    def adopt(self, parent, eid):
+        """Register particle `eid` as a child of emitter `parent`."""
+        if self._free:
+            ticket = self._free.pop()
+            ticket.parent = parent
+            ticket.eid = eid
+        else:
+            ticket = FamilyTicket(self, parent, eid)
+
+        self.children.setdefault(parent, set()).add(eid)
+        if self.query_cache is None:
+            ecs.add_component(eid, 'family-ticket', ticket)
+        else:
+            self.query_cache.add_component(eid, 'family-ticket', ticket)
+
+    def orphan(self, ticket):
+        """Unregister a removed particle.  Called by `FamilyTicket.shutdown_`."""
+        children = self.children.get(ticket.parent)
+        if children is not None:
+            children.discard(ticket.eid)
+            if not children:
+                del self.children[ticket.parent]
+
+        paused = self.paused.get(ticket.parent)
+        if paused is not None:
+            paused.pop(ticket.eid, None)
+            if not paused:
+                del self.paused[ticket.parent]
+
+        self._free.append(ticket)
+
+    def of(self, parent):
+        """The EIDs of the live particles of `parent`.  Don't modify."""
+        return self.children.get(parent, ())
+
+    def count(self, parent):
+        """The number of live particles of `parent`."""
+        return len(self.children.get(parent, ()))
+
+    def kill(self, parent):
+        """Remove all particles of `parent`."""
+        for eid in list(self.children.get(parent, ())):
+            ecs.remove_entity(eid)
+
+    def move(self, parent, offset):
+        """Move all particles of `parent` by `offset`."""
+        dx, dy = offset
+        for eid in self.children.get(parent, ()):
+            if ecs.eid_has(eid, 'position'):
+                position = ecs.comp_of_eid(eid, 'position')
+                position.x += dx
+                position.y += dy
+
+    def pause(self, parent):
+        """Freeze all particles of `parent`.
+
+        The `momentum` component is taken from the particles, so they stop
+        moving, and their `lifetime` and `particle` lerps are paused.
+
+        """
+        remove_component = ecs.remove_component if self.query_cache is None else self.query_cache.remove_component
+        paused = self.paused.setdefault(parent, {})
+        for eid in self.children.get(parent, ()):
+            if eid in paused:
+                continue
+
+            if ecs.eid_has(eid, 'momentum'):
+                paused[eid] = ecs.comp_of_eid(eid, 'momentum')
+                remove_component(eid, 'momentum')
+            else:
+                paused[eid] = None
+
+            for cooldown in _cooldowns(eid):
+                cooldown.pause()
+
+    def resume(self, parent):
+        """Continue all particles of `parent` that were paused."""
+        add_component = ecs.add_component if self.query_cache is None else self.query_cache.add_component
+        for eid, momentum in self.paused.pop(parent, {}).items():
+            if momentum is not None:
+                add_component(eid, 'momentum', momentum)
+
+            for cooldown in _cooldowns(eid):
+                cooldown.start()
+
+
+def _cooldowns(eid):
+    """The cooldowns driving the life of a particle."""
+    if ecs.eid_has(eid, 'lifetime'):
+        yield ecs.comp_of_eid(eid, 'lifetime')
+    if ecs.eid_has(eid, 'particle'):
+        particle = ecs.comp_of_eid(eid, 'particle')
+        for lerp in (particle.rotate, particle.scale, particle.alpha):
+            if lerp is not None:
+                yield lerp.duration
@@ -0,0 +1,519 @@
+"""Image helpers for particles.
+
+Particles are many, and they all want their own rotated, scaled and faded
+image on every frame.  The helpers in here share the expensive parts of that
+between particles.
+
+"""
+import pygame
+
+from collections import OrderedDict, defaultdict
+
+__all__ = ['RotationCache', 'PaletteGradient', 'PaletteImage',
+           'to_display_premultiplied', 'premultiplied', 'SurfacePool', 'PooledImage']
+
+
+class RotationCache:
+    """Share pre-rotated images between particles.
+
+    `pygame.transform.rotate` is one of the most expensive operations in a
+    particle's life.  If many particles use the same base image, they can
+    share its rotated variants.  The cache keeps up to `steps` variants per
+    base image, one for every quantized angle, and creates them on first use.
+
+    Bases are kept in least recently used order.  If the cache grows beyond
+    `max_bytes`, the least recently used bases and all their variants are
+    evicted.
+
+    The easiest way to use it is to wrap an image factory, as used by
+    `tinyecs.compsys.RSAImage`:
+
+        rotation_cache = RotationCache(steps=72)
+        image_factory = rotation_cache.wrap(partial(my_image_factory, size=8))
+        rsai = RSAImage(None, image_factory=image_factory)
+
+    The wrapped factory is called with `rotate=0` and `alpha=255` to create
+    the base image for every scale, the cache does the rotation.  Since the
+    returned images are shared, alpha is applied to a copy.
+
+    Note, that the same wrapper needs to be used for all particles to share
+    the images.  A new closure per particle gives a new base per particle.
+
+    Parameters
+    ----------
+    steps: int = 72
+        Number of angles per full rotation.
+
+    max_bytes: int = 32 MiB
+        Upper limit for the memory of all cached surfaces.
+
+    Attributes
+    ----------
+    nbytes: int
+        The memory of all cached surfaces
+
+    hits, misses, evictions: int
+        Statistics, see also `stats`
+
+    """
+    def __init__(self, steps=72, max_bytes=32 * 1024 * 1024):
+        self.steps = steps
+        self.max_bytes = max_bytes
+        self.bases = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _sizeof(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def get(self, key, angle, base_factory, *args, **kwargs):
+        """Get the variant of the base image `key`, rotated by `angle`.
+
+        Parameters
+        ----------
+        key: hashable
+            Identifies the base image.
+
+        angle: float
+            The rotation in degrees.  It is quantized to the nearest of the
+            `steps` angles.
+
+        base_factory: callable
+            Called with `*args` and `**kwargs` to create the base image, if
+            `key` is not yet in the cache.
+
+        Returns
+        -------
+        pygame.surface.Surface
+            The rotated image.  It's shared, so don't draw on it.
+
+        """
+        steps = self.steps
+        idx = round(angle * steps / 360) % steps
+
+        try:
+            base, variants = self.bases[key]
+            self.bases.move_to_end(key)
+        except KeyError:
+            base = base_factory(*args, **kwargs)
+            variants = [None] * steps
+            variants[0] = base
+            self.bases[key] = (base, variants)
+            self.nbytes += self._sizeof(base)
+
+        image = variants[idx]
+        if image is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        image = pygame.transform.rotate(base, idx * 360 / steps)
+        variants[idx] = image
+        self.nbytes += self._sizeof(image)
+
+        if self.nbytes > self.max_bytes:
+            self.evict(self.max_bytes)
+
+        return image
+
+    def evict(self, max_bytes=0):
+        """Drop least recently used bases until below `max_bytes`.
+
+        The most recently used base is always kept.
+
+        """
+        while self.nbytes > max_bytes and len(self.bases) > 1:
+            _, (_, variants) = self.bases.popitem(last=False)
+            self.nbytes -= sum(self._sizeof(v) for v in variants if v is not None)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop everything."""
+        self.bases.clear()
+        self.nbytes = 0
+
+    def wrap(self, image_factory):
+        """Wrap an `RSAImage` image factory to use this cache.
+
+        Parameters
+        ----------
+        image_factory: callable
+            A function called with `rotate`, `scale` and `alpha`.  It will
+            only be called with `rotate=0` and `alpha=255`.
+
+        Returns
+        -------
+        callable
+            An image factory with the same signature.
+
+        """
+        def rotated_image_factory(rotate=0, scale=1, alpha=255):
+            image = self.get((image_factory, scale), rotate,
+                             image_factory, rotate=0, scale=scale, alpha=255)
+            if alpha != 255:
+                image = image.copy()
+                image.set_alpha(alpha)
+            return image
+
+        return rotated_image_factory
+
+    @property
+    def stats(self):
+        """A dict of the cache statistics, e.g. for an fps display."""
+        return {
+            'bases': len(self.bases),
+            'bytes': self.nbytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+class PaletteGradient:
+    """Precomputed palettes, lerped between key palettes.
+
+    Used with 8 bit index images (see `swirlyswirls.particles.index_surface`)
+    to change the colors of a particle over its lifetime, without rendering
+    anything.  Index 0 is always the transparent colorkey, the colors of the
+    keys are mapped to indices 1, 2, ...
+
+    Parameters
+    ----------
+    keys: list[list[pygame.Color]]
+        The key palettes, evenly spread over `t` 0 - 1.  All keys must have
+        the same number of colors.
+
+    steps: int = 32
+        Number of precomputed palettes.
+
+    Attributes
+    ----------
+    palettes: list[list[pygame.Color]]
+        The precomputed palettes.
+
+    """
+    def __init__(self, keys, steps=32):
+        keys = [[pygame.Color(c) for c in key] for key in keys]
+        transparent = pygame.Color(0, 0, 0)
+
+        self.palettes = []
+        segments = len(keys) - 1
+        for i in range(steps):
+            t = i / (steps - 1) if steps > 1 else 0
+            if segments:
+                seg = min(int(t * segments), segments - 1)
+                u = t * segments - seg
+                key0, key1 = keys[seg], keys[seg + 1]
+                palette = [c0.lerp(c1, u) for c0, c1 in zip(key0, key1)]
+            else:
+                palette = list(keys[0])
+            self.palettes.append([transparent] + palette)
+
+    def __len__(self):
+        return len(self.palettes)
+
+    def index(self, t):
+        """The index of the palette for `t` 0 - 1."""
+        last = len(self.palettes) - 1
+        return min(max(int(t * last + 0.5), 0), last)
+
+    def __getitem__(self, idx):
+        return self.palettes[idx]
+
+
+class PaletteImage:
+    """A particle image, colored by swapping its palette.
+
+    The shape is drawn only once as an 8 bit index image.  Every particle
+    gets its own scaled copy, which is cheap at a byte per pixel.  Changing
+    its color is then only a palette swap, no pixels are touched.
+
+    Use the object as the `image_factory` of a `tinyecs.compsys.RSAImage`,
+    and add it as `palette` component next to the `particle`.  The
+    `swirlyswirls.compsys.particle_palette_system` then swaps the palette
+    over time.
+
+        image = PaletteImage(shape, fire_gradient, LerpThing(0, 1, lifetime))
+        rsai = RSAImage(None, image_factory=image)
+        ecs.add_component(e, 'rsai', rsai)
+        ecs.add_component(e, 'palette', image)
+
+    Parameters
+    ----------
+    shape: pygame.surface.Surface
+        The 8 bit index image.  This is never modified, so share it between
+        particles.
+
+    gradient: PaletteGradient
+        The palettes to cycle through.
+
+    t: pgcooldown.LerpThing
+        The position within the gradient, usually `LerpThing(0, 1, lifetime)`
+
+    Attributes
+    ----------
+    image: pygame.surface.Surface
+        The most recently created image
+
+    idx: int
+        The index of the current palette in `gradient`
+
+    """
+    def __init__(self, shape, gradient, t):
+        self.shape = shape
+        self.gradient = gradient
+        self.t = t
+        self.idx = gradient.index(t.v)
+        self.image = None
+
+    def __call__(self, rotate=0, scale=1, alpha=255):
+        image = self.shape
+        if scale != 1:
+            w, h = image.get_size()
+            image = pygame.transform.scale(image, (max(1, int(w * scale)),
+                                                   max(1, int(h * scale))))
+        if rotate:
+            image = pygame.transform.rotate(image, rotate)
+        if image is self.shape:
+            image = image.copy()
+
+        image.set_palette(self.gradient[self.idx])
+        image.set_alpha(alpha)
+        self.image = image
+
+        return image
+
+    def update(self):
+        """Swap the palette if `t` moved on to the next one."""
+        idx = self.gradient.index(self.t.v)
+        if idx != self.idx:
+            self.idx = idx
+            if self.image is not None:
+                self.image.set_palette(self.gradient[idx])
+
+
+def to_display_premultiplied(surface):
+    """Convert a particle image to display format with premultiplied alpha.
+
+    The image factories create `SRCALPHA` surfaces and put a surface alpha on
+    top.  Blitting these mixes both alphas, and converts the pixel format on
+    every blit.  This converts the image once to the display format, bakes
+    the surface alpha into the pixels, and premultiplies the colors.
+
+    Blit the result with `pygame.BLEND_PREMULTIPLIED`, e.g. by using a
+    `swirlyswirls.PremultipliedGroup`.
+
+    Note: Without a display mode set, the pixel format can't be converted,
+    so only the alpha is baked in and premultiplied.
+
+    Parameters
+    ----------
+    surface: pygame.surface.Surface
+        The image to convert.  It is not modified.
+
+    Returns
+    -------
+    pygame.surface.Surface
+
+    """
+    alpha = surface.get_alpha()
+
+    if pygame.display.get_surface() is not None:
+        image = surface.convert_alpha()
+    else:
+        image = surface.convert(32, pygame.SRCALPHA) if surface.get_bitsize() != 32 else surface.copy()
+
+    image.set_alpha(None)
+    if alpha is not None and alpha < 255:
+        image.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+
+    return image.premul_alpha()
+
+
+def premultiplied(image_factory):
+    """Wrap an `RSAImage` image factory to produce premultiplied images.
+
+    See `to_display_premultiplied`.
+
+    Parameters
+    ----------
+    image_factory: callable
+        A function called with `rotate`, `scale` and `alpha`.
+
+    Returns
+    -------
+    callable
+        An image factory with the same signature.
+
+    """
+    def premultiplied_image_factory(rotate=0, scale=1, alpha=255):
+        return to_display_premultiplied(image_factory(rotate=rotate, scale=scale, alpha=alpha))
+
+    return premultiplied_image_factory
+
+
+class SurfacePool:
+    """Reusable surface buffers, bucketed by size and flags.
+
+    Particles that change their size over their lifetime create a new surface
+    for nearly every frame.  The pool keeps the pixel buffers of discarded
+    images and hands them out again.
+
+    Sizes are rounded up to a multiple of `granularity`, so a buffer serves a
+    range of sizes.  `acquire` returns a cleared subsurface of the exact
+    requested size, `release` puts its buffer back.
+
+    The image factories in `swirlyswirls.particles` accept a `pool`.  Use
+    `PooledImage` to release an image as soon as it's replaced, or its
+    particle dies.
+
+    Parameters
+    ----------
+    granularity: int = 4
+        Bucket size in pixels.
+
+    max_free: int = 256
+        Maximum number of free buffers kept per bucket.  More are dropped.
+
+    Attributes
+    ----------
+    allocated: int
+        Number of buffers created.
+
+    reused: int
+        Number of buffers handed out again.
+
+    released: int
+        Number of buffers returned.
+
+    """
+    def __init__(self, granularity=4, max_free=256):
+        self.granularity = granularity
+        self.max_free = max_free
+        self.free = defaultdict(list)
+        # The bucket of every buffer, by buffer, so `release` finds it again
+        self._keys = {}
+        self.allocated = 0
+        self.reused = 0
+        self.released = 0
+
+    def _bucket(self, size, flags):
+        g = self.granularity
+        w, h = size
+        return (-(-max(1, int(w)) // g) * g, -(-max(1, int(h)) // g) * g, flags)
+
+    def acquire(self, size, flags=pygame.SRCALPHA):
+        """Get a cleared surface of `size`.
+
+        Parameters
+        ----------
+        size: tuple[float, float]
+            Width and height.  Fractions are truncated like `pygame.Surface`
+            does.
+
+        flags: int = pygame.SRCALPHA
+            See `pygame.Surface`
+
+        Returns
+        -------
+        pygame.surface.Surface
+            A subsurface of a pooled buffer.
+
+        """
+        key = self._bucket(size, flags)
+        free = self.free[key]
+        if free:
+            buffer = free.pop()
+            buffer.fill((0, 0, 0, 0))
+            self.reused += 1
+        else:
+            buffer = pygame.Surface(key[:2], flags=flags)
+            self._keys[buffer] = key
+            self.allocated += 1
+
+        return buffer.subsurface((0, 0, max(1, int(size[0])), max(1, int(size[1]))))
+
+    def release(self, surface):
+        """Return a surface from `acquire` to the pool.
+
+        Don't use the surface afterwards.  Surfaces that didn't come from
+        `acquire` of this pool are ignored.
+
+        """
+        buffer = surface.get_parent()
+        key = self._keys.get(buffer)
+        if key is None:
+            return
+
+        free = self.free[key]
+        if len(free) < self.max_free:
+            free.append(buffer)
+        else:
+            del self._keys[buffer]
+        self.released += 1
+
+    def clear(self):
+        """Drop all free buffers."""
+        for free in self.free.values():
+            for buffer in free:
+                del self._keys[buffer]
+        self.free.clear()
+
+    @property
+    def stats(self):
+        """A dict of the pool statistics, e.g. for an fps display."""
+        return {
+            'allocated': self.allocated,
+            'reused': self.reused,
+            'released': self.released,
+            'free': sum(len(v) for v in self.free.values()),
+        }
+
+
+class PooledImage:
+    """A per particle image factory, drawing into a `SurfacePool`.
+
+    Wraps an `RSAImage` image factory that accepts a `pool` argument, like
+    the ones in `swirlyswirls.particles`.  Every new image releases the
+    previous one to the pool.  Add it as a component to the particle, so the
+    last image is released when the particle is removed.
+
+        def image_factory(rotate, scale, alpha, pool=None):
+            return firesquabble_image_factory(max_size * scale, alpha, pool=pool)
+
+        image = PooledImage(surface_pool, image_factory)
+        rsai = RSAImage(None, image_factory=image)
+        ecs.add_component(e, 'rsai', rsai)
+        ecs.add_component(e, 'pooled-image', image)
+
+    Parameters
+    ----------
+    pool: SurfacePool
+        The pool to draw into.
+
+    image_factory: callable
+        Called with `rotate`, `scale`, `alpha` and `pool`.
+
+    """
+    __slots__ = ('pool', 'image_factory', 'image')
+
+    def __init__(self, pool, image_factory):
+        self.pool = pool
+        self.image_factory = image_factory
+        self.image = None
+
+    def __call__(self, rotate=0, scale=1, alpha=255):
+        previous = self.image
+        self.image = self.image_factory(rotate=rotate, scale=scale, alpha=alpha, pool=self.pool)
+        if previous is not None:
+            self.pool.release(previous)
+
+        return self.image
+
+    def shutdown_(self):
+        if self.image is not None:
+            self.pool.release(self.image)
+            self.image = None
@@ -4,8 +4,67 @@ from functools import partial
 from random import random
 from pygame import Vector2
 
+from swirlyswirls.images import PaletteGradient
 
-def default_image_factory(size, alpha, width=1, color='white'):
+# Palette indices of the index images, see `index_surface`
+TRANSPARENT = 0
+BASE = 1
+HIGHLIGHT = 2
+
+
+def index_surface(size):
+    """Create an empty 8 bit index surface for palette images.
+
+    The index factories below draw their shapes with palette indices instead
+    of colors:
+
+        0: TRANSPARENT, the colorkey
+        1: BASE, the base color
+        2: HIGHLIGHT, the edge color
+
+    Color them with a `swirlyswirls.images.PaletteGradient`, e.g. the
+    `water_gradient`, `fire_gradient` and `poison_gradient` below.
+
+    Parameters
+    ----------
+    size: int
+        Size of the returned surface.
+
+    Returns
+    -------
+    pygame.surface.Surface
+
+    """
+    surface = pygame.Surface((size, size), depth=8)
+    surface.set_palette([(0, 0, 0), (255, 255, 255), (255, 255, 255)])
+    surface.set_colorkey(TRANSPARENT)
+    surface.fill(TRANSPARENT)
+
+    return surface
+
+
+water_gradient = PaletteGradient([('lightblue', 'white'),
+                                  ('steelblue', 'lightblue')])
+water_gradient.__doc__ = 'Palettes for index images, lightblue/white to steelblue/lightblue'
+
+fire_gradient = PaletteGradient([('yellow', 'white'),
+                                 ('orange', 'yellow'),
+                                 ('red', 'orange'),
+                                 ('grey20', 'grey30')])
+fire_gradient.__doc__ = 'Palettes for index images, white hot to smoke'
+
+poison_gradient = PaletteGradient([('palegreen3', 'palegreen1'),
+                                   ('darkolivegreen', 'palegreen3')])
+poison_gradient.__doc__ = 'Palettes for index images, palegreen3/palegreen1 to darkolivegreen'
+
+
+def _surface(size, pool=None):
+    if pool is None:
+        return pygame.Surface((size, size), flags=pygame.SRCALPHA)
+    return pool.acquire((size, size))
+
+
+def default_image_factory(size, alpha, width=1, color='white', pool=None):
     """An image factory for squares.
 
     This is mostly a placeholder for particle classes, but it has basic
@@ -32,12 +91,15 @@ def default_image_factory(size, alpha, width=1, color='white'):
     width: int = 1
         See `pygame.draw,rect`, `width=0` gives a filled square.
 
+    pool: swirlyswirls.images.SurfacePool = None
+        Draw into a pooled surface instead of allocating a new one.
+
     Returns
     -------
     pygame.surface.Surface
 
     """
-    surface = pygame.Surface((size, size), flags=pygame.SRCALPHA)
+    surface = _surface(size, pool)
     surface.fill('white')
 
     surface.set_alpha(alpha)
@@ -45,7 +107,7 @@ def default_image_factory(size, alpha, width=1, color='white'):
     return surface
 
 
-def circle_image_factory(size, alpha, color='white', width=1):
+def circle_image_factory(size, alpha, color='white', width=1, pool=None):
     """An image factory for circles.
 
     This is mostly a placeholder for particle classes, but it has basic
@@ -72,12 +134,15 @@ def circle_image_factory(size, alpha, color='white', width=1):
     width: int = 1
         See `pygame.draw,rect`, `width=0` gives a filled square.
 
+    pool: swirlyswirls.images.SurfacePool = None
+        Draw into a pooled surface instead of allocating a new one.
+
     Returns
     -------
     pygame.surface.Surface
 
     """
-    surface = pygame.Surface((size, size), flags=pygame.SRCALPHA)
+    surface = _surface(size, pool)
 
     r = size // 2
     pygame.draw.circle(surface, color, (r, r), r, width=width)
@@ -90,7 +155,7 @@ def circle_image_factory(size, alpha, color='white', width=1):
 disk_image_factory = partial(circle_image_factory, filled=True)
 
 
-def bubble_image_factory(size, alpha, base_color='lightblue', highlight_color='lightcyan'):
+def bubble_image_factory(size, alpha, base_color='lightblue', highlight_color='lightcyan', pool=None):
     """Image factory for bubbles.
 
     Bubbles are particles with a slightly highlighted edge, that vary in size
@@ -109,20 +174,32 @@ def bubble_image_factory(size, alpha, base_color='lightblue', highlight_color='l
     highlight_color: pygame.Color = 'lightblue'
         Base and edge color of the bubble
 
+    pool: swirlyswirls.images.SurfacePool = None
+        Draw into a pooled surface instead of allocating a new one.
+
     Returns
     -------
     pygame.surface.Surface
 
     """
-    surface = pygame.Surface((size, size), flags=pygame.SRCALPHA)
+    surface = _surface(size, pool)
+    _draw_bubble(surface, size, base_color, highlight_color)
+    surface.set_alpha(alpha)
 
+    return surface
+
+
+def _draw_bubble(surface, size, base_color, highlight_color):
     r = size // 2 - 1
     hl_offset = r / 20
     pygame.draw.circle(surface, highlight_color, (r, r), r)
     pygame.draw.circle(surface, base_color, (r + hl_offset, r), r - hl_offset)
 
-    surface.set_alpha(alpha)
 
+def bubble_index_factory(size):
+    """Index image for bubbles, see `index_surface`."""
+    surface = index_surface(size)
+    _draw_bubble(surface, size, BASE, HIGHLIGHT)
     return surface
 
 
@@ -142,7 +219,7 @@ poisonbubble_image_factory = partial(bubble_image_factory,
 poisonbubble_image_factory.__doc__ = 'See `bubble_image_factory`, palegreen3/palegreen1.'
 
 
-def squabble_image_factory(size, alpha, base_color, highlight_color):
+def squabble_image_factory(size, alpha, base_color, highlight_color, pool=None):
     """Image factory for square bubbles.
 
     Bubbles are particles with a slightly highlighted edge, that vary in size
@@ -161,20 +238,33 @@ def squabble_image_factory(size, alpha, base_color, highlight_color):
     highlight_color: pygame.Color = 'lightblue'
         Base and edge color of the bubble
 
+    pool: swirlyswirls.images.SurfacePool = None
+        Draw into a pooled surface instead of allocating a new one.
+
     Returns
     -------
     pygame.surface.Surface
 
     """
-    surface = pygame.Surface((size, size), flags=pygame.SRCALPHA)
+    surface = _surface(size, pool)
+    _draw_squabble(surface, size, base_color, highlight_color)
+    surface.set_alpha(alpha)
+
+    return surface
+
+
+def _draw_squabble(surface, size, base_color, highlight_color):
     surface.fill(highlight_color)
 
     hl_offset = max(1, size / 20)
     r = surface.get_rect().move(hl_offset, -hl_offset)
     pygame.draw.rect(surface, base_color, r)
 
-    surface.set_alpha(alpha)
 
+def squabble_index_factory(size):
+    """Index image for square bubbles, see `index_surface`."""
+    surface = index_surface(size)
+    _draw_squabble(surface, size, BASE, HIGHLIGHT)
     return surface
 
 
@@ -194,7 +284,7 @@ poisonsquabble_image_factory = partial(squabble_image_factory,
 poisonsquabble_image_factory.__doc__ = 'See `squabble_image_factory`, palegreen3/palegreen1.'
 
 
-def shard_image_factory(size, alpha, base_color, highlight_color):
+def shard_image_factory(size, alpha, base_color, highlight_color, pool=None):
     """Image factory for random shards.
 
     A shard is a random triangle within a surface of size `size`.
@@ -211,26 +301,48 @@ def shard_image_factory(size, alpha, base_color, highlight_color):
     highlight_color: pygame.Color
         Base and edge color of the shard
 
+    pool: swirlyswirls.images.SurfacePool = None
+        Draw into a pooled surface instead of allocating a new one.
+
     Returns
     -------
     pygame.surface.Surface
 
     """
-    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    surface = _surface(size, pool)
+    _draw_shard(surface, size, base_color, highlight_color)
+    surface.set_alpha(alpha)
+
+    return surface
+
+
+def _draw_shard(surface, size, base_color, highlight_color):
     p0 = Vector2(random() * size, random() * size)
     p1 = Vector2(random() * size, random() * size)
     p2 = Vector2(random() * size, random() * size)
     pygame.draw.line(surface, highlight_color, p0, p1, width=2)
     pygame.draw.line(surface, highlight_color, p1, p2, width=2)
     pygame.draw.line(surface, highlight_color, p2, p0, width=2)
-    p0.move(1, 0)
-    p1.move(1, 0)
-    p2.move(1, 0)
+    p0.x += 1
+    p1.x += 1
+    p2.x += 1
     pygame.draw.line(surface, highlight_color, p0, p1, width=0)
     pygame.draw.line(surface, highlight_color, p1, p2, width=0)
     pygame.draw.line(surface, highlight_color, p2, p0, width=0)
 
 
+def shard_index_factory(size):
+    """Index image for random shards, see `index_surface`.
+
+    Every call draws a new random shard, so create a few and share them
+    between the particles.
+
+    """
+    surface = index_surface(size)
+    _draw_shard(surface, size, BASE, HIGHLIGHT)
+    return surface
+
+
 watershard_image_factory = partial(shard_image_factory,
                                    base_color='lightblue',
                                    highlight_color='white')
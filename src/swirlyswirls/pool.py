@@ -0,0 +1,337 @@
+"""Recycling of particle and emitter entities.
+
+Particles are short lived.  Every one of them creates an entity, a handful of
+vectors, cooldowns, images and sprites, just to throw them all away a second
+later.  The `ParticlePool` keeps the components of dead particles around and
+hands them out again for the next particle.
+
+The `EmitterPool` does the same for emitters that are launched over and over
+again, e.g. for explosions.
+
+"""
+import pygame
+import tinyecs as ecs
+
+from pgcooldown import Cooldown
+from pygame import Vector2
+
+from swirlyswirls.compsys import KEEP
+
+__all__ = ['EmitterPool', 'ParticlePool', 'PoolTicket', 'recycle_particle']
+
+
+def recycle_particle(components, t, position, momentum):
+    """The default `recycle` function of the `ParticlePool`.
+
+    Moves the particle to its new `position`, sets its `momentum`, and resets
+    its `lifetime`, the lerps of its `particle` and its `sub-emitter`.  Other
+    components are left untouched.
+
+    Parameters
+    ----------
+    components: dict[hashable, any]
+        The components of the recycled particle, cid as key.
+
+    t: float
+    position: Vector2
+    momentum: Vector2
+        See `swirlyswirls.Emitter.particle_factory`
+
+    """
+    if 'position' in components:
+        components['position'].update(position)
+    if 'momentum' in components:
+        components['momentum'].update(momentum)
+    if 'lifetime' in components:
+        components['lifetime'].reset()
+    if 'particle' in components:
+        components['particle'].reset()
+    if 'sub-emitter' in components:
+        components['sub-emitter'].reset()
+
+
+class PoolTicket:
+    """The component that returns a particle to its pool.
+
+    When the entity is removed, tinyecs calls `shutdown_` on all its
+    components.  The ticket uses this to hand the components back to the
+    pool, no matter if the particle died from its lifetime or was killed
+    otherwise.
+
+    There is no need to create this yourself, the `ParticlePool` adds it to
+    every particle it creates as the `pool-ticket` component.
+
+    """
+    __slots__ = ('pool', 'eid', 'components', 'groups')
+
+    def __init__(self, pool, eid, components):
+        self.pool = pool
+        self.eid = eid
+        self.components = components
+        # Sprites are killed on shutdown, so remember where to put them back
+        self.groups = [(comp, comp.groups()) for comp in components.values()
+                       if isinstance(comp, pygame.sprite.Sprite)]
+
+    def shutdown_(self):
+        self.pool.release(self)
+
+
+class ParticlePool:
+    """A particle factory that recycles dead particles.
+
+    Use the pool as `particle_factory` of an `Emitter`.  If a dead particle
+    is available, its components are reset by `recycle` and the entity is
+    revived with its old EID.  Only if the pool is empty, `build` is called to
+    create new components.
+
+    Since nothing is thrown away anymore, the pool grows to the largest number
+    of simultaneously living particles and stays there.
+
+        def build(t, position, momentum, group):
+            rsai = RSAImage(None, image_factory=image_factory)
+            return {
+                'particle': Particle(alpha=LerpThing(255, 0, 1)),
+                'rsai': rsai,
+                'sprite': EVSprite(rsai, group),
+                'position': Vector2(position),
+                'momentum': Vector2(momentum),
+                'lifetime': Cooldown(1),
+            }
+
+        emitter = Emitter(..., particle_factory=ParticlePool(partial(build, group=group)))
+
+    Note: The pool tracks the particle through the `pool-ticket` component.
+    It's not recycled if that component is removed while the entity lives on.
+
+    Parameters
+    ----------
+    build: callable
+        Called with `t`, `position` and `momentum` (see
+        `swirlyswirls.Emitter.particle_factory`).  Expected to return a dict
+        with cid as key and the component as value.  The components must not
+        be shared with other particles.
+
+    recycle: callable = recycle_particle
+        Called with the components dict of a dead particle, and `t`,
+        `position`, `momentum` of the new one.  Expected to reset the
+        components in place.
+
+    simulation: swirlyswirls.Simulation = None
+        If the particles are run by a `Simulation`, tell it about revived
+        particles, so they aren't interpolated from their last life.
+
+    query_cache: swirlyswirls.queries.QueryCache = None
+        Track every new or revived particle in this cache.  Without it,
+        revived particles drop out of the cached queries.
+
+    Attributes
+    ----------
+    build, recycle, simulation, query_cache
+        See Parameters
+
+    built: int
+        Number of particles created by `build`
+
+    reused: int
+        Number of particles revived from the pool
+
+    live: int
+        Number of currently living particles
+
+    high_water: int
+        Largest number of simultaneously living particles
+
+    """
+    def __init__(self, build, recycle=recycle_particle, simulation=None, query_cache=None):
+        self.build = build
+        self.recycle = recycle
+        self.simulation = simulation
+        self.query_cache = query_cache
+        self.free = []
+        self.built = 0
+        self.reused = 0
+        self.live = 0
+        self.high_water = 0
+
+    def __call__(self, t, position, momentum):
+        """Spawn a particle, see `swirlyswirls.Emitter.particle_factory`.
+
+        Returns
+        -------
+        EID
+            The EID of the particle entity.
+
+        """
+        if self.free:
+            ticket = self.free.pop()
+            components = ticket.components
+            self.recycle(components, t=t, position=position, momentum=momentum)
+            for sprite, groups in ticket.groups:
+                sprite.add(*groups)
+            eid = ecs.create_entity(ticket.eid)
+            if self.simulation is not None:
+                self.simulation.forget(eid)
+            self.reused += 1
+        else:
+            components = self.build(t=t, position=position, momentum=momentum)
+            eid = ecs.create_entity()
+            ticket = PoolTicket(self, eid, components)
+            self.built += 1
+
+        for cid, comp in components.items():
+            ecs.add_component(eid, cid, comp)
+        ecs.add_component(eid, 'pool-ticket', ticket)
+        if self.query_cache is not None:
+            self.query_cache.track(eid)
+
+        self.live += 1
+        if self.live > self.high_water:
+            self.high_water = self.live
+
+        return eid
+
+    def release(self, ticket):
+        """Return a particle to the pool.  Called by `PoolTicket.shutdown_`."""
+        self.live -= 1
+        self.free.append(ticket)
+
+    def clear(self):
+        """Drop all dead particles, e.g. after a burst of activity."""
+        self.free.clear()
+
+    @property
+    def stats(self):
+        """A dict of the pool statistics, e.g. for an fps display."""
+        return {
+            'built': self.built,
+            'reused': self.reused,
+            'live': self.live,
+            'free': len(self.free),
+            'high_water': self.high_water,
+        }
+
+
+class EmitterPool:
+    """Launch emitter entities, reusing expired ones.
+
+    Instead of building a new `Emitter` for every explosion, `launch` takes
+    an expired emitter entity from the pool, re-arms it with
+    `Emitter.reset`, and revives it with its old EID.  Only if the pool is
+    empty, `build` is called.
+
+        explosions = EmitterPool(partial(Emitter, ept=LerpThing(2, 5, 1),
+                                         zone=ZoneCircle(r1=16),
+                                         particle_factory=factory),
+                                 lifetime=1)
+
+        explosions.launch(position)
+
+    Every emitter entity has the components `emitter`, `position`,
+    `momentum`, and `lifetime` if a lifetime is given.  The emitter returns
+    to the pool when its entity is removed, e.g. when its `lifetime`
+    expires.
+
+    Parameters
+    ----------
+    build: callable
+        Parameterless, returns a new `swirlyswirls.Emitter`, e.g. a `partial`
+        of it.
+
+    lifetime: float = None
+        The lifetime of the emitter entities.  Without it, the entities
+        need to be removed by other means.
+
+    size: int = 0
+        Number of emitters to build in advance.
+
+    simulation: swirlyswirls.Simulation = None
+    query_cache: swirlyswirls.queries.QueryCache = None
+        See `ParticlePool`.
+
+    Attributes
+    ----------
+    built, reused, live, high_water
+        See `ParticlePool`
+
+    """
+    def __init__(self, build, lifetime=None, size=0, simulation=None, query_cache=None):
+        self.build = build
+        self.lifetime = lifetime
+        self.simulation = simulation
+        self.query_cache = query_cache
+        self.built = 0
+        self.reused = 0
+        self.live = 0
+        self.high_water = 0
+        self.free = [self._build() for _ in range(size)]
+
+    def _build(self):
+        components = {
+            'emitter': self.build(),
+            'position': Vector2(),
+            'momentum': Vector2(),
+        }
+        if self.lifetime is not None:
+            components['lifetime'] = Cooldown(self.lifetime)
+
+        self.built += 1
+        return PoolTicket(self, None, components)
+
+    def launch(self, position, momentum=None, ept=None, total_emits=KEEP):
+        """Launch an emitter.
+
+        Parameters
+        ----------
+        position: Vector2
+            Position of the emitter entity.
+
+        momentum: Vector2 = None
+            Momentum of the emitter entity.  Defaults to no movement.
+
+        ept, total_emits
+            See `swirlyswirls.Emitter.reset`
+
+        Returns
+        -------
+        EID
+            The EID of the emitter entity.
+
+        """
+        if self.free:
+            ticket = self.free.pop()
+            # Emitters built in advance have no EID yet, they aren't reused
+            if ticket.eid is not None:
+                self.reused += 1
+        else:
+            ticket = self._build()
+
+        components = ticket.components
+        components['emitter'].reset(ept=ept, total_emits=total_emits)
+        components['position'].update(position)
+        if momentum is None:
+            components['momentum'].update(0, 0)
+        else:
+            components['momentum'].update(momentum)
+        if 'lifetime' in components:
+            components['lifetime'].reset()
+
+        eid = ecs.create_entity(ticket.eid)
+        ticket.eid = eid
+        if self.simulation is not None:
+            self.simulation.forget(eid)
+        for cid, comp in components.items():
+            ecs.add_component(eid, cid, comp)
+        ecs.add_component(eid, 'pool-ticket', ticket)
+        if self.query_cache is not None:
+            self.query_cache.track(eid)
+
+        self.live += 1
+        if self.live > self.high_water:
+            self.high_water = self.live
+
+        return eid
+
+    def release(self, ticket):
+        """Return an emitter to the pool.  Called by `PoolTicket.shutdown_`."""
+        self.live -= 1
+        self.free.append(ticket)
@@ -0,0 +1,179 @@
+"""Cached entity queries for the hot systems.
+
+`tinyecs.run_system` matches the components of the entities against the
+requested cids on every call.  With thousands of particles and half a dozen
+systems, that matching is paid many times per frame for an answer that
+barely changes.
+
+A `QueryCache` keeps the matching entities and their component tuples per
+cid tuple, and updates them when entities are tracked or removed.  Systems
+run on the prebuilt lists.
+
+    cache = QueryCache()
+
+    def particle_factory(t, position, momentum):
+        return cache.create_entity({'particle': ..., 'position': Vector2(position), ...})
+
+    def update(self, dt):
+        cache.run_system(dt, swirlyswirls.emitter_system, 'emitter', 'position')
+        cache.run_system(dt, tinyecs.components.momentum_system, 'momentum', 'position')
+
+Entities created elsewhere can be added with `track`.  Removing entities is
+noticed automatically, through the `query-ticket` component the cache adds.
+Components added or removed later need to go through `add_component` and
+`remove_component` of the cache, otherwise the cache goes stale.  Pass the
+cache as `query_cache` to `Family`, `ParticlePool`, `EmitterPool` and
+`SubEmitter`, so they do the same.
+
+"""
+import tinyecs as ecs
+
+__all__ = ['Query', 'QueryCache']
+
+
+class Query:
+    """The entities having all of `cids`, with their components.
+
+    Attributes
+    ----------
+    cids: tuple[hashable]
+        The component ids of the query.
+
+    entities: dict[EID, tuple]
+        The components of every matching entity, in the order of `cids`.
+
+    """
+    __slots__ = ('cids', 'entities', '_rows')
+
+    def __init__(self, cids):
+        self.cids = cids
+        self.entities = {}
+        self._rows = None
+
+    def __len__(self):
+        return len(self.entities)
+
+    def rows(self):
+        """The `(eid, components)` pairs as a list, rebuilt only after changes."""
+        if self._rows is None:
+            self._rows = list(self.entities.items())
+        return self._rows
+
+    def _add(self, eid):
+        self.entities[eid] = tuple(ecs.comp_of_eid(eid, cid) for cid in self.cids)
+        self._rows = None
+
+    def _discard(self, eid):
+        if self.entities.pop(eid, None) is not None:
+            self._rows = None
+
+
+class _QueryTicket:
+    """Removes the entity from the cache when tinyecs removes it."""
+    __slots__ = ('cache', 'eid')
+
+    def __init__(self, cache, eid):
+        self.cache = cache
+        self.eid = eid
+
+    def shutdown_(self):
+        self.cache._forget(self.eid)
+
+
+class QueryCache:
+    """Incrementally maintained entity queries.
+
+    Attributes
+    ----------
+    queries: dict[tuple, Query]
+        The queries by cid tuple.
+
+    tracked: set[EID]
+        The entities known to the cache.
+
+    """
+    def __init__(self):
+        self.queries = {}
+        self.tracked = set()
+
+    def query(self, *cids):
+        """The `Query` for `cids`, created on first use.
+
+        A new query is filled from the entities the cache already tracks.
+
+        """
+        try:
+            return self.queries[cids]
+        except KeyError:
+            pass
+
+        query = self.queries[cids] = Query(cids)
+        for eid in self.tracked:
+            if _has_all(eid, cids):
+                query._add(eid)
+        return query
+
+    def track(self, eid):
+        """Add the existing entity `eid` to all matching queries."""
+        if eid not in self.tracked:
+            self.tracked.add(eid)
+            ecs.add_component(eid, 'query-ticket', _QueryTicket(self, eid))
+
+        for cids, query in self.queries.items():
+            if eid not in query.entities and _has_all(eid, cids):
+                query._add(eid)
+
+        return eid
+
+    def create_entity(self, components, eid=None):
+        """Create an entity from a dict of cid/component and track it.
+
+        Returns
+        -------
+        EID
+
+        """
+        eid = ecs.create_entity(eid)
+        for cid, comp in components.items():
+            ecs.add_component(eid, cid, comp)
+        return self.track(eid)
+
+    def add_component(self, eid, cid, comp):
+        """`tinyecs.add_component`, keeping the queries up to date."""
+        ecs.add_component(eid, cid, comp)
+        if eid not in self.tracked:
+            self.track(eid)
+            return
+
+        for cids, query in self.queries.items():
+            if cid in cids and _has_all(eid, cids):
+                query._add(eid)
+
+    def remove_component(self, eid, cid):
+        """`tinyecs.remove_component`, keeping the queries up to date."""
+        ecs.remove_component(eid, cid)
+        for cids, query in self.queries.items():
+            if cid in cids:
+                query._discard(eid)
+
+    def _forget(self, eid):
+        self.tracked.discard(eid)
+        for query in self.queries.values():
+            query._discard(eid)
+
+    def run_system(self, dt, fn, *cids, **kwargs):
+        """Run a system on the cached entities of `cids`.
+
+        Same as `tinyecs.run_system`, but only for tracked entities.
+        Entities removed while the system runs are skipped.
+
+        """
+        query = self.query(*cids)
+        entities = query.entities
+        for eid, comps in query.rows():
+            if eid in entities:
+                fn(dt, eid, *comps, **kwargs)
+
+
+def _has_all(eid, cids):
+    return all(ecs.eid_has(eid, cid) for cid in cids)
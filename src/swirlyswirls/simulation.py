@@ -0,0 +1,141 @@
+"""A fixed timestep driver for the particle systems.
+
+Running the systems once per rendered frame with a variable `dt` makes motion
+jittery on frame spikes, and ties the cost of the simulation to the frame
+rate.  The `Simulation` steps its systems at a fixed rate instead, which can
+be lower than the frame rate, and interpolates the sprite positions between
+the last two steps for rendering.
+
+"""
+import tinyecs as ecs
+
+__all__ = ['Simulation']
+
+
+class Simulation:
+    """Step particle systems at a fixed rate, decoupled from rendering.
+
+    Register the simulation systems (emitters, motion, ...) here instead of
+    with `tinyecs.add_system`.  In the game loop, call `update` with the frame
+    time, then place the sprites with `sprite_system`, which replaces
+    `tinyecs.components.sprite_system`.
+
+        sim = Simulation(rate=30)
+        sim.add_system(swirlyswirls.emitter_system, 'emitter', 'position')
+        sim.add_system(tinyecs.components.momentum_system, 'momentum', 'position')
+        sim.add_system(tinyecs.components.lifetime_system, 'lifetime')
+
+        def update(self, dt):
+            sim.update(dt)
+            ecs.run_system(dt, sim.sprite_system, 'sprite', 'position')
+
+    Note, that `Cooldown` and `LerpThing` run on wall clock time, they are
+    not affected by the step rate.  To not lose emits at low rates, set
+    `Emitter.catchup` to fire all heartbeats that were due within a step.
+
+    Entities that are removed and created again with the same EID within a
+    step, like the ones of `ParticlePool` and `EmitterPool`, would be drawn
+    between the end of their old and the start of their new life.  Pass the
+    simulation to the pools, or call `forget` when reviving entities
+    yourself.
+
+    Parameters
+    ----------
+    rate: float = 30
+        Steps per second.
+
+    max_steps: int = 5
+        The maximum number of steps per `update`.  If the simulation falls
+        further behind, e.g. after a long frame, the backlog is dropped
+        instead of spiraling into ever longer frames.
+
+    Attributes
+    ----------
+    step: float
+        The fixed `dt` passed into the systems, `1 / rate`.
+
+    alpha: float
+        The position of the current frame between the last two steps, 0..1.
+
+    steps: int
+        Total number of steps run.
+
+    """
+    def __init__(self, rate=30, max_steps=5):
+        self.step = 1 / rate
+        self.max_steps = max_steps
+        self.systems = {}
+        self.accumulator = 0
+        self.alpha = 0
+        self.steps = 0
+        self.previous = {}
+
+    def add_system(self, fn, *cids):
+        """Add a system to run at the fixed rate.  See `tinyecs.add_system`."""
+        self.systems[fn] = cids
+
+    def remove_system(self, fn):
+        """Remove a system.  Unknown systems are silently ignored."""
+        self.systems.pop(fn, None)
+
+    def update(self, dt):
+        """Run all steps that are due after `dt` seconds.
+
+        Parameters
+        ----------
+        dt: float
+            The frame time.
+
+        Returns
+        -------
+        int
+            The number of steps that were run.
+
+        """
+        step = self.step
+        self.accumulator += dt
+        steps = min(int(self.accumulator / step), self.max_steps)
+
+        for i in range(steps):
+            # Only the state before the final step is needed for interpolation
+            if i == steps - 1:
+                self.previous.clear()
+                ecs.run_system(0, self._snapshot_system, 'sprite', 'position')
+
+            for fn, cids in self.systems.items():
+                ecs.run_system(step, fn, *cids)
+
+            self.accumulator -= step
+
+        # Drop what we can't catch up with
+        if self.accumulator >= step:
+            self.accumulator %= step
+
+        self.steps += steps
+        self.alpha = self.accumulator / step
+
+        return steps
+
+    def forget(self, eid):
+        """Don't interpolate `eid` from its last position, e.g. on respawn."""
+        self.previous.pop(eid, None)
+
+    def _snapshot_system(self, dt, eid, sprite, position):
+        self.previous[eid] = (position.x, position.y)
+
+    def sprite_system(self, dt, eid, sprite, position):
+        """Place the sprite between the last two simulated positions.
+
+        Run this after `update` on `'sprite', 'position'` instead of
+        `tinyecs.components.sprite_system`.
+
+        """
+        prev = self.previous.get(eid)
+        if prev is None:
+            sprite.rect.center = position
+            return
+
+        alpha = self.alpha
+        x0, y0 = prev
+        sprite.rect.center = (x0 + (position.x - x0) * alpha,
+                              y0 + (position.y - y0) * alpha)
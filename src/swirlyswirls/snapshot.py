@@ -0,0 +1,415 @@
+"""Save and restore the state of running effects.
+
+Zones, factories and images are code, not data, so a snapshot doesn't try to
+store them.  It stores the numbers that change while an effect runs, and is
+restored onto emitters that were built again by the same code that built
+them in the first place:
+
+    * per emitter: position, momentum, `tick` and the position in the
+      `ticklist`, `remaining`, `dormant`, the `ept` lerp, the `lifetime` of
+      the entity, and the state of `Halton` objects used by its zone,
+    * per live particle: position, momentum and age,
+    * the state of the `random` module.
+
+Particles are found through the `Family` of their emitter, so only emitters
+with a `family` get their particles saved.
+
+    snapshot = Snapshot.take({'fountain': fountain_eid, 'smoke': smoke_eid})
+    snapshot.save('level-1.swirls')
+
+    ...
+
+    snapshot = Snapshot.load('level-1.swirls')
+    snapshot.restore({'fountain': fountain_eid, 'smoke': smoke_eid})
+
+Everything is stored in columns, one array per value, in a binary file.
+`Snapshot.load` memory maps the file, so the columns are used in place,
+without parsing or copying.  Snapshots don't need a file though, e.g. for
+rollback, keep the `Snapshot` object and `restore` it when needed.
+
+"""
+import mmap
+import random
+import struct
+import sys
+
+from array import array
+from math import isnan, nan
+
+import tinyecs as ecs
+
+from pygame import Vector2
+
+from swirlyswirls.compsys import age_particle
+from swirlyswirls.zones import Halton
+
+__all__ = ['Snapshot']
+
+MAGIC = b'SWIRLS\x00\x01'
+
+# magic, byte order, number of columns
+_HEADER = struct.Struct('<8s8sQ')
+# name, typecode, length, offset
+_ENTRY = struct.Struct('<32s8sQQ')
+
+_EMITTER_COLUMNS = {
+    'emitter.x': 'd', 'emitter.y': 'd', 'emitter.mx': 'd', 'emitter.my': 'd',
+    'emitter.tick': 'd', 'emitter.tick-remaining': 'd', 'emitter.phase': 'q',
+    'emitter.remaining': 'q', 'emitter.dormant': 'q',
+    'emitter.ept-vt0': 'd', 'emitter.ept-vt1': 'd',
+    'emitter.ept-duration': 'd', 'emitter.ept-remaining': 'd',
+    'emitter.lifetime': 'd', 'emitter.lifetime-remaining': 'd',
+    'emitter.particles': 'q',
+}
+_PARTICLE_COLUMNS = {
+    'particle.x': 'd', 'particle.y': 'd', 'particle.mx': 'd', 'particle.my': 'd',
+    'particle.age': 'd',
+}
+_HALTON_COLUMNS = {
+    'halton.emitter': 'q', 'halton.slot': 'q', 'halton.dims': 'q',
+    'halton.index': 'q', 'halton.dim': 'q',
+}
+_HALTON_SLOTS = ('rnd_p', 'rnd_m')
+
+
+class Snapshot:
+    """The state of a set of emitters and their particles, as columns.
+
+    Use `take` or `load` to get one.
+
+    Parameters
+    ----------
+    columns: dict[str, array | memoryview]
+        The columns by name.
+
+    Attributes
+    ----------
+    columns
+        See Parameters
+
+    names: list[str]
+        The names of the emitters, in the order of the emitter columns.
+
+    """
+    def __init__(self, columns, mapping=None, view=None):
+        self.columns = columns
+        self.names = bytes(columns['emitter.names']).decode('utf-8').split('\0')
+        if self.names == ['']:
+            self.names = []
+        self._mmap = mapping
+        self._view = view
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        """The number of particles in the snapshot."""
+        return len(self.columns['particle.x'])
+
+    @classmethod
+    def take(cls, emitters):
+        """Snapshot the emitters in `emitters` and their particles.
+
+        Parameters
+        ----------
+        emitters: dict[str, EID]
+            The emitter entities by name.  The names connect the saved state
+            with the emitters passed into `restore`.
+
+        Returns
+        -------
+        Snapshot
+
+        """
+        columns = {name: array(code) for name, code in _EMITTER_COLUMNS.items()}
+        columns.update((name, array(code)) for name, code in _PARTICLE_COLUMNS.items())
+        columns.update((name, array(code)) for name, code in _HALTON_COLUMNS.items())
+        columns['halton.offsets'] = array('d')
+
+        for row, eid in enumerate(emitters.values()):
+            emitter = ecs.comp_of_eid(eid, 'emitter')
+            _take_emitter(columns, row, eid, emitter)
+
+            particles = emitter.family.of(eid) if emitter.family is not None else ()
+            n = 0
+            for p_eid in particles:
+                if ecs.eid_has(p_eid, 'position'):
+                    _take_particle(columns, p_eid)
+                    n += 1
+            columns['emitter.particles'].append(n)
+
+        state = random.getstate()
+        columns['random.state'] = array('q', state[1])
+        columns['random.gauss'] = array('d', [nan if state[2] is None else state[2]])
+        columns['emitter.names'] = array('B', '\0'.join(emitters).encode('utf-8'))
+
+        return cls(columns)
+
+    def save(self, path):
+        """Write the snapshot into the file `path`."""
+        byteorder = sys.byteorder.encode('ascii')
+        entries = []
+        offset = _align(_HEADER.size + _ENTRY.size * len(self.columns))
+        for name, column in self.columns.items():
+            length = len(column)
+            code = column.format if isinstance(column, memoryview) else column.typecode
+            entries.append(_ENTRY.pack(name.encode('utf-8'), code.encode('ascii'), length, offset))
+            offset = _align(offset + length * column.itemsize)
+
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, byteorder, len(entries)))
+            f.writelines(entries)
+            for column in self.columns.values():
+                _pad(f)
+                f.write(column)
+
+    @classmethod
+    def load(cls, path):
+        """Memory map the snapshot file at `path`.
+
+        The file stays mapped until `close` is called, or the `with` block
+        around the snapshot is left.
+
+        Returns
+        -------
+        Snapshot
+
+        Raises
+        ------
+        ValueError
+            If the file is not a snapshot, or was written on a machine with a
+            different byte order.
+
+        """
+        with open(path, 'rb') as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(mapping)
+        columns = {}
+        try:
+            magic, byteorder, n = _HEADER.unpack_from(mapping)
+            if magic != MAGIC:
+                raise ValueError(f'{path} is not a swirlyswirls snapshot')
+            byteorder = byteorder.rstrip(b'\0').decode('ascii')
+            if byteorder != sys.byteorder:
+                raise ValueError(f'{path} was saved with {byteorder} endian byte order')
+
+            for i in range(n):
+                name, code, length, offset = _ENTRY.unpack_from(mapping, _HEADER.size + i * _ENTRY.size)
+                code = code.rstrip(b'\0').decode('ascii')
+                size = struct.calcsize(code)
+                columns[name.rstrip(b'\0').decode('utf-8')] = view[offset:offset + length * size].cast(code)
+        except Exception:
+            for column in columns.values():
+                column.release()
+            view.release()
+            mapping.close()
+            raise
+
+        return cls(columns, mapping, view)
+
+    def close(self):
+        """Release the memory map of a loaded snapshot."""
+        if self._mmap is not None:
+            for column in self.columns.values():
+                column.release()
+            self.columns = {}
+            self._view.release()
+            self._view = None
+            self._mmap.close()
+            self._mmap = None
+
+    def restore(self, emitters, particles=True, rng=True):
+        """Put the saved state into the emitters and respawn their particles.
+
+        The emitters need to be built the same way as when the snapshot was
+        taken.  Only the state listed in the module documentation is
+        restored, everything else is taken from the emitter as it is.
+
+        The current particles of the emitters are removed, and the saved ones
+        are created by the particle factories of their emitters, then aged to
+        their saved age.  `t` for the factory is derived from the age and the
+        emitter.
+
+        Parameters
+        ----------
+        emitters: dict[str, EID]
+            The emitter entities by name.  Names unknown to the snapshot are
+            ignored.
+
+        particles: bool = True
+            Respawn the particles.
+
+        rng: bool = True
+            Restore the state of the `random` module.
+
+        """
+        columns = self.columns
+        rows = {name: row for row, name in enumerate(self.names)}
+        starts = [0]
+        for n in columns['emitter.particles']:
+            starts.append(starts[-1] + n)
+
+        for name, eid in emitters.items():
+            row = rows.get(name)
+            if row is None:
+                continue
+
+            emitter = ecs.comp_of_eid(eid, 'emitter')
+            _restore_emitter(columns, row, eid, emitter)
+            if particles:
+                _restore_particles(columns, starts[row], starts[row + 1], eid, emitter)
+
+        _restore_haltons(columns, rows, emitters)
+
+        if rng:
+            gauss = columns['random.gauss'][0]
+            random.setstate((3, tuple(columns['random.state']), None if isnan(gauss) else gauss))
+
+
+def _take_emitter(columns, row, eid, emitter):
+    position = ecs.comp_of_eid(eid, 'position')
+    momentum = ecs.comp_of_eid(eid, 'momentum') if ecs.eid_has(eid, 'momentum') else (nan, nan)
+    if ecs.eid_has(eid, 'lifetime'):
+        lifetime = ecs.comp_of_eid(eid, 'lifetime')
+        lifetime = (lifetime.duration, lifetime.remaining)
+    else:
+        lifetime = (nan, nan)
+    ept = emitter.ept
+
+    for cid, value in (('emitter.x', position[0]), ('emitter.y', position[1]),
+                       ('emitter.mx', momentum[0]), ('emitter.my', momentum[1]),
+                       ('emitter.tick', emitter.tick.duration),
+                       ('emitter.tick-remaining', emitter.tick.remaining),
+                       ('emitter.phase', emitter.phase),
+                       ('emitter.remaining', emitter.remaining),
+                       ('emitter.dormant', emitter.dormant),
+                       ('emitter.ept-vt0', ept.vt0), ('emitter.ept-vt1', ept.vt1),
+                       ('emitter.ept-duration', ept.duration.duration),
+                       ('emitter.ept-remaining', ept.duration.remaining),
+                       ('emitter.lifetime', lifetime[0]),
+                       ('emitter.lifetime-remaining', lifetime[1])):
+        columns[cid].append(value)
+
+    for slot, attr in enumerate(_HALTON_SLOTS):
+        halton = getattr(emitter.zone, attr, None)
+        if isinstance(halton, Halton):
+            columns['halton.emitter'].append(row)
+            columns['halton.slot'].append(slot)
+            columns['halton.dims'].append(halton.dims)
+            columns['halton.index'].append(halton.index)
+            columns['halton.dim'].append(halton.dim)
+            columns['halton.offsets'].extend(halton.offsets)
+
+
+def _take_particle(columns, eid):
+    position = ecs.comp_of_eid(eid, 'position')
+    momentum = ecs.comp_of_eid(eid, 'momentum') if ecs.eid_has(eid, 'momentum') else (nan, nan)
+
+    if ecs.eid_has(eid, 'lifetime'):
+        cooldown = ecs.comp_of_eid(eid, 'lifetime')
+    else:
+        particle = ecs.comp_of_eid(eid, 'particle') if ecs.eid_has(eid, 'particle') else None
+        lerp = particle and (particle.alpha or particle.scale or particle.rotate)
+        cooldown = lerp.duration if lerp else None
+    age = cooldown.duration - cooldown.remaining if cooldown is not None else 0
+
+    columns['particle.x'].append(position[0])
+    columns['particle.y'].append(position[1])
+    columns['particle.mx'].append(momentum[0])
+    columns['particle.my'].append(momentum[1])
+    columns['particle.age'].append(age)
+
+
+def _restore_emitter(columns, row, eid, emitter):
+    ecs.comp_of_eid(eid, 'position').update(columns['emitter.x'][row], columns['emitter.y'][row])
+
+    mx = columns['emitter.mx'][row]
+    if not isnan(mx) and ecs.eid_has(eid, 'momentum'):
+        ecs.comp_of_eid(eid, 'momentum').update(mx, columns['emitter.my'][row])
+
+    lifetime = columns['emitter.lifetime'][row]
+    if not isnan(lifetime) and ecs.eid_has(eid, 'lifetime'):
+        cooldown = ecs.comp_of_eid(eid, 'lifetime')
+        cooldown.reset(lifetime)
+        cooldown.remaining = columns['emitter.lifetime-remaining'][row]
+
+    emitter.tick.reset(columns['emitter.tick'][row])
+    emitter.tick.remaining = columns['emitter.tick-remaining'][row]
+    emitter.seek_tick(columns['emitter.phase'][row])
+    emitter.remaining = columns['emitter.remaining'][row]
+    emitter.dormant = bool(columns['emitter.dormant'][row])
+
+    ept = emitter.ept
+    ept.vt0 = columns['emitter.ept-vt0'][row]
+    ept.vt1 = columns['emitter.ept-vt1'][row]
+    ept.duration.reset(columns['emitter.ept-duration'][row])
+    ept.duration.remaining = columns['emitter.ept-remaining'][row]
+
+
+def _restore_particles(columns, start, end, eid, emitter):
+    family = emitter.family
+    if family is not None:
+        family.kill(eid)
+    if start == end:
+        return
+
+    xs, ys = columns['particle.x'], columns['particle.y']
+    mxs, mys = columns['particle.mx'], columns['particle.my']
+    ages = columns['particle.age']
+
+    positions = [Vector2(xs[i], ys[i]) for i in range(start, end)]
+    momentums = [Vector2(0, 0) if isnan(mxs[i]) else Vector2(mxs[i], mys[i]) for i in range(start, end)]
+
+    factory = emitter.particle_factory
+    p_eids = [factory(t=_spawn_t(eid, emitter, ages[i]), position=position, momentum=momentum)
+              for i, position, momentum in zip(range(start, end), positions, momentums)]
+
+    for i, p_eid in zip(range(start, end), p_eids):
+        if p_eid is None:
+            continue
+        if ages[i]:
+            age_particle(p_eid, ages[i])
+        if family is not None:
+            family.adopt(eid, p_eid)
+
+
+def _restore_haltons(columns, rows, emitters):
+    emitters = {rows[name]: eid for name, eid in emitters.items() if name in rows}
+    offsets = columns['halton.offsets']
+    start = 0
+    for i, row in enumerate(columns['halton.emitter']):
+        dims = columns['halton.dims'][i]
+        if row in emitters:
+            attr = _HALTON_SLOTS[columns['halton.slot'][i]]
+            halton = getattr(ecs.comp_of_eid(emitters[row], 'emitter').zone, attr, None)
+            if not isinstance(halton, Halton) or halton.dims != dims:
+                raise ValueError(f'{attr} of the zone of {emitters[row]} is not a Halton with {dims} dims')
+
+            halton.index = columns['halton.index'][i]
+            halton.dim = columns['halton.dim'][i]
+            halton.offsets = list(offsets[start:start + dims])
+        start += dims
+
+
+def _spawn_t(eid, emitter, age):
+    """The `t` of the emitter `age` seconds ago.  See `emitter_system`."""
+    duration = emitter.ept.duration
+    if not duration.duration and ecs.eid_has(eid, 'lifetime'):
+        duration = ecs.comp_of_eid(eid, 'lifetime')
+    if not duration.duration:
+        return 0
+
+    elapsed = duration.duration - duration.remaining - age
+    return min(1, max(0, elapsed / duration.duration))
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+def _pad(f):
+    f.write(b'\0' * (_align(f.tell()) - f.tell()))
@@ -1,5 +1,7 @@
 import pygame
 
+from collections import deque
+
 
 class ReversedGroup(pygame.sprite.Group):
     """Identical with pygame.sprite.Group, except the order of sprites is reversed.
@@ -9,3 +11,133 @@ class ReversedGroup(pygame.sprite.Group):
     """
     def sprites(self):
         return list(reversed(self.spritedict))
+
+
+class PremultipliedGroup(pygame.sprite.Group):
+    """A pygame.sprite.Group that blits with `pygame.BLEND_PREMULTIPLIED`.
+
+    Use this for sprites with premultiplied images, see
+    `swirlyswirls.images.to_display_premultiplied`.  To also get the reversed
+    order, combine it with `ReversedGroup`:
+
+        class ReversedPremultipliedGroup(ReversedGroup, PremultipliedGroup): pass
+    """
+    def draw(self, surface, bgd=None, special_flags=pygame.BLEND_PREMULTIPLIED):
+        return super().draw(surface, bgd, special_flags)
+
+
+class InstancedGroup(pygame.sprite.Group):
+    """Draw the sprites of one effect at many places.
+
+    Dozens of identical ambient effects (torches, fountains, ripples) don't
+    need to be simulated independently.  Run a single emitter at (0, 0), put
+    its particles into this group, and the group draws them at every anchor.
+
+    Every anchor can show the effect delayed by a number of frames, so the
+    instances don't move in lockstep.  The group keeps the last frames for
+    this, but only references to the images, nothing is copied.
+
+    Instances entirely off the target surface are skipped.
+
+    Like `pygame.sprite.Group.draw`, `draw` returns the rects drawn to, one
+    per sprite and visible instance.
+
+        group = InstancedGroup(anchors=[((100, 500), 0), ((300, 500), 7), ...])
+
+    Parameters
+    ----------
+    anchors: list[tuple[Vector2, int]]
+        Offset and delay in frames per instance.  The offset is added to the
+        position of the sprites.
+
+    *sprites
+        See `pygame.sprite.Group`
+
+    Attributes
+    ----------
+    anchors
+        See Parameters.  Can be modified at any time, but the history only
+        covers the largest delay at the time of the last `draw`.
+
+    """
+    def __init__(self, *sprites, anchors=None):
+        super().__init__(*sprites)
+        self.anchors = anchors if anchors is not None else [((0, 0), 0)]
+        self.history = deque()
+
+    def draw(self, surface, bgd=None, special_flags=0):
+        # Positions need to be copied, sprites move their rects in place
+        sprites = self.sprites()
+        frame = [(sprite.image, sprite.rect.topleft) for sprite in sprites]
+        bounds = sprites[0].rect.unionall([s.rect for s in sprites]) if sprites else None
+
+        max_delay = max(delay for _, delay in self.anchors) if self.anchors else 0
+        self.history.appendleft((frame, bounds))
+        while len(self.history) > max_delay + 1:
+            self.history.pop()
+
+        clip = surface.get_clip()
+        last = len(self.history) - 1
+        dirty = []
+        for (ax, ay), delay in self.anchors:
+            frame, bounds = self.history[min(delay, last)]
+            if bounds is None or not clip.colliderect(bounds.move(ax, ay)):
+                continue
+            dirty.extend(surface.blits([(image, (x + ax, y + ay), None, special_flags)
+                                        for image, (x, y) in frame]))
+
+        return dirty
+
+
+class BallisticGroup(pygame.sprite.Group):
+    """A sprite group that places `Ballistic` sprites when drawing them.
+
+    Sprites are added with their `swirlyswirls.compsys.Ballistic` motion.
+    Positions are only computed in `draw`, all with the same timestamp, and
+    sprites outside the target surface are skipped.  Don't run the
+    `sprite_system` on these sprites.
+
+        group = BallisticGroup()
+        group.add_ballistic(sprite, Ballistic(position, momentum))
+
+    Note: Since sprites are only moved when drawn, `sprite.rect` of culled
+    sprites is stale.  Use `Ballistic.position` to query positions.
+
+    See the `spiral` demo for an example.
+
+    """
+    def __init__(self, *sprites):
+        super().__init__(*sprites)
+        self.ballistics = {}
+
+    def add_ballistic(self, sprite, ballistic):
+        """Add a sprite, moving by `ballistic`."""
+        self.ballistics[sprite] = ballistic
+        self.add(sprite)
+
+    def remove_internal(self, sprite):
+        self.ballistics.pop(sprite, None)
+        super().remove_internal(sprite)
+
+    def draw(self, surface, bgd=None, special_flags=0):
+        ballistics = self.ballistics
+        if not ballistics:
+            return []
+
+        now = next(iter(ballistics.values())).clock()
+        clip = surface.get_clip()
+        left, top, right, bottom = clip.left, clip.top, clip.right, clip.bottom
+
+        blits = []
+        for sprite, ballistic in ballistics.items():
+            x, y = ballistic.at(now)
+            image = sprite.image
+            w, h = image.get_size()
+            x -= w / 2
+            y -= h / 2
+            if x > right or y > bottom or x + w < left or y + h < top:
+                continue
+            sprite.rect.center = (x + w / 2, y + h / 2)
+            blits.append((image, sprite.rect, None, special_flags))
+
+        return surface.blits(blits)
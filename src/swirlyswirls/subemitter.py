@@ -0,0 +1,188 @@
+"""Emitters launched by particles, e.g. fireworks bursting into sparks.
+
+A `SubEmitter` describes the emitter to launch and when to launch it.  It
+keeps a pool of emitter entities, which are re-armed and revived instead of
+built anew, so a cascade of effects doesn't allocate emitters while running.
+
+    sparks = SubEmitter(emitter=partial(Emitter, ept=LerpThing(32, 0, 0.2),
+                                        zone=ZoneCircle(r1=8),
+                                        particle_factory=spark_factory),
+                        trigger='death', lifetime=0.5, size=16)
+
+    def rocket_factory(t, position, momentum):
+        e = ecs.create_entity()
+        ...
+        sparks.attach(e)
+
+    ecs.add_system(sub_emitter_system, 'sub-emitter', 'position')
+
+With a `swirlyswirls.pool.ParticlePool`, put the trigger into the components
+of the particle instead.  It is then recycled and re-armed together with the
+particle, so nothing is allocated per particle:
+
+    def build(t, position, momentum):
+        return {
+            ...
+            'sub-emitter': sparks.new_trigger(),
+        }
+
+"""
+import tinyecs as ecs
+
+from pgcooldown import Cooldown
+
+from swirlyswirls.pool import EmitterPool
+
+__all__ = ['SubEmitter', 'SubEmitterTrigger', 'sub_emitter_system']
+
+TRIGGERS = ('death', 'spawn', 'interval')
+
+
+class SubEmitter:
+    """An emitter to launch from particles, and the pool to launch it from.
+
+    Parameters
+    ----------
+    emitter: callable
+        Parameterless, returns a new `swirlyswirls.Emitter`, e.g. a `partial`
+        of it.  Only called to fill the pool.
+
+    trigger: str = 'death'
+        When to launch the emitter:
+
+            'death':    when the particle entity is removed
+            'spawn':    when the particle is seen first by the system
+            'interval': every `interval` seconds while the particle lives
+
+    interval: float = 0.5
+        See `trigger`.
+
+    lifetime: float = 1
+        The lifetime of a launched emitter entity.  The emitter returns to
+        the pool when it expires.
+
+    momentum_factor: float = 0
+        The emitter entity gets the momentum of the particle, scaled by this
+        factor, as its own momentum.  With 0, the emitter stands still.
+
+        Note, that this is not the same as the bitmask
+        `swirlyswirls.Emitter.inherit_momentum`, which controls the momentum
+        of the particles launched by the emitter.
+
+    size: int = 0
+        Number of emitters to build in advance.  The pool grows beyond this
+        if needed.
+
+    cid: hashable = 'sub-emitter'
+        The component id used by `attach`.
+
+    simulation: swirlyswirls.Simulation = None
+    query_cache: swirlyswirls.queries.QueryCache = None
+        See `swirlyswirls.pool.EmitterPool`.
+
+    Attributes
+    ----------
+    pool: swirlyswirls.pool.EmitterPool
+        The emitters.
+
+    launched: int
+        Number of emitters launched.
+
+    """
+    def __init__(self, emitter, trigger='death', interval=0.5, lifetime=1,
+                 momentum_factor=0, size=0, cid='sub-emitter', simulation=None,
+                 query_cache=None):
+        if trigger not in TRIGGERS:
+            raise ValueError(f'trigger must be one of {TRIGGERS}, not {trigger!r}')
+
+        self.trigger = trigger
+        self.interval = interval
+        self.momentum_factor = momentum_factor
+        self.cid = cid
+        self.launched = 0
+        self.pool = EmitterPool(emitter, lifetime=lifetime, size=size, simulation=simulation,
+                                query_cache=query_cache)
+
+    def new_trigger(self):
+        """A new `SubEmitterTrigger` for this sub emitter."""
+        return SubEmitterTrigger(self)
+
+    def attach(self, eid):
+        """Add a new `SubEmitterTrigger` for this sub emitter to entity `eid`."""
+        ecs.add_component(eid, self.cid, SubEmitterTrigger(self))
+
+    def launch(self, position, momentum=None):
+        """Launch an emitter at `position`.
+
+        Returns
+        -------
+        EID
+            The EID of the emitter entity.
+
+        """
+        eid = self.pool.launch(position)
+        factor = self.momentum_factor
+        if momentum is not None and factor:
+            # Scale into the pooled vector, instead of allocating a new one
+            ecs.comp_of_eid(eid, 'momentum').update(momentum[0] * factor, momentum[1] * factor)
+
+        self.launched += 1
+        return eid
+
+
+class SubEmitterTrigger:
+    """The per particle state of a `SubEmitter`.
+
+    Created by `SubEmitter.new_trigger` or `SubEmitter.attach`.
+
+    """
+    __slots__ = ('sub', 'position', 'momentum', 'cooldown', 'spawned')
+
+    def __init__(self, sub):
+        self.sub = sub
+        self.position = None
+        self.momentum = None
+        self.cooldown = Cooldown(sub.interval) if sub.trigger == 'interval' else None
+        self.spawned = False
+
+    def reset(self):
+        """Re-arm the trigger, e.g. for a recycled particle."""
+        self.position = None
+        self.momentum = None
+        self.spawned = False
+        if self.cooldown is not None:
+            self.cooldown.reset()
+
+    def shutdown_(self):
+        if self.sub.trigger == 'death' and self.position is not None:
+            self.sub.launch(self.position, self.momentum)
+
+
+def sub_emitter_system(dt, eid, trigger, position):
+    """Launch the sub emitters of particles.
+
+    Run it on `'sub-emitter', 'position'`.  Sub emitters triggered by death
+    need the system too, it tracks the last position of the particle.
+
+    Parameters
+    ----------
+    trigger: SubEmitterTrigger
+        The particle side of the sub emitter.
+
+    position: Vector2
+        Position of the particle
+
+    """
+    if not trigger.spawned:
+        trigger.spawned = True
+        trigger.position = position
+        if ecs.eid_has(eid, 'momentum'):
+            trigger.momentum = ecs.comp_of_eid(eid, 'momentum')
+        if trigger.sub.trigger == 'spawn':
+            trigger.sub.launch(position, trigger.momentum)
+        return
+
+    cooldown = trigger.cooldown
+    if cooldown is not None and cooldown.cold:
+        cooldown.reset(wrap=True)
+        trigger.sub.launch(position, trigger.momentum)
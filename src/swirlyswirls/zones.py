@@ -1,10 +1,15 @@
 import pygame
 
 from abc import ABC, abstractmethod
+from bisect import bisect_right
 from dataclasses import dataclass, InitVar, field
-from random import random, triangular
+from math import cos, hypot, pi, radians, sin
+from random import random, shuffle, triangular
 from pygame import Vector2
 
+# The first primes, used as bases for the Halton sequence
+_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53)
+
 # See Freya Holmer "The simple yet powerful math we don't talk about":
 #     https://www.youtube.com/watch?v=R6UB7mVO3fY
 # This is the "official" lerp, but it's about 10% slower than the one with only
@@ -15,6 +20,88 @@ _inv_lerp = lambda a, b, v: (v - a) / (b - a)
 _remap    = lambda a0, a1, b0, b1, v: _lerp(b0, b1, _inv_lerp(a0, a1, v))
 
 
+def _radical_inverse(i, base):
+    """Mirror the digits of `i` in `base` around the decimal point."""
+    inv_base = f = 1 / base
+    r = 0
+    while i > 0:
+        i, d = divmod(i, base)
+        r += d * f
+        f *= inv_base
+    return r
+
+
+class Halton:
+    """A low discrepancy drop-in for `random.random`.
+
+    Pure random points clump and leave holes, so a zone needs many particles
+    before it looks evenly filled.  A Halton sequence fills the unit square
+    (or cube, ...) evenly from the first few points on.
+
+    All zones take their random numbers from the parameterless `rnd_p` and
+    `rnd_m` callables.  A `Halton` object is such a callable.  Every call
+    returns the next coordinate of the current point, and after `dims` calls,
+    the sequence advances to the next point.  So a zone that calls `rnd_p`
+    twice per emit (e.g. `ZoneRect` for x and y) needs `dims=2`.
+
+        zone = ZoneRect(r=r, rnd_p=Halton(dims=2))
+
+    The sequence state lives in the object, so give every zone (and by that,
+    every emitter) its own instance.  Sharing one between zones works, but
+    then the zones interleave their points.
+
+    Parameters
+    ----------
+    dims: int = 2
+        Number of calls per point.  Every dimension uses its own prime base.
+
+    rotate: bool = True
+        Apply a Cranley-Patterson rotation, i.e. add a random offset modulo 1
+        per dimension.  Without it, all instances produce the identical
+        sequence, so all emitters would place their particles on the very
+        same spots.
+
+    skip: int = 1
+        Start index into the sequence.  Index 0 is the origin in all
+        dimensions, so it's skipped by default.
+
+    Attributes
+    ----------
+    index: int
+        The index of the current point.
+
+    offsets: list[float]
+        The Cranley-Patterson offsets per dimension.
+
+    """
+    def __init__(self, dims=2, rotate=True, skip=1):
+        if not 0 < dims <= len(_PRIMES):
+            raise ValueError(f'dims must be within 1 and {len(_PRIMES)}')
+
+        self.dims = dims
+        self.bases = _PRIMES[:dims]
+        self.skip = skip
+        self.reset(rotate)
+
+    def __call__(self):
+        dim = self.dim
+        v = _radical_inverse(self.index, self.bases[dim]) + self.offsets[dim]
+
+        dim += 1
+        if dim == self.dims:
+            dim = 0
+            self.index += 1
+        self.dim = dim
+
+        return v - 1 if v >= 1 else v
+
+    def reset(self, rotate=True):
+        """Restart the sequence, optionally with a new rotation."""
+        self.index = self.skip
+        self.dim = 0
+        self.offsets = [random() if rotate else 0 for _ in range(self.dims)]
+
+
 @dataclass(kw_only=True)
 class Zone(ABC):
     """Derive from this to implement your particle zones.
@@ -22,6 +109,14 @@ class Zone(ABC):
     A zone is a class that has an emit function, which returns a tuple of
     coordinate and momentum.
 
+    The `emitter_system` requests all particles of a tick at once through
+    `emit_many`.  The default implementation simply calls `emit` repeatedly,
+    overwrite it if your zone can do better in bulk.
+
+    All zones draw their random numbers from the parameterless `rnd_p` and
+    `rnd_m` functions.  Pass a `Halton` object there, to get an evenly filled
+    zone with far fewer particles.
+
     Parameters
     ----------
     The base class has no input parameters.  Extend as you please.
@@ -55,6 +150,63 @@ class Zone(ABC):
         """
         raise NotImplementedError
 
+    def emit_many(self, n, t=None):
+        """Emit a list of `n` coordinate/momentum tuples.
+
+        Parameters
+        ----------
+        n: int
+            The number of tuples to emit
+
+        t
+            See `emit`
+
+        Returns
+        -------
+        list[tuple[Vector2, Vector2]]
+            See `emit` for the tuple elements.
+
+        """
+        emit = self.emit
+        return [emit(t) for _ in range(n)]
+
+    def bounds(self, t=None):
+        """The area emitted positions fall into, relative to the zone.
+
+        Used e.g. to decide if an emitter is visible.  The default
+        implementation doesn't know, and returns `None`.
+
+        Parameters
+        ----------
+        t
+            See `emit`.  Zones that change over time return the bounds over
+            their full lifetime.
+
+        Returns
+        -------
+        pygame.FRect | None
+
+        """
+        return None
+
+    def area(self, t=None):
+        """The size of the area emitted from, e.g. to weigh zones.
+
+        The default implementation doesn't know, and returns `None`.  Zones
+        without an area, like points and lines, do the same.
+
+        Parameters
+        ----------
+        t
+            See `emit`.
+
+        Returns
+        -------
+        float | None
+
+        """
+        return None
+
 
 @dataclass(kw_only=True)
 class ZonePoint(Zone):
@@ -90,6 +242,9 @@ class ZonePoint(Zone):
         Note, that this functions are expected to be parameterless.  Provide a
         lambda if you need them to be configurable.
 
+        `rnd_m` is called twice per emit, for speed and angle.  See `Halton`
+        for a low discrepancy alternative.
+
     Attributes
     ----------
     See Parameters
@@ -114,9 +269,13 @@ class ZonePoint(Zone):
 
         return Vector2(0, 0), momentum
 
+    def bounds(self, t=None):
+        """See `Zone.bounds`."""
+        return pygame.FRect(0, 0, 0, 0)
+
 
 @dataclass(kw_only=True)
-class ZoneLine:
+class ZoneLine(Zone):
     """A zone emitting around on a line.
 
     Parameters
@@ -142,6 +301,9 @@ class ZoneLine:
         Note, that this functions are expected to be parameterless.  Provide a
         lambda if you need them to be configurable.
 
+        `rnd_p` and `rnd_m` are called once per emit each.  See `Halton` for a
+        low discrepancy alternative.
+
     Attributes
     ----------
     See Parameters.
@@ -179,6 +341,11 @@ class ZoneLine:
         momentum = self.speed * (1 + self.rnd_m() * 2 * self.variance - self.variance)
         return v, momentum
 
+    def bounds(self, t=None):
+        """See `Zone.bounds`."""
+        v = self.v
+        return pygame.FRect(min(0, v.x), min(0, v.y), abs(v.x), abs(v.y))
+
 
 @dataclass(kw_only=True)
 class ZoneCircle(Zone):
@@ -201,6 +368,9 @@ class ZoneCircle(Zone):
         Note, that this functions are expected to be parameterless.  Provide a
         lambda if you need them to be configurable.
 
+        `rnd_p` is called twice per emit, for radius and angle.  See `Halton`
+        for a low discrepancy alternative.
+
 
     Attributes
     ----------
@@ -233,11 +403,20 @@ class ZoneCircle(Zone):
 
         """
         r = (self.r1 - self.r0) * self.rnd_p() + self.r0
-        phi = (self.phi1 - self.phi0) * random() + self.phi0
+        phi = (self.phi1 - self.phi0) * self.rnd_p() + self.phi0
         v = Vector2(r, 0).rotate(phi)
 
         return v, v
 
+    def bounds(self, t=None):
+        """See `Zone.bounds`."""
+        r = self.r1
+        return pygame.FRect(-r, -r, 2 * r, 2 * r)
+
+    def area(self, t=None):
+        """See `Zone.area`."""
+        return pi * (self.r1 ** 2 - self.r0 ** 2) * abs(self.phi1 - self.phi0) / 360
+
 
 @dataclass(kw_only=True)
 class ZoneRing(Zone):
@@ -270,6 +449,9 @@ class ZoneRing(Zone):
         Note, that this functions are expected to be parameterless.  Provide a
         lambda if you need them to be configurable.
 
+        `rnd_p` is called twice per emit, for radius and angle.  See `Halton`
+        for a low discrepancy alternative.
+
 
     Attributes
     ----------
@@ -321,9 +503,25 @@ class ZoneRing(Zone):
 
         return v, v
 
+    def bounds(self, t=None):
+        """See `Zone.bounds`."""
+        r = max(r for r in (self.r_max_t0, self.r_max_t1) if r is not None)
+        return pygame.FRect(-r, -r, 2 * r, 2 * r)
+
+    def area(self, t=None):
+        """See `Zone.area`.  Without `t`, the area at the start is returned."""
+        if t is None:
+            r_min, r_max = self.r_min_t0, self.r_max_t0
+            phi = self.phi_max_t0 - self.phi_min_t0
+        else:
+            r_min = _lerp(self.r_min_t0, self.r_min_t1, t)
+            r_max = _lerp(self.r_max_t0, self.r_max_t1, t)
+            phi = _lerp(self.phi_max_t0, self.phi_max_t1, t) - _lerp(self.phi_min_t0, self.phi_min_t1, t)
+        return pi * (r_max ** 2 - r_min ** 2) * abs(phi) / 360
+
 
 @dataclass(kw_only=True)
-class ZoneRect:
+class ZoneRect(Zone):
     """A rectangular zone.
 
     Use this e.g. to emit particles all over the screen.
@@ -340,6 +538,9 @@ class ZoneRect:
         Note, that this functions are expected to be parameterless.  Provide a
         lambda if you need them to be configurable.
 
+        `rnd_p` is called twice per emit, for x and y.  See `Halton` for a low
+        discrepancy alternative.
+
     Attributes
     ----------
     See Parameters.
@@ -376,9 +577,18 @@ class ZoneRect:
         momentum = pos - Vector2(self.r.center)
         return pos, momentum
 
+    def bounds(self, t=None):
+        """See `Zone.bounds`."""
+        w, h = self.r.size
+        return pygame.FRect(-w / 2, -h / 2, w, h)
+
+    def area(self, t=None):
+        """See `Zone.area`."""
+        return self.r.width * self.r.height
+
 
 @dataclass(kw_only=True)
-class ZoneBeam:
+class ZoneBeam(Zone):
     """A zone emitting around a line.
 
     Parameters
@@ -398,6 +608,9 @@ class ZoneBeam:
         Note, that this functions are expected to be parameterless.  Provide a
         lambda if you need them to be configurable.
 
+        `rnd_p` and `rnd_m` are called once per emit each.  See `Halton` for a
+        low discrepancy alternative.
+
         You might want to use `random.triangular` for this, to emit more
         particles directly near the line.
 
@@ -435,3 +648,694 @@ class ZoneBeam:
         v = self.v * self.rnd_p()
         w = self.w * 4 * (self.rnd_m() - 0.5) + self.v.normalize() * 100
         return v, w
+
+    def bounds(self, t=None):
+        """See `Zone.bounds`."""
+        v = self.v
+        w = 4 * self.w.length()
+        return pygame.FRect(min(0, v.x), min(0, v.y), abs(v.x), abs(v.y)).inflate(w, w)
+
+    def area(self, t=None):
+        """See `Zone.area`."""
+        return self.v.length() * 4 * self.w.length()
+
+
+@dataclass(kw_only=True)
+class ZoneMask(Zone):
+    """A zone in the shape of a mask, e.g. a sprite silhouette or text.
+
+    All set pixels of the mask are collected into a flat list once, so every
+    emit is a single index into that list, no matter how complex the shape.
+
+        font = pygame.font.Font(None, 96)
+        zone = ZoneMask(mask=font.render('Boom', True, 'white'))
+
+    Positions are relative to the center of the mask, so an emitter at the
+    center of a sprite emits from the sprite's pixels.
+
+    Parameters
+    ----------
+    mask: pygame.Mask | pygame.Surface
+        The shape.  A surface is converted with `pygame.mask.from_surface`.
+
+    threshold: int = 127
+        The alpha threshold, if `mask` is a surface.
+
+    edge: bool = False
+        Only emit from the outline, i.e. set pixels that have an unset
+        neighbour or touch the border of the mask.
+
+    jitter: bool = True
+        Spread the emits over the pixel instead of using its top left corner.
+
+    rnd_p, rnd_m:
+        Alternative random functions, e.g. if you want a gauss distribution
+        instead of a normal random value.
+
+        Note, that this functions are expected to be parameterless.  Provide a
+        lambda if you need them to be configurable.
+
+        `rnd_p` is called three times per emit with `jitter`, once without.
+        See `Halton` for a low discrepancy alternative.
+
+    Attributes
+    ----------
+    jitter, rnd_p, rnd_m
+        See Parameters
+
+    points: list[tuple[float, float]]
+        The set pixels, relative to the center of the mask.
+
+    """
+    mask: InitVar[pygame.Mask | pygame.Surface]
+    threshold: InitVar[int] = 127
+    edge: InitVar[bool] = False
+    jitter: bool = True
+    rnd_p: callable = random
+    rnd_m: callable = random
+
+    def __post_init__(self, mask, threshold, edge):
+        if isinstance(mask, pygame.Surface):
+            mask = pygame.mask.from_surface(mask, threshold)
+
+        w, h = mask.get_size()
+        cx, cy = w / 2, h / 2
+        get_at = mask.get_at
+
+        def is_edge(x, y):
+            return (x == 0 or y == 0 or x == w - 1 or y == h - 1
+                    or not (get_at((x - 1, y)) and get_at((x + 1, y))
+                            and get_at((x, y - 1)) and get_at((x, y + 1))))
+
+        rects = mask.get_bounding_rects()
+        self.points = [(x - cx, y - cy)
+                       for rect in rects
+                       for y in range(rect.top, rect.bottom)
+                       for x in range(rect.left, rect.right)
+                       if get_at((x, y)) and (not edge or is_edge(x, y))]
+        if not self.points:
+            raise ValueError('mask has no set pixels')
+
+        self._bounds = pygame.FRect(rects[0].unionall(rects[1:])).move(-cx, -cy)
+
+    def emit(self, t=None):
+        """Emit a single coordinate/momentum tuple.  See `emit_many`."""
+        return self.emit_many(1, t)[0]
+
+    def emit_many(self, n, t=None):
+        """Emit a batch of `n` points from the set pixels of the mask.
+
+        Parameters
+        ----------
+        n: int
+            The size of the batch
+
+        t : any
+            t is ignored by this zone.
+
+        Returns
+        -------
+        position : Vector2
+            A random set pixel, relative to the center of the mask.
+
+        momentum: Vector2
+            With this zone, always identical to `position`.
+
+        """
+        points = self.points
+        size = len(points)
+        rnd = self.rnd_p
+        jitter = self.jitter
+
+        batch = []
+        for _ in range(n):
+            x, y = points[int(rnd() * size)]
+            if jitter:
+                x += rnd()
+                y += rnd()
+            batch.append((Vector2(x, y), Vector2(x, y)))
+
+        return batch
+
+    def bounds(self, t=None):
+        """See `Zone.bounds`."""
+        return self._bounds.copy()
+
+    def area(self, t=None):
+        """See `Zone.area`.  The number of pixels emitted from."""
+        return len(self.points)
+
+
+@dataclass(kw_only=True)
+class ZoneTemplate(Zone):
+    """A precomputed burst, sampled once from another zone.
+
+    Effects like explosions fire the very same burst over and over again.
+    Instead of sampling the zone anew every time, this zone samples a large
+    pool of position/momentum pairs once.  Every batch is then a slice of
+    that pool, rotated and mirrored by random, so the bursts still look
+    different.
+
+    Parameters
+    ----------
+    zone: Zone
+        The zone to sample the template from.
+
+    size: int = 1024
+        The number of position/momentum pairs in the template.  A batch
+        larger than this repeats pairs.
+
+    t: float = 0
+        The `t` the template is sampled at.  The `t` passed to `emit` is
+        ignored, since the template is static.
+
+    rotate: bool = True
+        Rotate every batch by a random angle.
+
+    mirror: bool = True
+        Mirror every other batch on the x axis, by random.
+
+    rnd: callable = random
+        The random function used for slice offset, rotation and mirroring.
+
+    Attributes
+    ----------
+    zone, rotate, mirror, rnd
+        See Parameters
+
+    pool: list[tuple[float, float, float, float]]
+        The shuffled template as `(x, y, dx, dy)` tuples.
+
+    """
+    zone: Zone
+    size: InitVar[int] = 1024
+    t: InitVar[float] = 0
+    rotate: bool = True
+    mirror: bool = True
+    rnd: callable = random
+
+    def __post_init__(self, size, t):
+        self.resample(size, t)
+
+    def resample(self, size=None, t=0):
+        """Sample a new template from `zone`.
+
+        Parameters
+        ----------
+        size: int = None
+            The new size of the template.  If `None`, keep the current size.
+
+        t: float = 0
+            The `t` to pass to the zone.
+
+        """
+        if size is None:
+            size = len(self.pool)
+
+        self.pool = [(p.x, p.y, m.x, m.y) for p, m in self.zone.emit_many(size, t)]
+        shuffle(self.pool)
+
+    def emit(self, t=None):
+        """Emit a single coordinate/momentum tuple from the template."""
+        return self.emit_many(1, t)[0]
+
+    def emit_many(self, n, t=None):
+        """Emit a batch of `n` coordinate/momentum tuples from the template.
+
+        The batch is a slice from a random offset into the pool, with a single
+        rotation and mirroring applied to all of its elements.
+
+        Parameters
+        ----------
+        n: int
+            The size of the batch
+
+        t : any
+            t is ignored by this zone.
+
+        Returns
+        -------
+        list[tuple[Vector2, Vector2]]
+            See `Zone.emit`.
+
+        """
+        pool = self.pool
+        size = len(pool)
+        start = int(self.rnd() * size)
+        batch = pool[start:start + n]
+        while len(batch) < n:
+            batch += pool[:n - len(batch)]
+
+        c, s = 1, 0
+        if self.rotate:
+            phi = radians(self.rnd() * 360)
+            c, s = cos(phi), sin(phi)
+        # Mirroring on the x axis is negating y, so bake it into the rotation
+        m = -1 if self.mirror and self.rnd() < 0.5 else 1
+        ms = m * s
+        mc = m * c
+
+        return [(Vector2(c * x - ms * y, s * x + mc * y),
+                 Vector2(c * dx - ms * dy, s * dx + mc * dy))
+                for x, y, dx, dy in batch]
+
+    def bounds(self, t=None):
+        """See `Zone.bounds`.  Rotation is accounted for, if enabled."""
+        bounds = self.zone.bounds(t)
+        if bounds is None or not (self.rotate or self.mirror):
+            return bounds
+
+        r = max(Vector2(p).length() for p in (bounds.topleft, bounds.topright,
+                                              bounds.bottomleft, bounds.bottomright))
+        return pygame.FRect(-r, -r, 2 * r, 2 * r)
+
+    def area(self, t=None):
+        """See `Zone.area`.  The area of the sampled zone."""
+        return self.zone.area(t)
+
+
+@dataclass(kw_only=True)
+class ZoneComposite(Zone):
+    """A zone combined from any number of child zones.
+
+    Every emit picks a child by its weight, and emits from there.  Children
+    can be placed with an offset and a rotation, so complex shapes can be
+    built without writing a custom zone.
+
+        zone = ZoneComposite(zones=[ZoneCircle(r1=32), ZoneRect(r=Rect(0, 0, 16, 96))],
+                             offsets=[(0, -64), (0, 0)])
+
+    The child is picked with a precomputed alias table, which takes a single
+    random number, no matter how many children there are.  `emit_many`
+    counts the picks per child first, and then requests them in one batch
+    through the child's `emit_many`.
+
+    Parameters
+    ----------
+    zones: list[Zone]
+        The child zones.
+
+    weights: list[float] = None
+        The relative weights of the children.  Defaults to their `area`.  If
+        a child has no area, e.g. a `ZonePoint`, all children weigh the same.
+
+    offsets: list[tuple[float, float]] = None
+        Positions of the children relative to the composite zone.
+
+    rotations: list[float] = None
+        Rotation of the children in degrees.  This rotates positions and
+        momentums.
+
+    rnd: callable = random
+        The random function to pick children.
+
+    Attributes
+    ----------
+    zones, rnd
+        See Parameters
+
+    weights: list[float]
+        The normalized weights.
+
+    """
+    zones: list[Zone]
+    weights: list[float] = None
+    offsets: InitVar[list[tuple[float, float]]] = None
+    rotations: InitVar[list[float]] = None
+    rnd: callable = random
+
+    def __post_init__(self, offsets, rotations):
+        n = len(self.zones)
+        if not n:
+            raise ValueError('a composite zone needs at least one child')
+
+        weights = self.weights
+        if weights is None:
+            weights = [zone.area() for zone in self.zones]
+            if not all(weights):
+                weights = [1] * n
+        elif len(weights) != n:
+            raise ValueError('weights must match the number of zones')
+
+        total = sum(weights)
+        self.weights = [w / total for w in weights]
+
+        offsets = offsets or [(0, 0)] * n
+        rotations = rotations or [0] * n
+        self._transforms = []
+        for (ox, oy), phi in zip(offsets, rotations):
+            phi = radians(phi)
+            self._transforms.append((cos(phi), sin(phi), ox, oy))
+
+        self._build_alias_table()
+
+    def _build_alias_table(self):
+        # Vose's alias method, see "Darts, Dice, and Coins: Sampling from a
+        # Discrete Distribution" by Keith Schwarz
+        n = len(self.weights)
+        prob = [w * n for w in self.weights]
+        alias = list(range(n))
+        small = [i for i, p in enumerate(prob) if p < 1]
+        large = [i for i, p in enumerate(prob) if p >= 1]
+
+        while small and large:
+            s = small.pop()
+            lg = large.pop()
+            alias[s] = lg
+            prob[lg] += prob[s] - 1
+            (small if prob[lg] < 1 else large).append(lg)
+
+        # Leftovers are 1 up to rounding errors
+        for i in small + large:
+            prob[i] = 1
+
+        self._prob = prob
+        self._alias = alias
+
+    def pick(self):
+        """The index of a random child, according to the weights."""
+        r = self.rnd() * len(self._prob)
+        i = int(r)
+        return i if r - i < self._prob[i] else self._alias[i]
+
+    def _place(self, i, emits):
+        """Transform the emits of child `i` in place."""
+        c, s, ox, oy = self._transforms[i]
+        if c == 1 and s == 0 and not (ox or oy):
+            return emits
+
+        for j, (position, momentum) in enumerate(emits):
+            x, y = position
+            # Zones like `ZoneCircle` return the same vector for both
+            if momentum is position:
+                momentum = Vector2(position)
+                emits[j] = position, momentum
+            position.update(c * x - s * y + ox, s * x + c * y + oy)
+            if s:
+                x, y = momentum
+                momentum.update(c * x - s * y, s * x + c * y)
+        return emits
+
+    def emit(self, t=None):
+        """Emit a coordinate/momentum tuple from a random child."""
+        i = self.pick()
+        return self._place(i, [self.zones[i].emit(t)])[0]
+
+    def emit_many(self, n, t=None):
+        """Emit `n` coordinate/momentum tuples, batched per child.
+
+        Parameters
+        ----------
+        n: int
+            The number of tuples to emit
+
+        t
+            Passed on to the children.
+
+        Returns
+        -------
+        list[tuple[Vector2, Vector2]]
+            See `Zone.emit`.  The emits are grouped by child.
+
+        """
+        counts = [0] * len(self.zones)
+        pick = self.pick
+        for _ in range(n):
+            counts[pick()] += 1
+
+        batch = []
+        for i, (zone, k) in enumerate(zip(self.zones, counts)):
+            if k:
+                batch.extend(self._place(i, zone.emit_many(k, t)))
+        return batch
+
+    def bounds(self, t=None):
+        """See `Zone.bounds`.  `None`, if a child has no bounds."""
+        result = None
+        for zone, (c, s, ox, oy) in zip(self.zones, self._transforms):
+            bounds = zone.bounds(t)
+            if bounds is None:
+                return None
+
+            corners = [(c * x - s * y + ox, s * x + c * y + oy)
+                       for x, y in (bounds.topleft, bounds.topright,
+                                    bounds.bottomleft, bounds.bottomright)]
+            xs = [x for x, y in corners]
+            ys = [y for x, y in corners]
+            rect = pygame.FRect(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys))
+            result = rect if result is None else result.union(rect)
+
+        return result
+
+    def area(self, t=None):
+        """See `Zone.area`.  `None`, if a child has no area."""
+        areas = [zone.area(t) for zone in self.zones]
+        return None if None in areas else sum(areas)
+
+
+def _catmull_rom(points, resolution):
+    """Flatten a uniform Catmull-Rom spline through `points`."""
+    points = [points[0]] + list(points) + [points[-1]]
+    flat = [points[1]]
+    for (x0, y0), (x1, y1), (x2, y2), (x3, y3) in zip(points, points[1:], points[2:], points[3:]):
+        for i in range(1, resolution + 1):
+            t = i / resolution
+            t2 = t * t
+            t3 = t2 * t
+            flat.append((0.5 * (2 * x1 + (x2 - x0) * t + (2 * x0 - 5 * x1 + 4 * x2 - x3) * t2
+                                + (3 * x1 - x0 - 3 * x2 + x3) * t3),
+                         0.5 * (2 * y1 + (y2 - y0) * t + (2 * y0 - 5 * y1 + 4 * y2 - y3) * t2
+                                + (3 * y1 - y0 - 3 * y2 + y3) * t3)))
+    return flat
+
+
+def _bezier(points, resolution):
+    """Flatten a chain of cubic Bezier curves, sharing their end points."""
+    if len(points) % 3 != 1:
+        raise ValueError('a bezier path needs 3 * n + 1 points')
+
+    flat = [points[0]]
+    for k in range(0, len(points) - 1, 3):
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3) = points[k:k + 4]
+        for i in range(1, resolution + 1):
+            t = i / resolution
+            u = 1 - t
+            a, b, c, d = u * u * u, 3 * u * u * t, 3 * u * t * t, t * t * t
+            flat.append((a * x0 + b * x1 + c * x2 + d * x3,
+                         a * y0 + b * y1 + c * y2 + d * y3))
+    return flat
+
+
+@dataclass(kw_only=True)
+class ZonePath(Zone):
+    """A zone along a polyline or spline, e.g. for rivers, lightning or tracers.
+
+    The path is flattened into a polyline once, together with a table of the
+    accumulated segment lengths.  Emits are spread evenly over the length of
+    the path, no matter how the points are spaced, by a binary search in
+    that table.
+
+    Like `ZoneBeam`, the zone has a `width` around the path.  The momentum
+    follows the path or points away from it.
+
+    The emitted part of the path can change over time, similar to
+    `ZoneRing`.  `start` and `end` are fractions of the path length, e.g. a
+    tracer running along the path:
+
+        zone = ZonePath(points=[(0, 0), (200, -50), (400, 0)], curve='catmull-rom',
+                        start_t0=0, end_t0=0.1, start_t1=0.9, end_t1=1)
+
+    Parameters
+    ----------
+    points: list[tuple[float, float]]
+        The points of the path, relative to the emitter.
+
+    curve: str = 'polyline'
+        How to connect the points:
+
+            'polyline':     straight lines
+            'catmull-rom':  a smooth curve through all points
+            'bezier':       a chain of cubic Bezier curves, given as
+                            `p0, c0, c1, p1, c2, c3, p2, ...`
+
+    resolution: int = 16
+        Number of line segments per curve section, ignored for polylines.
+
+    width: float = 0
+        The width of the zone around the path.
+
+    speed: float = 0
+        Length of the momentum.
+
+    variance: float = 0
+        The speed will be scaled by a random between `1 - variance` and
+        `1 + variance`.
+
+    normal: bool = False
+        Launch perpendicular to the path, away from it, instead of along it.
+
+    start_t0, end_t0,
+    start_t1, end_t1: float = 0, 1, None, None
+        The emitted part of the path at the beginning and end of the emitter
+        lifetime, as fractions of its length.  `*_t1` default to `*_t0`.
+
+    ease: callable = lambda x: x
+        Easing function for t of start and end.
+
+    rnd_p, rnd_m:
+        Alternative random functions, e.g. if you want a gauss distribution
+        instead of a normal random value.
+
+        Note, that this functions are expected to be parameterless.  Provide a
+        lambda if you need them to be configurable.
+
+        `rnd_p` is called twice per emit, for the position along and across
+        the path.  `rnd_m` is called once, for the variance.  See `Halton`
+        for a low discrepancy alternative.
+
+    Attributes
+    ----------
+    See Parameters.
+
+    vertices: list[tuple[float, float]]
+        The flattened path.
+
+    lengths: list[float]
+        The path length up to every vertex.
+
+    tangents: list[tuple[float, float]]
+        The unit direction of every segment.
+
+    """
+    points: InitVar[list[tuple[float, float]]]
+    curve: InitVar[str] = 'polyline'
+    resolution: InitVar[int] = 16
+    width: float = 0
+    speed: float = 0
+    variance: float = 0
+    normal: bool = False
+
+    start_t0: float = 0
+    end_t0: float = 1
+    start_t1: float = None
+    end_t1: float = None
+    ease: callable = lambda x: x
+
+    rnd_p: callable = random
+    rnd_m: callable = random
+
+    def __post_init__(self, points, curve, resolution):
+        points = [tuple(p) for p in points]
+        if len(points) < 2:
+            raise ValueError('a path needs at least 2 points')
+
+        if curve == 'polyline':
+            vertices = points
+        elif curve == 'catmull-rom':
+            vertices = _catmull_rom(points, resolution)
+        elif curve == 'bezier':
+            vertices = _bezier(points, resolution)
+        else:
+            raise ValueError(f'unknown curve {curve!r}')
+
+        if self.start_t1 is None:
+            self.start_t1 = self.start_t0
+        if self.end_t1 is None:
+            self.end_t1 = self.end_t0
+
+        # Drop degenerated segments, they can't be emitted from anyway
+        self.vertices = [vertices[0]]
+        self.lengths = [0]
+        self.tangents = []
+        for x, y in vertices[1:]:
+            x0, y0 = self.vertices[-1]
+            d = hypot(x - x0, y - y0)
+            if d == 0:
+                continue
+            self.vertices.append((x, y))
+            self.lengths.append(self.lengths[-1] + d)
+            self.tangents.append(((x - x0) / d, (y - y0) / d))
+
+        if not self.tangents:
+            raise ValueError('path has no length')
+
+    @property
+    def length(self):
+        """The total length of the path."""
+        return self.lengths[-1]
+
+    def emit(self, t=None):
+        """Emit a single coordinate/momentum tuple.  See `emit_many`."""
+        return self.emit_many(1, t)[0]
+
+    def emit_many(self, n, t=None):
+        """Emit a batch of `n` points along the path.
+
+        Parameters
+        ----------
+        n: int
+            The size of the batch
+
+        t: float = None
+            The emitter time for `start` and `end`.  `None` is the same as 0.
+
+        Returns
+        -------
+        position : Vector2
+            A random point on the path, within `width`.
+
+        momentum: Vector2
+            The tangent or normal of the path at that point, scaled by
+            `speed`.
+
+        """
+        et = self.ease(t or 0)
+        length = self.length
+        s0 = _lerp(self.start_t0, self.start_t1, et) * length
+        s1 = _lerp(self.end_t0, self.end_t1, et) * length
+
+        lengths = self.lengths
+        vertices = self.vertices
+        tangents = self.tangents
+        last = len(tangents) - 1
+        width = self.width
+        speed = self.speed
+        variance = self.variance
+        normal = self.normal
+        rnd_p = self.rnd_p
+        rnd_m = self.rnd_m
+
+        batch = []
+        for _ in range(n):
+            s = (s1 - s0) * rnd_p() + s0
+            i = min(max(bisect_right(lengths, s) - 1, 0), last)
+            x, y = vertices[i]
+            tx, ty = tangents[i]
+            d = s - lengths[i]
+            x += tx * d
+            y += ty * d
+
+            w = width * (rnd_p() - 0.5)
+            x -= ty * w
+            y += tx * w
+
+            v = speed * (1 + rnd_m() * 2 * variance - variance)
+            if normal:
+                v = -v if w < 0 else v
+                momentum = Vector2(-ty * v, tx * v)
+            else:
+                momentum = Vector2(tx * v, ty * v)
+
+            batch.append((Vector2(x, y), momentum))
+
+        return batch
+
+    def bounds(self, t=None):
+        """See `Zone.bounds`.  The whole path, regardless of `t`."""
+        xs = [x for x, y in self.vertices]
+        ys = [y for x, y in self.vertices]
+        return pygame.FRect(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys)).inflate(self.width, self.width)
+
+    def area(self, t=None):
+        """See `Zone.area`.  `None` for a path without width."""
+        return self.length * self.width or None
@@ -0,0 +1,67 @@
+import pygame
+import pytest
+import tinyecs as ecs
+import tinyecs.components as ecsc
+
+from pygame import Vector2
+
+from swirlyswirls.compsys import Ballistic, ballistic_system
+from swirlyswirls.spritegroup import BallisticGroup
+
+
+def test_matches_momentum_system():
+    ecs.reset()
+    e = ecs.create_entity()
+    ecs.add_component(e, 'position', Vector2(10, 20))
+    ecs.add_component(e, 'momentum', Vector2(30, -40))
+
+    dt = 1 / 60
+    for _ in range(120):
+        ecs.run_system(dt, ecsc.momentum_system, 'momentum', 'position')
+
+    ballistic = Ballistic((10, 20), (30, -40), born=0)
+    assert ballistic.at(120 * dt) == pytest.approx(tuple(ecs.comp_of_eid(e, 'position')))
+
+    ecs.reset()
+
+
+def test_matches_constant_acceleration():
+    position, momentum, gravity = Vector2(0, 0), Vector2(50, -100), Vector2(0, 98)
+
+    dt = 1 / 60
+    for _ in range(60):
+        # Exact for a constant acceleration
+        position += momentum * dt + gravity * (dt * dt / 2)
+        momentum += gravity * dt
+
+    class Frozen(Ballistic):
+        clock = staticmethod(lambda: 0)
+
+    ballistic = Frozen((0, 0), (50, -100), gravity, born=-1)
+    assert ballistic.at(0) == pytest.approx(tuple(position))
+    assert ballistic.momentum == pytest.approx(tuple(momentum))
+
+
+def test_ballistic_system():
+    ballistic = Ballistic((1, 2), (3, 4), born=Ballistic.clock() - 2)
+    position = Vector2()
+    ballistic_system(0, None, ballistic, position)
+    assert tuple(position) == pytest.approx((7, 10), abs=0.01)
+
+
+def test_group_places_and_culls():
+    group = BallisticGroup()
+    sprites = []
+    for origin in ((10, 10), (500, 500)):
+        sprite = pygame.sprite.Sprite()
+        sprite.image = pygame.Surface((2, 2))
+        sprite.rect = sprite.image.get_rect()
+        group.add_ballistic(sprite, Ballistic(origin, (0, 0)))
+        sprites.append(sprite)
+
+    dirty = group.draw(pygame.Surface((32, 32)))
+    assert [tuple(r) for r in dirty] == [(9, 9, 2, 2)]
+    assert sprites[0].rect.center == (10, 10)
+
+    sprites[0].kill()
+    assert len(group.ballistics) == 1
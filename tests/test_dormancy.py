@@ -0,0 +1,95 @@
+import pygame
+import pytest
+import tinyecs as ecs
+
+from pgcooldown import Cooldown, LerpThing
+from pygame import Vector2
+
+from swirlyswirls.compsys import Dormancy, Emitter, emitter_dormancy_system
+from swirlyswirls.zones import ZonePoint
+
+
+@pytest.fixture
+def scene():
+    ecs.reset()
+
+    def factory(t, position, momentum):
+        e = ecs.create_entity()
+        ecs.add_component(e, 'position', Vector2(position))
+        ecs.add_component(e, 'momentum', momentum)
+        ecs.add_component(e, 'lifetime', Cooldown(1))
+        return e
+
+    emitter = Emitter(ept=LerpThing(2, 2, 0), tick=0.25, zone=ZonePoint(), particle_factory=factory)
+    dormancy = Dormancy(viewport=pygame.Rect(0, 0, 100, 100), reach=10, lifetime=1)
+    position = Vector2(500, 500)
+
+    eid = ecs.create_entity()
+    ecs.add_component(eid, 'emitter', emitter)
+    ecs.add_component(eid, 'position', position)
+    ecs.add_component(eid, 'dormancy', dormancy)
+
+    yield eid, emitter, position, dormancy
+
+    ecs.reset()
+
+
+def particles():
+    return [eid for eid, _ in ecs.eids_by_cids('lifetime')]
+
+
+def test_first_frame_counts(scene):
+    eid, emitter, position, dormancy = scene
+
+    emitter_dormancy_system(0.5, eid, emitter, position, dormancy)
+    assert dormancy.asleep and emitter.dormant
+    assert dormancy.slept == 0.5
+
+
+def test_wake_up_repopulates(scene):
+    eid, emitter, position, dormancy = scene
+
+    for _ in range(4):
+        emitter_dormancy_system(0.5, eid, emitter, position, dormancy)
+
+    dormancy.viewport.center = position
+    emitter_dormancy_system(0.5, eid, emitter, position, dormancy)
+    assert not dormancy.asleep and not emitter.dormant
+
+    # Heartbeats at 0, 0.25, 0.5 and 0.75 seconds ago, 2 particles each
+    eids = particles()
+    assert len(eids) == 8
+
+    ages = sorted(1 - ecs.comp_of_eid(e, 'lifetime').remaining for e in eids)
+    assert ages == pytest.approx([0, 0, 0.25, 0.25, 0.5, 0.5, 0.75, 0.75], abs=0.01)
+
+
+def test_short_sleep(scene):
+    eid, emitter, position, dormancy = scene
+
+    emitter_dormancy_system(0.5, eid, emitter, position, dormancy)
+    dormancy.viewport.center = position
+    emitter_dormancy_system(0.5, eid, emitter, position, dormancy)
+
+    assert len(particles()) == 4
+
+
+def test_wake_up_uses_past_t(scene):
+    eid, emitter, position, dormancy = scene
+    seen = []
+
+    def factory(t, position, momentum):
+        seen.append(t)
+
+    emitter.particle_factory = factory
+    lifetime = Cooldown(2)
+    lifetime.remaining = 1
+    ecs.add_component(eid, 'lifetime', lifetime)
+
+    for _ in range(4):
+        emitter_dormancy_system(0.5, eid, emitter, position, dormancy)
+    dormancy.viewport.center = position
+    emitter_dormancy_system(0.5, eid, emitter, position, dormancy)
+
+    # 0.75 .. 0 seconds ago, with 1 of 2 seconds of the emitter lifetime gone
+    assert seen == pytest.approx([0.125] * 2 + [0.25] * 2 + [0.375] * 2 + [0.5] * 2, abs=0.01)
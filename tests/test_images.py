@@ -0,0 +1,41 @@
+import pygame
+
+from swirlyswirls.images import SurfacePool
+
+
+def test_surface_pool_reuses_by_size_and_flags():
+    pool = SurfacePool(granularity=4)
+    image = pool.acquire((5, 7))
+    assert image.get_size() == (5, 7)
+    assert image.get_parent().get_size() == (8, 8)
+
+    pool.release(image)
+    image = pool.acquire((6, 6))
+    assert (pool.allocated, pool.reused) == (1, 1)
+
+    # A buffer with other flags goes back into its own bucket
+    rle = pool.acquire((6, 6), flags=pygame.SRCALPHA | pygame.RLEACCEL)
+    pool.release(rle)
+    pool.release(image)
+    assert pool.acquire((6, 6), flags=pygame.SRCALPHA | pygame.RLEACCEL).get_parent() is rle.get_parent()
+    assert pool.acquire((6, 6)).get_parent() is image.get_parent()
+    assert (pool.allocated, pool.reused, pool.released) == (2, 3, 3)
+
+
+def test_surface_pool_ignores_foreign_surfaces():
+    pool = SurfacePool()
+    pool.release(pygame.Surface((8, 8)))
+    pool.release(pygame.Surface((8, 8)).subsurface((0, 0, 4, 4)))
+    assert pool.stats == {'allocated': 0, 'reused': 0, 'released': 0, 'free': 0}
+
+
+def test_surface_pool_max_free():
+    pool = SurfacePool(max_free=1)
+    images = [pool.acquire((8, 8)) for _ in range(3)]
+    for image in images:
+        pool.release(image)
+    assert pool.stats['free'] == 1
+
+    pool.clear()
+    assert pool.stats['free'] == 0
+    assert not pool._keys
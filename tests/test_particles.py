@@ -0,0 +1,17 @@
+from swirlyswirls.particles import (BASE, HIGHLIGHT, TRANSPARENT, bubble_index_factory,
+                                    shard_index_factory, squabble_index_factory)
+
+
+def indices(surface):
+    w, h = surface.get_size()
+    return {surface.get_at_mapped((x, y)) for y in range(h) for x in range(w)}
+
+
+def test_index_factories():
+    for factory in (bubble_index_factory, squabble_index_factory, shard_index_factory):
+        surface = factory(16)
+        assert surface.get_bitsize() == 8
+        assert surface.get_colorkey()[:3] == surface.get_palette_at(TRANSPARENT)[:3]
+        assert indices(surface) <= {TRANSPARENT, BASE, HIGHLIGHT}
+
+    assert HIGHLIGHT in indices(shard_index_factory(16))
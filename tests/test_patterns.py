@@ -0,0 +1,99 @@
+import pytest
+import tinyecs as ecs
+
+from pgcooldown import Cooldown
+from pygame import Vector2
+
+from swirlyswirls.patterns import Pattern, PatternEmitter, pattern_system
+
+
+@pytest.fixture
+def bullets():
+    ecs.reset()
+    fired = []
+
+    def factory(t, position, momentum):
+        e = ecs.create_entity()
+        ecs.add_component(e, 'lifetime', Cooldown(1))
+        fired.append((e, t, position, momentum))
+        return e
+
+    yield fired, factory
+
+    ecs.reset()
+
+
+def test_zero_spread_stacks_arms():
+    compiled = Pattern(arms=3, speed=100).compile()
+    assert compiled.tables == [[(100, 0)] * 3]
+
+
+def test_full_circle_spread():
+    compiled = Pattern(arms=4, spread=360, speed=1).compile()
+    for (x, y), (ex, ey) in zip(compiled.tables[0], [(1, 0), (0, 1), (-1, 0), (0, -1)]):
+        assert x == pytest.approx(ex, abs=1e-9)
+        assert y == pytest.approx(ey, abs=1e-9)
+
+
+def test_volley_time_cycles_rhythm():
+    compiled = Pattern(rhythm=[0.1, 0.3]).compile()
+    assert [compiled.volley_time(i) for i in range(5)] == pytest.approx([0, 0.1, 0.4, 0.5, 0.8])
+
+
+def test_invalid_pattern():
+    with pytest.raises(ValueError) as e:
+        Pattern(arms=0).compile()
+    assert 'at least one arm' in str(e.value)
+
+
+def test_volleys_placed_by_age(bullets):
+    fired, factory = bullets
+    emitter = PatternEmitter(pattern=Pattern(speed=100, rhythm=[0.1]), particle_factory=factory)
+
+    # One large frame fires all volleys due within it
+    pattern_system(0.25, 'e', emitter, Vector2(10, 0))
+    assert emitter.fired == 3
+    for (e, t, position, momentum), age in zip(fired, [0.25, 0.15, 0.05]):
+        assert tuple(momentum) == (100, 0)
+        assert tuple(position) == pytest.approx((10 + 100 * age, 0))
+        assert ecs.comp_of_eid(e, 'lifetime').remaining == pytest.approx(1 - age, abs=0.01)
+
+    pattern_system(0.06, 'e', emitter, Vector2(10, 0))
+    assert emitter.fired == 4
+    assert tuple(fired[-1][2]) == pytest.approx((11, 0))
+
+
+def test_delay(bullets):
+    fired, factory = bullets
+    emitter = PatternEmitter(pattern=Pattern(speed=100), particle_factory=factory, delay=0.1)
+
+    pattern_system(0.05, 'e', emitter, Vector2(0, 0))
+    assert not fired
+
+    pattern_system(0.1, 'e', emitter, Vector2(0, 0))
+    assert len(fired) == 1
+    assert tuple(fired[0][2]) == pytest.approx((5, 0))
+
+
+def test_volleys_limit(bullets):
+    fired, factory = bullets
+    emitter = PatternEmitter(pattern=Pattern(arms=2, spread=90, rhythm=[0.1]),
+                             particle_factory=factory, volleys=2)
+
+    pattern_system(1, 'e', emitter, Vector2(0, 0))
+    pattern_system(1, 'e', emitter, Vector2(0, 0))
+    assert emitter.done
+    assert [t for e, t, position, momentum in fired] == [0, 0, 0.5, 0.5]
+
+
+def test_aim(bullets):
+    fired, factory = bullets
+    target = Vector2(0, 10)
+    emitter = PatternEmitter(pattern=Pattern(arms=3, spread=90, speed=1, aim=lambda: target),
+                             particle_factory=factory)
+
+    pattern_system(0, 'e', emitter, Vector2(0, 0))
+    momentums = [tuple(momentum) for e, t, position, momentum in fired]
+    expected = [(0.5 ** 0.5, 0.5 ** 0.5), (0, 1), (-0.5 ** 0.5, 0.5 ** 0.5)]
+    for m, em in zip(momentums, expected):
+        assert m == pytest.approx(em, abs=1e-9)
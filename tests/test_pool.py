@@ -0,0 +1,52 @@
+import tinyecs as ecs
+
+from pgcooldown import LerpThing
+from pygame import Vector2
+
+from swirlyswirls.compsys import Emitter
+from swirlyswirls.pool import EmitterPool
+from swirlyswirls.zones import ZonePoint
+
+
+def emitter(**kwargs):
+    return Emitter(ept=LerpThing(1, 5, 1), zone=ZonePoint(), particle_factory=lambda **kw: None, **kwargs)
+
+
+def test_reset_restores_ept():
+    e = emitter()
+    e.ept.vt0, e.ept.vt1 = 5, 1  # as after a bounce
+    e.reset()
+    assert (e.ept.vt0, e.ept.vt1) == (1, 5)
+
+    ept = LerpThing(2, 3, 1)
+    e.reset(ept=ept)
+    assert e.ept is ept
+    e.reset()
+    assert (e.ept.vt0, e.ept.vt1) == (2, 3)
+
+
+def test_reset_total_emits():
+    e = emitter(total_emits=10)
+    e.remaining = 3
+
+    e.reset()
+    assert e.remaining == 10
+
+    e.reset(total_emits=None)
+    assert e.total_emits is None
+    assert e.remaining == -1
+
+
+def test_emitter_pool_stats():
+    ecs.reset()
+    pool = EmitterPool(emitter, size=2)
+    assert pool.built == 2
+
+    eids = [pool.launch(Vector2(0, 0)) for _ in range(3)]
+    assert (pool.built, pool.reused, pool.live) == (3, 0, 3)
+
+    ecs.remove_entity(eids[0])
+    assert pool.launch(Vector2(1, 1)) == eids[0]
+    assert (pool.built, pool.reused, pool.live, pool.high_water) == (3, 1, 3, 3)
+
+    ecs.reset()
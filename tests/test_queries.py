@@ -0,0 +1,84 @@
+import pytest
+import tinyecs as ecs
+
+from pgcooldown import LerpThing
+from pygame import Vector2
+
+from swirlyswirls.compsys import Emitter
+from swirlyswirls.family import Family
+from swirlyswirls.pool import EmitterPool, ParticlePool
+from swirlyswirls.queries import QueryCache
+from swirlyswirls.zones import ZonePoint
+
+
+@pytest.fixture
+def cache():
+    ecs.reset()
+    yield QueryCache()
+    ecs.reset()
+
+
+def matches(cache, *cids):
+    seen = []
+    cache.run_system(0, lambda dt, eid, *comps: seen.append(eid), *cids)
+    return seen
+
+
+def test_cache_tracks_changes(cache):
+    eid = cache.create_entity({'position': Vector2(), 'momentum': Vector2()})
+    assert matches(cache, 'momentum', 'position') == [eid]
+
+    cache.remove_component(eid, 'momentum')
+    assert matches(cache, 'momentum', 'position') == []
+
+    cache.add_component(eid, 'momentum', Vector2())
+    assert matches(cache, 'momentum', 'position') == [eid]
+
+    ecs.remove_entity(eid)
+    assert matches(cache, 'momentum', 'position') == []
+    assert not cache.tracked
+
+
+def test_family_pause(cache):
+    family = Family(query_cache=cache)
+    eid = cache.create_entity({'position': Vector2(), 'momentum': Vector2(1, 0)})
+    family.adopt('emitter', eid)
+    assert matches(cache, 'momentum', 'position') == [eid]
+
+    family.pause('emitter')
+    assert matches(cache, 'momentum', 'position') == []
+
+    family.resume('emitter')
+    assert matches(cache, 'momentum', 'position') == [eid]
+
+
+def test_particle_pool_revive(cache):
+    def build(t, position, momentum):
+        return {'position': Vector2(position), 'momentum': Vector2(momentum)}
+
+    pool = ParticlePool(build, query_cache=cache)
+    eid = pool(t=0, position=(1, 2), momentum=(0, 0))
+    assert matches(cache, 'momentum', 'position') == [eid]
+
+    ecs.remove_entity(eid)
+    assert matches(cache, 'momentum', 'position') == []
+
+    assert pool(t=0, position=(3, 4), momentum=(0, 0)) == eid
+    assert pool.reused == 1
+    assert matches(cache, 'momentum', 'position') == [eid]
+    assert cache.query('position').entities[eid] == ((3, 4),)
+
+
+def test_emitter_pool_launch(cache):
+    def build():
+        return Emitter(ept=LerpThing(1, 1, 1), zone=ZonePoint(), particle_factory=lambda **kw: None)
+
+    pool = EmitterPool(build, lifetime=1, query_cache=cache)
+    eid = pool.launch(Vector2(1, 2))
+    assert matches(cache, 'emitter', 'position') == [eid]
+
+    ecs.remove_entity(eid)
+    assert matches(cache, 'emitter', 'position') == []
+
+    assert pool.launch(Vector2(3, 4)) == eid
+    assert matches(cache, 'emitter', 'position') == [eid]
@@ -0,0 +1,53 @@
+import pygame
+
+from types import SimpleNamespace
+
+from tinyecs.compsys import RSAImage
+
+from swirlyswirls.compsys import Particle, RSAQuantizer, particle_rsai_system
+
+
+def counting_rsai():
+    calls = []
+
+    def image_factory(rotate, scale, alpha):
+        calls.append((rotate, scale, alpha))
+        return pygame.Surface((4, 4))
+
+    rsai = RSAImage(None, image_factory=image_factory)
+    calls.clear()
+    return rsai, calls
+
+
+def test_one_image_per_push():
+    rsai, calls = counting_rsai()
+    values = SimpleNamespace(v=10), SimpleNamespace(v=0.5), SimpleNamespace(v=128)
+    particle = Particle(rotate=values[0], scale=values[1], alpha=values[2])
+
+    particle_rsai_system(0, 'p', particle, rsai)
+    assert calls == [(10, 0.5, 128)]
+
+    # Nothing changed, nothing regenerated
+    particle_rsai_system(0, 'p', particle, rsai)
+    assert len(calls) == 1
+
+    for value, v in zip(values, (20, 0.75, 64)):
+        value.v = v
+    particle_rsai_system(0, 'p', particle, rsai)
+    assert calls[1:] == [(20, 0.75, 64)]
+
+
+def test_quantized_push():
+    rsai, calls = counting_rsai()
+    alpha = SimpleNamespace(v=128)
+    particle = Particle(alpha=alpha)
+    quantize = RSAQuantizer(alpha=4)
+
+    particle_rsai_system(0, 'p', particle, rsai, quantize=quantize)
+    alpha.v = 129
+    particle_rsai_system(0, 'p', particle, rsai, quantize=quantize)
+    alpha.v = 133
+    particle_rsai_system(0, 'p', particle, rsai, quantize=quantize)
+
+    assert len(calls) == 2
+    assert (quantize.pushed, quantize.skipped) == (2, 1)
@@ -0,0 +1,50 @@
+import pygame
+import tinyecs as ecs
+
+from pygame import Vector2
+
+from swirlyswirls.pool import ParticlePool
+from swirlyswirls.simulation import Simulation
+
+
+def build(t, position, momentum):
+    sprite = pygame.sprite.Sprite()
+    sprite.rect = pygame.FRect(0, 0, 2, 2)
+    return {'sprite': sprite, 'position': Vector2(position)}
+
+
+def test_interpolation():
+    ecs.reset()
+    sim = Simulation(rate=10)
+    pool = ParticlePool(build, simulation=sim)
+    eid = pool(t=0, position=Vector2(0, 0), momentum=None)
+
+    def move(dt, eid, position):
+        position.x += 100 * dt
+
+    sim.add_system(move, 'position')
+    assert sim.update(0.15) == 1
+    ecs.run_system(0, sim.sprite_system, 'sprite', 'position')
+    assert ecs.comp_of_eid(eid, 'sprite').rect.center == (5, 0)
+
+    ecs.reset()
+
+
+def test_respawn_is_not_interpolated():
+    ecs.reset()
+    sim = Simulation(rate=10)
+    pool = ParticlePool(build, simulation=sim)
+    eid = pool(t=0, position=Vector2(100, 0), momentum=None)
+
+    def respawn(dt, eid, position):
+        ecs.remove_entity(eid)
+        pool(t=0, position=Vector2(0, 0), momentum=None)
+
+    sim.add_system(respawn, 'position')
+    sim.update(0.15)
+    assert pool.reused == 1 and ecs.has(eid)
+
+    ecs.run_system(0, sim.sprite_system, 'sprite', 'position')
+    assert ecs.comp_of_eid(eid, 'sprite').rect.center == (0, 0)
+
+    ecs.reset()
@@ -0,0 +1,99 @@
+import random
+
+import pytest
+import tinyecs as ecs
+
+from pgcooldown import Cooldown, LerpThing
+from pygame import Vector2
+
+from swirlyswirls.compsys import Emitter, Particle, age_particle
+from swirlyswirls.family import Family
+from swirlyswirls.snapshot import Snapshot
+from swirlyswirls.zones import Halton, ZoneCircle
+
+
+def factory(t, position, momentum):
+    e = ecs.create_entity()
+    ecs.add_component(e, 'position', Vector2(position))
+    ecs.add_component(e, 'momentum', Vector2(momentum))
+    ecs.add_component(e, 'lifetime', Cooldown(10))
+    ecs.add_component(e, 'particle', Particle(alpha=LerpThing(255, 0, 10)))
+    return e
+
+
+def build():
+    emitter = Emitter(ept=LerpThing(5, 5, 20), ticklist=[0.1, 0.2, 0.3], total_emits=100,
+                      zone=ZoneCircle(r1=30, rnd_p=Halton(dims=2)),
+                      particle_factory=factory, family=Family())
+    eid = ecs.create_entity()
+    ecs.add_component(eid, 'emitter', emitter)
+    ecs.add_component(eid, 'position', Vector2(100, 100))
+    return eid, emitter
+
+
+def ages(eid, emitter):
+    return sorted(10 - ecs.comp_of_eid(p, 'lifetime').remaining for p in emitter.family.of(eid))
+
+
+@pytest.fixture
+def snapshot():
+    ecs.reset()
+
+    eid, emitter = build()
+    for age, x in ((2, 10), (4, 20), (6, 30)):
+        p = factory(0, Vector2(x, 0), Vector2(0, x))
+        age_particle(p, age)
+        emitter.family.adopt(eid, p)
+
+    emitter.next_tick()
+    emitter.next_tick()
+    emitter.remaining = 42
+    emitter.zone.rnd_p()
+    ecs.comp_of_eid(eid, 'position').update(5, 6)
+
+    yield Snapshot.take({'fountain': eid})
+
+    ecs.reset()
+
+
+def test_save_load(snapshot, tmp_path):
+    path = tmp_path / 'test.swirls'
+    snapshot.save(path)
+
+    with Snapshot.load(path) as loaded:
+        assert loaded.names == ['fountain']
+        assert len(loaded) == len(snapshot) == 3
+        assert loaded.columns.keys() == snapshot.columns.keys()
+        for name, column in snapshot.columns.items():
+            assert loaded.columns[name].tobytes() == column.tobytes(), name
+
+    assert loaded.columns == {}
+
+
+def test_restore(snapshot):
+    state = random.getstate()
+    expected = random.random()
+    random.setstate(state)
+    random.random()
+
+    ecs.reset()
+    eid, emitter = build()
+    snapshot.restore({'fountain': eid, 'unknown': eid})
+
+    assert ecs.comp_of_eid(eid, 'position') == (5, 6)
+    assert emitter.phase == 2 and emitter.next_tick() == 0.3
+    assert emitter.remaining == 42
+    assert (emitter.zone.rnd_p.index, emitter.zone.rnd_p.dim) == (1, 1)
+    assert random.random() == expected
+
+    assert emitter.family.count(eid) == 3
+    assert ages(eid, emitter) == pytest.approx([2, 4, 6], abs=0.1)
+    positions = sorted(ecs.comp_of_eid(p, 'position').x for p in emitter.family.of(eid))
+    assert positions == [10, 20, 30]
+
+
+def test_not_a_snapshot(tmp_path):
+    path = tmp_path / 'junk.swirls'
+    path.write_bytes(b'\0' * 1024)
+    with pytest.raises(ValueError):
+        Snapshot.load(path)
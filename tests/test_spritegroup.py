@@ -0,0 +1,41 @@
+import pygame
+
+from swirlyswirls.spritegroup import InstancedGroup
+
+
+def sprite(color, center):
+    s = pygame.sprite.Sprite()
+    s.image = pygame.Surface((2, 2))
+    s.image.fill(color)
+    s.rect = s.image.get_rect(center=center)
+    return s
+
+
+def test_instanced_draw():
+    group = InstancedGroup(sprite('red', (0, 0)), anchors=[((10, 10), 0), ((20, 10), 0), ((500, 500), 0)])
+    surface = pygame.Surface((32, 32))
+
+    dirty = group.draw(surface)
+    assert sorted(tuple(r) for r in dirty) == [(9, 9, 2, 2), (19, 9, 2, 2)]
+    assert surface.get_at((10, 10)) == pygame.Color('red')
+    assert surface.get_at((20, 10)) == pygame.Color('red')
+
+
+def test_instanced_draw_flags():
+    group = InstancedGroup(sprite((100, 0, 0), (0, 0)), anchors=[((10, 10), 0)])
+    surface = pygame.Surface((32, 32))
+    surface.fill((50, 0, 0))
+
+    group.draw(surface, special_flags=pygame.BLEND_ADD)
+    assert surface.get_at((10, 10)) == pygame.Color(150, 0, 0)
+
+
+def test_instanced_delay():
+    s = sprite('red', (0, 0))
+    group = InstancedGroup(s, anchors=[((10, 10), 0), ((10, 20), 1)])
+    surface = pygame.Surface((32, 32))
+    group.draw(surface)
+
+    s.rect.move_ip(4, 0)
+    dirty = group.draw(surface)
+    assert sorted(tuple(r) for r in dirty) == [(9, 19, 2, 2), (13, 9, 2, 2)]
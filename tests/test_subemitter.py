@@ -0,0 +1,115 @@
+import time
+
+import pytest
+import tinyecs as ecs
+
+from pgcooldown import LerpThing
+from pygame import Vector2
+
+from swirlyswirls.compsys import Emitter
+from swirlyswirls.pool import ParticlePool
+from swirlyswirls.subemitter import SubEmitter, sub_emitter_system
+from swirlyswirls.zones import ZonePoint
+
+
+def emitter():
+    return Emitter(ept=LerpThing(1, 1, 1), zone=ZonePoint(), particle_factory=lambda **kw: None)
+
+
+def particle(sub, position=(10, 20), momentum=(4, 0)):
+    eid = ecs.create_entity()
+    ecs.add_component(eid, 'position', Vector2(position))
+    ecs.add_component(eid, 'momentum', Vector2(momentum))
+    sub.attach(eid)
+    return eid
+
+
+def run():
+    ecs.run_system(0, sub_emitter_system, 'sub-emitter', 'position')
+
+
+def emitters():
+    return [eid for eid, _ in ecs.eids_by_cids('emitter')]
+
+
+@pytest.fixture(autouse=True)
+def registry():
+    ecs.reset()
+    yield
+    ecs.reset()
+
+
+def test_death():
+    sub = SubEmitter(emitter, trigger='death', momentum_factor=0.5)
+    eid = particle(sub)
+    run()
+    assert sub.launched == 0
+
+    ecs.remove_entity(eid)
+    assert sub.launched == 1
+    e, = emitters()
+    assert ecs.comp_of_eid(e, 'position') == (10, 20)
+    assert ecs.comp_of_eid(e, 'momentum') == (2, 0)
+
+
+def test_death_before_first_run():
+    # Without a known position, there is nowhere to launch from
+    sub = SubEmitter(emitter, trigger='death')
+    ecs.remove_entity(particle(sub))
+    assert sub.launched == 0
+
+
+def test_spawn():
+    sub = SubEmitter(emitter, trigger='spawn')
+    eid = particle(sub)
+    run()
+    run()
+    assert sub.launched == 1
+
+    # No momentum_factor, the emitter stands still
+    e, = emitters()
+    assert ecs.comp_of_eid(e, 'momentum') == (0, 0)
+
+    ecs.remove_entity(eid)
+    assert sub.launched == 1
+
+
+def test_interval():
+    sub = SubEmitter(emitter, trigger='interval', interval=0.05)
+    particle(sub)
+    run()
+    run()
+    assert sub.launched == 0
+
+    time.sleep(0.06)
+    run()
+    run()
+    assert sub.launched == 1
+
+
+def test_cascade_reuses_pools():
+    sub = SubEmitter(emitter, trigger='death', lifetime=None, momentum_factor=1)
+    triggers = []
+
+    def build(t, position, momentum):
+        triggers.append(sub.new_trigger())
+        return {
+            'position': Vector2(position),
+            'momentum': Vector2(momentum),
+            'sub-emitter': triggers[-1],
+        }
+
+    particles = ParticlePool(build)
+    for i in range(3):
+        eid = particles(t=0, position=(i, 0), momentum=(0, i))
+        run()
+        ecs.remove_entity(eid)
+
+        e, = emitters()
+        assert ecs.comp_of_eid(e, 'position') == (i, 0)
+        assert ecs.comp_of_eid(e, 'momentum') == (0, i)
+        ecs.remove_entity(e)
+
+    assert len(triggers) == 1
+    assert (particles.built, particles.reused) == (1, 2)
+    assert (sub.pool.built, sub.pool.reused, sub.launched) == (1, 2, 3)
@@ -0,0 +1,208 @@
+import pygame
+import pytest
+
+from math import hypot
+from pygame import Rect, Vector2
+
+from swirlyswirls.zones import (Halton, ZoneCircle, ZoneComposite, ZoneMask, ZonePath, ZonePoint,
+                                ZoneRect, ZoneTemplate, _radical_inverse)
+
+
+def test_radical_inverse():
+    assert [_radical_inverse(i, 2) for i in range(1, 5)] == [0.5, 0.25, 0.75, 0.125]
+    assert [_radical_inverse(i, 3) for i in range(1, 4)] == pytest.approx([1 / 3, 2 / 3, 1 / 9])
+
+
+def test_halton_sequence():
+    halton = Halton(dims=2, rotate=False)
+    points = [(halton(), halton()) for _ in range(3)]
+    assert points == pytest.approx([(0.5, 1 / 3), (0.25, 2 / 3), (0.75, 1 / 9)])
+    assert halton.index == 4 and halton.dim == 0
+
+    halton.reset(rotate=False)
+    assert (halton(), halton()) == pytest.approx((0.5, 1 / 3))
+
+
+def test_halton_rotation_stays_in_unit_interval():
+    halton = Halton(dims=3)
+    assert all(0 <= o < 1 for o in halton.offsets)
+    assert all(0 <= halton() < 1 for _ in range(300))
+
+
+def test_halton_fills_evenly():
+    # Every cell of a 4x3 grid gets exactly one of the first 12 points
+    halton = Halton(dims=2, rotate=False, skip=0)
+    cells = {(int(halton() * 4), int(halton() * 3)) for _ in range(12)}
+    assert len(cells) == 12
+
+
+def test_halton_dims():
+    with pytest.raises(ValueError):
+        Halton(dims=0)
+
+
+def test_emit_many():
+    zone = ZoneRect(r=Rect(0, 0, 10, 20), rnd_p=Halton(dims=2))
+    batch = zone.emit_many(50)
+    assert len(batch) == 50
+    assert all(-5 <= p.x <= 5 and -10 <= p.y <= 10 for p, m in batch)
+
+    assert ZoneCircle(r1=5).emit_many(0) == []
+
+
+def test_template_slices_pool():
+    zone = ZoneTemplate(zone=ZoneRect(r=Rect(0, 0, 10, 20)), size=8,
+                        rotate=False, mirror=False, rnd=lambda: 0.5)
+    assert len(zone.pool) == 8
+
+    # A batch larger than the rest of the pool wraps around to its start
+    batch = zone.emit_many(6)
+    expected = zone.pool[4:] + zone.pool[:2]
+    assert [(p.x, p.y, m.x, m.y) for p, m in batch] == expected
+
+    assert len(zone.emit_many(20)) == 20
+    assert zone.area() == 200
+
+
+def test_template_rotate_and_mirror():
+    zone = ZoneTemplate(zone=ZoneCircle(r0=10, r1=10), size=16)
+    for p, m in zone.emit_many(16):
+        assert p.length() == pytest.approx(10)
+
+    # 90 degrees rotation, then mirrored on the x axis
+    zone = ZoneTemplate(zone=ZoneRect(r=Rect(0, 0, 10, 20)), size=1, rnd=lambda: 0.25)
+    x, y, dx, dy = zone.pool[0]
+    p, m = zone.emit()
+    assert tuple(p) == pytest.approx((y, x))
+    assert tuple(m) == pytest.approx((dy, dx))
+
+    assert zone.bounds().w == pytest.approx(2 * Vector2(5, 10).length())
+
+
+def test_mask_points():
+    mask = pygame.Mask((8, 6))
+    mask.draw(pygame.Mask((4, 4), fill=True), (2, 1))
+
+    zone = ZoneMask(mask=mask)
+    assert zone.area() == 16
+    assert min(zone.points) == (-2, -2) and max(zone.points) == (1, 1)
+    assert tuple(zone.bounds()) == (-2, -2, 4, 4)
+
+    # The 2x2 core of the square is not part of the outline
+    zone = ZoneMask(mask=mask, edge=True)
+    assert zone.area() == 12
+    assert (-1, -1) not in zone.points
+
+    zone = ZoneMask(mask=mask, jitter=False, rnd_p=lambda: 0)
+    p, m = zone.emit()
+    assert p == m == (-2, -2) and p is not m
+
+    with pytest.raises(ValueError):
+        ZoneMask(mask=pygame.Mask((8, 6)))
+
+
+def test_mask_from_surface():
+    surface = pygame.Surface((4, 4), pygame.SRCALPHA)
+    surface.fill((255, 255, 255, 255), (0, 0, 4, 2))
+    surface.fill((255, 255, 255, 100), (0, 2, 4, 2))
+
+    zone = ZoneMask(mask=surface)
+    assert zone.area() == 8
+    for p, m in zone.emit_many(20):
+        assert -2 <= p.x < 2 and -2 <= p.y < 0
+
+
+def test_composite_weights():
+    zone = ZoneComposite(zones=[ZoneRect(r=Rect(0, 0, 10, 10)), ZoneRect(r=Rect(0, 0, 10, 30))])
+    assert zone.weights == pytest.approx([0.25, 0.75])
+
+    zone = ZoneComposite(zones=[ZonePoint(), ZoneRect(r=Rect(0, 0, 10, 30))])
+    assert zone.weights == pytest.approx([0.5, 0.5])
+
+    with pytest.raises(ValueError):
+        ZoneComposite(zones=[ZonePoint()], weights=[1, 2])
+    with pytest.raises(ValueError):
+        ZoneComposite(zones=[])
+
+
+def test_composite_alias_table():
+    weights = [1, 2, 3, 4, 0, 10]
+    zone = ZoneComposite(zones=[ZonePoint() for _ in weights], weights=weights)
+
+    # Every bucket is shared between its own child and its alias
+    n = len(weights)
+    shares = [0] * n
+    for i, (p, a) in enumerate(zip(zone._prob, zone._alias)):
+        shares[i] += p / n
+        shares[a] += (1 - p) / n
+    assert shares == pytest.approx(zone.weights)
+
+    # Stepping through the unit interval reproduces the weights
+    steps = 2000
+    counts = [0] * n
+    for k in range(steps):
+        zone.rnd = lambda: (k + 0.5) / steps
+        counts[zone.pick()] += 1
+    assert [c / steps for c in counts] == pytest.approx(zone.weights, abs=1 / steps)
+
+
+def test_composite_placement():
+    circle = ZoneCircle(r0=10, r1=10, phi0=0, phi1=0)
+    zone = ZoneComposite(zones=[circle, ZonePoint()], weights=[1, 0],
+                         offsets=[(5, 0), (0, 0)], rotations=[90, 0])
+    for p, m in zone.emit_many(3) + [zone.emit()]:
+        assert tuple(p) == pytest.approx((5, 10))
+        assert tuple(m) == pytest.approx((0, 10))
+        assert p is not m
+
+    assert tuple(zone.bounds()) == pytest.approx((-5, -10, 20, 20))
+    assert zone.area() is None
+
+
+def test_path_lengths():
+    # Degenerated segments are dropped
+    zone = ZonePath(points=[(0, 0), (30, 0), (30, 0), (30, 10)])
+    assert zone.vertices == [(0, 0), (30, 0), (30, 10)]
+    assert zone.lengths == [0, 30, 40]
+    assert zone.tangents == [(1, 0), (0, 1)]
+    assert zone.length == 40
+    assert zone.area() is None
+
+
+def test_path_arc_length():
+    # Evenly spread along the length, not per segment
+    zone = ZonePath(points=[(0, 0), (30, 0), (30, 10)], speed=2)
+    steps = iter([0.25, 0.5, 0.875, 0.5])
+    zone.rnd_p = lambda: next(steps)
+    (p0, m0), (p1, m1) = zone.emit_many(2)
+    assert tuple(p0) == pytest.approx((10, 0)) and tuple(m0) == pytest.approx((2, 0))
+    assert tuple(p1) == pytest.approx((30, 5)) and tuple(m1) == pytest.approx((0, 2))
+
+    # Only the second half of the path at t=1
+    zone = ZonePath(points=[(0, 0), (30, 0), (30, 10)], end_t1=1, start_t1=0.5,
+                    rnd_p=lambda: 0, width=4)
+    assert tuple(zone.emit(0)[0]) == pytest.approx((0, -2))
+    assert tuple(zone.emit(1)[0]) == pytest.approx((20, -2))
+    assert zone.area() == 160
+
+
+def test_path_curves():
+    points = [(0, 0), (10, 20), (30, 20), (40, 0)]
+    zone = ZonePath(points=points, curve='bezier', resolution=8)
+    assert len(zone.vertices) == 9
+    assert zone.vertices[0] == (0, 0) and zone.vertices[-1] == pytest.approx((40, 0))
+    assert zone.vertices[4] == pytest.approx((20, 15))
+
+    zone = ZonePath(points=points, curve='catmull-rom', resolution=4)
+    assert len(zone.vertices) == 13
+    for p in points:
+        assert min(hypot(p[0] - x, p[1] - y) for x, y in zone.vertices) == pytest.approx(0)
+
+    with pytest.raises(ValueError):
+        ZonePath(points=points[:3], curve='bezier')
+    with pytest.raises(ValueError):
+        ZonePath(points=points, curve='spline')
+    with pytest.raises(ValueError):
+        ZonePath(points=[(0, 0)])
+    with pytest.raises(ValueError):
+        ZonePath(points=[(5, 5), (5, 5)])